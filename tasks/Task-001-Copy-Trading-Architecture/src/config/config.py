@@ -66,6 +66,8 @@ class SystemConfig:
         max_position_size_pct: Maximum position size as % of capital
         enable_copy_trading: Global enable/disable flag
         log_level: Logging level (DEBUG/INFO/WARNING/ERROR/CRITICAL)
+        enable_connection_pooling: Share one WebSocket pool across leader streams
+        max_ws_connections: Maximum streams in the WebSocket pool
     """
     environment: Environment = Environment.PRODUCTION
     base_url: str = "https://api.dhan.co"
@@ -83,6 +85,8 @@ class SystemConfig:
     max_position_size_pct: float = 10.0
     enable_copy_trading: bool = True
     log_level: str = "INFO"
+    enable_connection_pooling: bool = False
+    max_ws_connections: int = 3
 
 
 class ConfigLoader:
@@ -106,6 +110,8 @@ class ConfigLoader:
         ENABLE_COPY_TRADING: true/false (default: true)
         SQLITE_PATH: Database file path (default: ./copy_trading.db)
         LOG_LEVEL: DEBUG/INFO/WARNING/ERROR/CRITICAL (default: INFO)
+        ENABLE_CONNECTION_POOLING: true/false (default: false)
+        MAX_WS_CONNECTIONS: Maximum pooled WebSocket streams (default: 3)
     """
     
     @staticmethod
@@ -169,6 +175,10 @@ class ConfigLoader:
         sqlite_path = os.getenv("SQLITE_PATH", "./copy_trading.db")
         log_level = os.getenv("LOG_LEVEL", "INFO").upper()
         
+        pooling_str = os.getenv("ENABLE_CONNECTION_POOLING", "false").lower()
+        enable_connection_pooling = pooling_str in ("true", "1", "yes", "on")
+        max_ws_connections = int(os.getenv("MAX_WS_CONNECTIONS", "3"))
+        
         return SystemConfig(
             environment=environment,
             base_url=base_url,
@@ -178,7 +188,9 @@ class ConfigLoader:
             copy_ratio=copy_ratio,
             max_position_size_pct=max_position_size_pct,
             enable_copy_trading=enable_copy_trading,
-            log_level=log_level
+            log_level=log_level,
+            enable_connection_pooling=enable_connection_pooling,
+            max_ws_connections=max_ws_connections
         )
     
     @classmethod
@@ -7,11 +7,11 @@ SQLite database operations with WAL mode, prepared statements, and connection po
 import sqlite3
 import logging
 import time
-import json
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
 from ..config import get_config
+from ..utils import fast_json
 from .models import Order, OrderEvent, Trade, Position, Funds, Instrument, CopyMapping
 
 logger = logging.getLogger(__name__)
@@ -560,8 +560,8 @@ class DatabaseManager:
             error_message: Error message if applicable
             duration_ms: Request duration in milliseconds
         """
-        request_json = json.dumps(request_data) if request_data else None
-        response_json = json.dumps(response_data) if response_data else None
+        request_json = fast_json.dumps(request_data) if request_data else None
+        response_json = fast_json.dumps(response_data) if response_data else None
         
         self.conn.execute("""
             INSERT INTO audit_log (
@@ -591,8 +591,9 @@ class DatabaseManager:
         cursor = self.conn.execute(
             "SELECT value FROM config WHERE key = ?", (key,)
         )
+        cursor.row_factory = None  # Single column: a plain tuple is all we need
         row = cursor.fetchone()
-        return row['value'] if row else None
+        return row[0] if row else None
     
     def set_config_value(self, key: str, value: str, description: Optional[str] = None) -> None:
         """
@@ -104,7 +104,8 @@ class CopyTradingOrchestrator:
             logger.info("Initializing WebSocket manager...")
             self.ws_manager = initialize_ws_manager(
                 on_order_update=self._handle_order_update,
-                leader_client=self.auth_manager.leader_client  # ✅ ADDED: For fetching missed orders
+                leader_client=self.auth_manager.leader_client,  # ✅ ADDED: For fetching missed orders
+                leader_config=self.leader_config
             )
             logger.info("WebSocket manager initialized")
             
@@ -6,7 +6,6 @@ Handle order placement, validation, tracking, and replication logic.
 
 import logging
 import time
-import json
 import threading
 from collections import deque
 from typing import Optional, Dict, Any
@@ -15,6 +14,7 @@ from dhanhq import dhanhq
 from ..config import get_config
 from ..database import DatabaseManager, get_db, Order, OrderEvent, CopyMapping
 from ..position_sizing import PositionSizer, get_position_sizer
+from ..utils import fast_json
 
 logger = logging.getLogger(__name__)
 
@@ -447,7 +447,7 @@ class OrderManager:
                     disclosed_qty=disclosed_qty,  # ✅ FIXED: Use parameter instead of None
                     created_at=int(time.time()),
                     updated_at=int(time.time()),
-                    raw_response=json.dumps(response)
+                    raw_response=fast_json.dumps(response)
                 )
                 self.db.save_order(follower_order)
                 
@@ -455,7 +455,7 @@ class OrderManager:
                 event = OrderEvent(
                     order_id=str(order_id),
                     event_type='PLACED',
-                    event_data=json.dumps(response),
+                    event_data=fast_json.dumps(response),
                     event_ts=int(time.time()),
                     sequence=1
                 )
@@ -516,7 +516,7 @@ class OrderManager:
             disclosed_qty=order_data.get('disclosedQuantity'),
             created_at=int(time.time()),
             updated_at=int(time.time()),
-            raw_response=json.dumps(order_data)
+            raw_response=fast_json.dumps(order_data)
         )
     
     def _create_copy_mapping(
@@ -829,7 +829,7 @@ class OrderManager:
             event = OrderEvent(
                 order_id=order_id,
                 event_type=order_status,
-                event_data=json.dumps(execution_data),
+                event_data=fast_json.dumps(execution_data),
                 event_ts=int(time.time())
             )
             self.db.save_order_event(event)
@@ -925,7 +925,7 @@ class OrderManager:
         event = OrderEvent(
             order_id=order_id,
             event_type=status,
-            event_data=json.dumps({'account_type': account_type}),
+            event_data=fast_json.dumps({'account_type': account_type}),
             event_ts=int(time.time())
         )
         self.db.save_order_event(event)
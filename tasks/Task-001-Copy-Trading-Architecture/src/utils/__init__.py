@@ -1,9 +1,11 @@
 """Utility modules."""
 
 from .logger import setup_logging
+from . import fast_json
 
 __all__ = [
-    'setup_logging'
+    'setup_logging',
+    'fast_json'
 ]
 
 
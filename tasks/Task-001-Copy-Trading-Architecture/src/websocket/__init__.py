@@ -2,14 +2,18 @@
 
 from .ws_manager import (
     OrderStreamManager,
+    WSConnectionPool,
     initialize_ws_manager,
-    get_ws_manager
+    get_ws_manager,
+    get_ws_pool
 )
 
 __all__ = [
     'OrderStreamManager',
+    'WSConnectionPool',
     'initialize_ws_manager',
-    'get_ws_manager'
+    'get_ws_manager',
+    'get_ws_pool'
 ]
 
 
@@ -4,16 +4,89 @@ WebSocket Manager Module
 Manage real-time order update stream from leader account via DhanHQ WebSocket.
 """
 
+import asyncio
+import concurrent.futures
+import functools
 import logging
+import queue
+import random
+import sys
 import time
 import threading
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Dict
 from dhanhq import orderupdate
 
 from ..config import get_config
+from ..database import get_db
+from ..utils import fast_json
 
 logger = logging.getLogger(__name__)
 
+# ✅ Leader order statuses forwarded to the replication callback
+_FORWARDED_STATUSES = frozenset({
+    'PENDING', 'OPEN', 'TRANSIT',  # New orders
+    'MODIFIED',                    # Modifications
+    'CANCELLED',                   # Cancellations
+    'TRADED', 'EXECUTED',          # Executions
+    'REJECTED',                    # Rejections
+    'PARTIALLY_FILLED',            # Partial fills
+})
+
+# The SDK socket has no handshake callback: a connection that stays up this long
+# got past the handshake and login (those fail fast) and counts as connected
+_CONNECT_SETTLE = 2.0  # seconds
+_CONNECT_TIMEOUT = 10.0  # seconds connect() waits for that verdict
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ts(value: str) -> int:
+    """Parse an epoch timestamp string, 0 if it isn't one (cached: order lists repeat values)."""
+    return int(value) if value.isdigit() else 0
+
+
+def _order_ts(create_time: Any) -> int:
+    """
+    Get an order's createTime as epoch seconds without per-order try/except.
+    
+    Args:
+        create_time: createTime value from the order list
+    
+    Returns:
+        Epoch timestamp, or 0 if it can't be determined
+    """
+    if type(create_time) is int:
+        return create_time
+    if type(create_time) is str:
+        return _parse_ts(create_time)
+    if type(create_time) is float:
+        return int(create_time)
+    return 0
+
+
+# ✅ Single background event loop shared by every order stream in the process
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_loop_lock = threading.Lock()
+
+
+def _get_shared_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the shared WebSocket event loop, starting its daemon thread on first use.
+    
+    Returns:
+        Running asyncio event loop
+    """
+    global _shared_loop
+    
+    with _shared_loop_lock:
+        if _shared_loop is None:
+            _shared_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_shared_loop.run_forever,
+                name="ws-event-loop",
+                daemon=True
+            ).start()
+    
+    return _shared_loop
+
 
 class OrderStreamManager:
     """
@@ -24,6 +97,7 @@ class OrderStreamManager:
     - Automatic reconnection with backoff
     - Event callback handling
     - Connection health monitoring
+    - Socket I/O on a shared asyncio loop, callbacks dispatched off-loop in order
     """
     
     def __init__(
@@ -47,18 +121,38 @@ class OrderStreamManager:
         self.on_order_update = on_order_update
         self.leader_client = leader_client  # ✅ ADDED
         
+        # Status -> handler dispatch table; statuses without a handler are ignored
+        self._handlers: Dict[str, Callable] = {
+            status: self.on_order_update for status in _FORWARDED_STATUSES
+        }
+        
         self.ws_client: Optional[orderupdate.OrderSocket] = None
         self.is_connected = False
         self.is_running = False
         
+        # ✅ Socket runs on the shared loop; updates are queued to a dispatch worker
+        self._loop = _get_shared_loop()
+        self._ws_future: Optional[concurrent.futures.Future] = None
+        self._update_queue: Optional[asyncio.Queue] = None
+        
         self._reconnect_attempts = 0
         self._max_reconnect_attempts = 10
         self._reconnect_delay = 1.0  # Initial delay in seconds
         self._max_reconnect_delay = 60.0
+        self._reconnect_jitter = 0.3  # Up to +30% random spread to avoid reconnect storms
+        self._last_reconnect_at = 0.0  # When the last reconnect succeeded
+        self._last_reconnect_delay = 0.0  # Backoff delay used for that reconnect
+        self._last_reconnect_step = -1  # Schedule index used for that reconnect
+        
+        # Backoff schedule (before jitter); swap this tuple to change the policy
+        self._delays = tuple(
+            min(self._reconnect_delay * (1 << i), self._max_reconnect_delay)
+            for i in range(self._max_reconnect_attempts)
+        )
         self._was_disconnected = False  # ✅ ADDED: Track if we were disconnected
         
         # ✅ TASK-006: Heartbeat/ping-pong for connection health
-        self._last_heartbeat = 0
+        self._last_heartbeat = 0.0  # time.monotonic() of last message
         self._heartbeat_interval = 30  # seconds
         self._heartbeat_timeout = 60  # seconds
         
@@ -74,23 +168,41 @@ class OrderStreamManager:
         try:
             logger.info("Connecting to DhanHQ order WebSocket")
             
+            # Drop a stale socket (e.g. one flagged dead by the ping loop) before replacing it
+            stale_future, self._ws_future = self._ws_future, None
+            if stale_future and not stale_future.done():
+                stale_future.cancel()
+            
             # Initialize WebSocket client
             self.ws_client = orderupdate.OrderSocket(
                 self.leader_client_id,
                 self.leader_access_token
             )
             
-            # Set callback
-            self.ws_client.on_order_update = self._handle_order_update
+            # Set callback (runs on the shared loop, so it only enqueues)
+            self.ws_client.on_order_update = self._enqueue_order_update
             
-            # Connect (synchronous)
-            self.ws_client.connect_to_dhan_websocket_sync()
+            # Run the socket on the shared event loop instead of blocking this thread,
+            # and wait for it to report whether the connection came up
+            ready: concurrent.futures.Future = concurrent.futures.Future()
+            self._ws_future = asyncio.run_coroutine_threadsafe(
+                self._run_socket(self.ws_client, ready),
+                self._loop
+            )
+            self._ws_future.add_done_callback(self._on_socket_closed)
+            
+            try:
+                connected = ready.result(timeout=_CONNECT_TIMEOUT)
+            except concurrent.futures.TimeoutError:
+                connected = False
+            if not connected:
+                self._ws_future.cancel()
+                raise ConnectionError("WebSocket closed before the connection was established")
             
-            self.is_connected = True
             self._reconnect_attempts = 0
             
             # ✅ TASK-006: Initialize heartbeat timestamp
-            self._last_heartbeat = time.time()
+            self._last_heartbeat = time.monotonic()
             
             logger.info("WebSocket connected successfully")
             
@@ -98,7 +210,8 @@ class OrderStreamManager:
             if self._was_disconnected and self.leader_client:
                 logger.info("Reconnected after disconnect, fetching missed orders...")
                 try:
-                    self._fetch_missed_orders()
+                    # Replay runs on the shared loop so the reconnect path isn't blocked
+                    asyncio.run_coroutine_threadsafe(self._fetch_missed_orders(), self._loop)
                 except Exception as e:
                     logger.error(f"Error fetching missed orders: {e}", exc_info=True)
             
@@ -120,6 +233,9 @@ class OrderStreamManager:
         
         self.is_running = False
         
+        if self._ws_future:
+            self._ws_future.cancel()
+        
         if self.ws_client:
             try:
                 self.ws_client.disconnect()
@@ -145,42 +261,160 @@ class OrderStreamManager:
         
         logger.info("WebSocket event loop started")
     
+    async def _run_socket(self, ws_client: Any, ready: concurrent.futures.Future) -> None:
+        """
+        Run the order socket and its dispatch worker on the shared loop.
+        
+        Args:
+            ws_client: Order socket to run
+            ready: Resolved True once the socket has stayed up for _CONNECT_SETTLE
+                seconds (is_connected is set first), or False if it ended sooner
+        """
+        queue = self._update_queue = asyncio.Queue()
+        worker = asyncio.ensure_future(self._dispatch_updates(queue))
+        ping_task = asyncio.ensure_future(self._ping_loop(ws_client))
+        socket_task = asyncio.ensure_future(ws_client.connect_order_update())
+        try:
+            await asyncio.wait({socket_task}, timeout=_CONNECT_SETTLE)
+            if not socket_task.done():
+                # Set on the loop thread, so a later close always lands after it
+                self.is_connected = True
+                ready.set_result(True)
+            await socket_task
+        finally:
+            if not ready.done():
+                ready.set_result(False)
+            socket_task.cancel()
+            ping_task.cancel()
+            # Let the worker drain what was already received, then stop
+            queue.put_nowait(None)
+            await asyncio.shield(worker)
+    
+    async def _ping_loop(self, ws_client: Any) -> None:
+        """
+        ✅ TASK-006: Probe the connection every heartbeat interval.
+        
+        Pings fire on a fixed cadence; each pong is awaited in its own task so a
+        slow pong never delays the next ping.
+        
+        Args:
+            ws_client: Order socket being monitored
+        """
+        send_ping = getattr(ws_client, 'send_ping', None)
+        
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+            
+            if send_ping is not None:
+                try:
+                    pong_waiter = send_ping()
+                    if asyncio.iscoroutine(pong_waiter):
+                        pong_waiter = await pong_waiter
+                except Exception as e:
+                    logger.warning(f"WebSocket ping failed: {e}")
+                    self.is_connected = False
+                    return
+                if pong_waiter is not None:
+                    asyncio.ensure_future(self._await_pong(ws_client, pong_waiter))
+            elif time.monotonic() - self._last_heartbeat > self._heartbeat_timeout:
+                # SDK socket exposes no ping; fall back to the silence check
+                logger.warning("Heartbeat timeout detected by ping loop")
+                self.is_connected = False
+                return
+    
+    async def _await_pong(self, ws_client: Any, pong_waiter: Any) -> None:
+        """
+        Mark the connection dead if a pong doesn't arrive within the heartbeat timeout.
+        
+        Args:
+            ws_client: Order socket that was pinged
+            pong_waiter: Awaitable resolved when the pong arrives
+        """
+        try:
+            await asyncio.wait_for(pong_waiter, self._heartbeat_timeout)
+            self._last_heartbeat = time.monotonic()
+        except asyncio.TimeoutError:
+            if ws_client is not self.ws_client:
+                return  # Socket was already replaced
+            logger.warning(f"No pong within {self._heartbeat_timeout}s, marking WebSocket disconnected")
+            self.is_connected = False
+    
+    def _enqueue_order_update(self, message: dict) -> None:
+        """
+        Queue an order update received on the shared loop.
+        
+        Args:
+            message: Order update message from WebSocket
+        """
+        self._update_queue.put_nowait(message)
+    
+    async def _dispatch_updates(self, queue: asyncio.Queue) -> None:
+        """
+        Forward queued updates in arrival order without blocking the socket.
+        
+        Args:
+            queue: Queue of order update messages (None stops the worker)
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            message = await queue.get()
+            if message is None:
+                return
+            
+            # Callbacks hit the DB and REST API; keep them off the loop so pings aren't starved
+            await loop.run_in_executor(None, self._handle_order_update, message)
+    
+    def _on_socket_closed(self, future: concurrent.futures.Future) -> None:
+        """
+        Mark the stream disconnected when the socket coroutine ends.
+        
+        Args:
+            future: Future of the socket coroutine
+        """
+        if future is not self._ws_future:
+            return  # A replaced socket closing must not flag the new connection
+        
+        if not future.cancelled() and future.exception():
+            logger.error("WebSocket stream stopped", extra={
+                "error": str(future.exception())
+            })
+        
+        self.is_connected = False
+        self._was_disconnected = True
+    
     def _handle_order_update(self, message: dict) -> None:
         """
         Handle incoming order update.
         
         Args:
-            message: Order update message from WebSocket
+            message: Order update message from WebSocket (dict, or raw JSON text/bytes)
         """
         try:
+            # Raw frames are decoded here, in the executor, not on the socket loop
+            if type(message) is not dict:
+                message = fast_json.loads(message)
+            
             # ✅ TASK-006: Update heartbeat timestamp on any message
-            self._last_heartbeat = time.time()
+            self._last_heartbeat = time.monotonic()
             
-            logger.debug("Received order update", extra={"message": message})
+            # Skip building the log record/extra dict when DEBUG is off
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("Received order update", extra={"message": message})
             
-            # Extract order status
+            # Extract order status (interned so status/dedupe lookups hit the identity fast path)
             order_status = message.get('orderStatus', '')
+            if order_status and type(order_status) is str:
+                order_status = message['orderStatus'] = sys.intern(order_status)
+            order_id = message.get('orderId')
+            if type(order_id) is str:
+                message['orderId'] = sys.intern(order_id)
             
             # ✅ FIXED: Handle all relevant order statuses
-            # New orders
-            if order_status in ('PENDING', 'OPEN', 'TRANSIT'):
-                self.on_order_update(message)
-            # Modifications
-            elif order_status == 'MODIFIED':
-                self.on_order_update(message)
-            # Cancellations
-            elif order_status == 'CANCELLED':
-                self.on_order_update(message)
-            # Executions
-            elif order_status in ('TRADED', 'EXECUTED'):
-                self.on_order_update(message)
-            # Rejections
-            elif order_status == 'REJECTED':
-                self.on_order_update(message)
-            # Partial fills
-            elif order_status == 'PARTIALLY_FILLED':
-                self.on_order_update(message)
-            else:
+            handler = self._handlers.get(order_status)
+            if handler is not None:
+                handler(message)
+            elif debug:
                 logger.debug(f"Ignoring order update with status: {order_status}")
             
         except Exception as e:
@@ -190,43 +424,53 @@ class OrderStreamManager:
             })
     
     def _reconnect_with_backoff(self) -> None:
-        """Attempt reconnection with exponential backoff."""
-        if not self.is_running:
-            return
-        
-        if self._reconnect_attempts >= self._max_reconnect_attempts:
-            logger.error("Maximum reconnection attempts reached, stopping")
-            self.is_running = False
-            return
-        
-        self._reconnect_attempts += 1
-        
-        # Calculate backoff delay
-        delay = min(
-            self._reconnect_delay * (2 ** (self._reconnect_attempts - 1)),
-            self._max_reconnect_delay
-        )
-        
-        logger.warning(f"Reconnecting in {delay}s (attempt {self._reconnect_attempts}/{self._max_reconnect_attempts})")
-        
-        time.sleep(delay)
-        
-        # Attempt reconnect
-        if self.connect():
-            logger.info("Reconnection successful")
+        """Attempt reconnection with jittered exponential backoff."""
+        # Dropped again within the previous backoff window: keep escalating instead of restarting
+        if time.monotonic() - self._last_reconnect_at < self._last_reconnect_delay:
+            first_step = self._last_reconnect_step + 1
         else:
+            first_step = 0
+        last_step = len(self._delays) - 1
+        
+        for attempt in range(self._max_reconnect_attempts):
+            if not self.is_running:
+                return
+            
+            self._reconnect_attempts = attempt + 1
+            
+            # Look up backoff delay
+            step = min(first_step + attempt, last_step)
+            delay = self._delays[step] * (1 + random.random() * self._reconnect_jitter)
+            
+            logger.warning(f"Reconnecting in {delay:.1f}s (attempt {self._reconnect_attempts}/{self._max_reconnect_attempts})")
+            
+            time.sleep(delay)
+            
+            # Attempt reconnect
+            if self.connect():
+                self._last_reconnect_at = time.monotonic()
+                self._last_reconnect_delay = delay
+                self._last_reconnect_step = step
+                logger.info("Reconnection successful")
+                return
+            
             logger.error("Reconnection failed")
-            self._reconnect_with_backoff()
+        
+        logger.error("Maximum reconnection attempts reached, stopping")
+        self.is_running = False
     
-    def _fetch_missed_orders(self) -> None:
+    async def _fetch_missed_orders(self) -> None:
         """
         ✅ ADDED: Fetch orders that were placed while disconnected.
+        
+        Blocking calls run in the executor so the shared loop keeps serving
+        pings and socket I/O. Missed orders are replayed through the same
+        dispatch queue as live updates, so callbacks stay sequential.
         """
         try:
-            from ..database import get_db
-            
+            loop = asyncio.get_running_loop()
             db = get_db()
-            last_ts_str = db.get_config_value('last_leader_event_ts')
+            last_ts_str = await loop.run_in_executor(None, db.get_config_value, 'last_leader_event_ts')
             
             if not last_ts_str:
                 # If no last timestamp, fetch orders from last hour
@@ -240,40 +484,33 @@ class OrderStreamManager:
             # Fetch recent orders from leader account
             if self.leader_client:
                 try:
-                    orders = self.leader_client.get_order_list()
+                    orders = await loop.run_in_executor(None, self.leader_client.get_order_list)
                     
-                    if orders and isinstance(orders, list):
-                        # ✅ PATCH-004: Fixed field name per DhanHQ v2 Orders API
-                        # API returns 'createTime' (string timestamp), not 'createdAt'
-                        missed_orders = []
-                        for order in orders:
-                            # Get timestamp from correct field name
-                            create_time_str = order.get('createTime', '')
-                            if create_time_str:
-                                # Convert string timestamp to epoch if needed
-                                # For now, compare as-is or parse timestamp
-                                # TODO: Implement proper timestamp parsing if createTime is not epoch
-                                try:
-                                    # Try as epoch first
-                                    order_ts = int(create_time_str) if isinstance(create_time_str, (int, float)) else 0
-                                except (ValueError, TypeError):
-                                    order_ts = 0
-                                
-                                if order_ts > last_ts:
-                                    missed_orders.append(order)
-                        
-                        if missed_orders:
-                            logger.info(f"Found {len(missed_orders)} missed orders, processing...")
-                            for order in missed_orders:
-                                # Add orderStatus if not present
-                                if 'orderStatus' not in order:
-                                    order['orderStatus'] = order.get('status', 'UNKNOWN')
-                                self._handle_order_update(order)
-                        else:
-                            logger.info("No missed orders found")
+                    # SDK responses wrap the list as {'status': ..., 'data': [...]}
+                    if isinstance(orders, dict):
+                        orders = orders.get('data')
+                    
+                    # ✅ PATCH-004: Fixed field name per DhanHQ v2 Orders API
+                    # API returns 'createTime' (string timestamp), not 'createdAt'
+                    # TODO: Implement proper timestamp parsing if createTime is not epoch
+                    missed_orders = [
+                        order for order in (orders or ())
+                        if _order_ts(order.get('createTime')) > last_ts
+                    ]
+                    
+                    if missed_orders:
+                        logger.info(f"Found {len(missed_orders)} missed orders, processing...")
+                        update_queue = self._update_queue
+                        for order in missed_orders:
+                            # Add orderStatus if not present
+                            if 'orderStatus' not in order:
+                                order['orderStatus'] = order.get('status', 'UNKNOWN')
+                            
+                            # Same single worker as live updates: one callback at a time, in order
+                            update_queue.put_nowait(order)
                     else:
-                        logger.warning(f"Unexpected orders response: {orders}")
-                        
+                        logger.info("No missed orders found")
+                    
                 except Exception as e:
                     logger.error(f"Error fetching order list: {e}", exc_info=True)
             else:
@@ -290,7 +527,7 @@ class OrderStreamManager:
         """
         # ✅ TASK-006: Check heartbeat timeout
         if self.is_connected:
-            time_since_heartbeat = time.time() - self._last_heartbeat
+            time_since_heartbeat = time.monotonic() - self._last_heartbeat
             if time_since_heartbeat > self._heartbeat_timeout:
                 logger.warning(f"Heartbeat timeout: {time_since_heartbeat:.1f}s since last message")
                 self.is_connected = False
@@ -306,24 +543,144 @@ class OrderStreamManager:
             self._reconnect_with_backoff()
 
 
+class WSConnectionPool:
+    """
+    Pool of order streams for multiple leader accounts.
+    
+    Every stream runs on the shared event loop. Updates from all streams are
+    fanned in to one queue and dispatched to per-leader callbacks by a single
+    thread, so adding a leader adds neither a loop nor a callback thread.
+    """
+    
+    def __init__(self, max_connections: int = 3):
+        """
+        Initialize connection pool.
+        
+        Args:
+            max_connections: Maximum number of leader streams
+        """
+        self.max_connections = max_connections
+        
+        self._streams: Dict[str, OrderStreamManager] = {}
+        self._callbacks: Dict[str, Callable] = {}
+        self._updates: queue.Queue = queue.Queue()
+        self._dispatcher: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        
+        logger.info(f"WebSocket connection pool initialized (max {max_connections} streams)")
+    
+    def add_stream(
+        self,
+        leader_client_id: str,
+        leader_access_token: str,
+        on_order_update: Callable,
+        leader_client: Optional[Any] = None
+    ) -> OrderStreamManager:
+        """
+        Register a leader stream in the pool.
+        
+        Args:
+            leader_client_id: Leader account client ID
+            leader_access_token: Leader account access token
+            on_order_update: Callback for this leader's order updates
+            leader_client: DhanHQ client for leader account (for fetching missed orders)
+        
+        Returns:
+            OrderStreamManager for the leader
+        
+        Raises:
+            ValueError: If the pool is full
+        """
+        with self._lock:
+            stream = self._streams.get(leader_client_id)
+            if stream is not None:
+                self._callbacks[leader_client_id] = on_order_update
+                return stream
+            
+            if len(self._streams) >= self.max_connections:
+                raise ValueError(f"WebSocket pool full ({self.max_connections} streams)")
+            
+            put = self._updates.put
+            stream = OrderStreamManager(
+                leader_client_id=leader_client_id,
+                leader_access_token=leader_access_token,
+                on_order_update=lambda message: put((leader_client_id, message)),
+                leader_client=leader_client
+            )
+            self._streams[leader_client_id] = stream
+            self._callbacks[leader_client_id] = on_order_update
+        
+        return stream
+    
+    def start(self) -> None:
+        """Start the dispatcher thread and every registered stream."""
+        if self._dispatcher is None or not self._dispatcher.is_alive():
+            self._dispatcher = threading.Thread(
+                target=self._dispatch_loop,
+                name="ws-pool-dispatcher",
+                daemon=True
+            )
+            self._dispatcher.start()
+        
+        for stream in list(self._streams.values()):
+            stream.start()
+    
+    def stop(self) -> None:
+        """Disconnect every stream and stop the dispatcher."""
+        for stream in list(self._streams.values()):
+            stream.disconnect()
+        
+        self._updates.put(None)
+    
+    def monitor_connections(self) -> None:
+        """Run the health check of every stream."""
+        for stream in list(self._streams.values()):
+            stream.monitor_connection()
+    
+    def _dispatch_loop(self) -> None:
+        """Deliver fanned-in updates to their leader's callback."""
+        while True:
+            item = self._updates.get()
+            if item is None:
+                return
+            
+            leader_client_id, message = item
+            try:
+                self._callbacks[leader_client_id](message)
+            except Exception as e:
+                logger.error("Error in pooled order update callback", exc_info=True, extra={
+                    "error": str(e),
+                    "leader_client_id": leader_client_id
+                })
+
+
 # Global WebSocket manager instance
 _ws_manager: Optional[OrderStreamManager] = None
 
+# Global connection pool (only created when ENABLE_CONNECTION_POOLING is set)
+_ws_pool: Optional[WSConnectionPool] = None
+
 
-def initialize_ws_manager(on_order_update: Callable, leader_client: Optional[Any] = None) -> OrderStreamManager:
+def initialize_ws_manager(
+    on_order_update: Callable,
+    leader_client: Optional[Any] = None,
+    leader_config: Optional[Any] = None
+) -> OrderStreamManager:
     """
     Initialize WebSocket manager (singleton).
     
     Args:
         on_order_update: Callback for order updates
         leader_client: DhanHQ client for leader account (for fetching missed orders)
+        leader_config: Leader account config (default: loaded via get_config())
     
     Returns:
         OrderStreamManager instance
     """
     global _ws_manager
     
-    leader_config, _, _ = get_config()
+    if leader_config is None:
+        leader_config, _, _ = get_config()
     
     _ws_manager = OrderStreamManager(
         leader_client_id=leader_config.client_id,
@@ -350,3 +707,19 @@ def get_ws_manager() -> OrderStreamManager:
     return _ws_manager
 
 
+def get_ws_pool() -> Optional[WSConnectionPool]:
+    """
+    Get the WebSocket connection pool, creating it on first use if enabled.
+    
+    Returns:
+        WSConnectionPool instance, or None if pooling is disabled
+    """
+    global _ws_pool
+    
+    if _ws_pool is None:
+        _, _, system_config = get_config()
+        if not system_config.enable_connection_pooling:
+            return None
+        _ws_pool = WSConnectionPool(max_connections=system_config.max_ws_connections)
+    
+    return _ws_pool
@@ -16,6 +16,8 @@ from .config import (
 )
 
 from .models import (
+    ACCOUNT_LEADER,
+    ACCOUNT_FOLLOWER,
     Order,
     OrderEvent,
     Trade,
@@ -23,13 +25,15 @@ from .models import (
     Funds,
     Instrument,
     CopyMapping,
-    BracketOrderLeg
+    BracketOrderLeg,
+    LeaderOrder
 )
 
 from .database import (
     DatabaseManager,
     init_database,
-    get_db
+    get_db,
+    get_ro
 )
 
 from .position_sizer import (
@@ -54,6 +58,8 @@ __all__ = [
     'reload_config',
     
     # Models
+    'ACCOUNT_LEADER',
+    'ACCOUNT_FOLLOWER',
     'Order',
     'OrderEvent',
     'Trade',
@@ -62,11 +68,13 @@ __all__ = [
     'Instrument',
     'CopyMapping',
     'BracketOrderLeg',
+    'LeaderOrder',
     
     # Database
     'DatabaseManager',
     'init_database',
     'get_db',
+    'get_ro',
     
     # Position Sizing
     'PositionSizer',
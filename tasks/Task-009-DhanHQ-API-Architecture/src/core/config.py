@@ -6,10 +6,21 @@ per DhanHQ v2 integration rules.
 """
 
 import os
-from dataclasses import dataclass
+import sys
+import threading
+from dataclasses import dataclass, field
 from typing import Optional, Literal
 from enum import Enum
 
+from .models import ACCOUNT_LEADER, ACCOUNT_FOLLOWER
+
+
+# Accepted truthy values for boolean environment flags
+_TRUE_STRS = frozenset({"true", "1", "yes", "on", "y", "t"})
+
+# Config objects are shared read-only across threads; slot them where supported (3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class Environment(str, Enum):
     """DhanHQ environment types."""
@@ -24,7 +35,7 @@ class SizingStrategy(str, Enum):
     RISK_BASED = "risk_based"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class AccountConfig:
     """
     Configuration for a DhanHQ account (leader or follower).
@@ -37,14 +48,19 @@ class AccountConfig:
     client_id: str
     access_token: str
     account_type: Literal['leader', 'follower']
+    _token_preview: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Precompute the redacted token preview (instance is frozen)."""
+        token_preview = f"{self.access_token[:8]}...{self.access_token[-4:]}" if self.access_token else "None"
+        object.__setattr__(self, '_token_preview', token_preview)
     
     def __repr__(self) -> str:
         """Redact access token in string representation."""
-        token_preview = f"{self.access_token[:8]}...{self.access_token[-4:]}" if self.access_token else "None"
-        return f"AccountConfig(client_id={self.client_id}, access_token={token_preview}, account_type={self.account_type})"
+        return f"AccountConfig(client_id={self.client_id}, access_token={self._token_preview}, account_type={self.account_type})"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class SystemConfig:
     """
     Global system configuration.
@@ -61,6 +77,8 @@ class SystemConfig:
         circuit_breaker_threshold: Failures before opening circuit
         circuit_breaker_timeout: Seconds before attempting recovery
         sqlite_path: Path to SQLite database file
+        sqlite_exclusive_lock: Hold the SQLite file lock for the connection lifetime
+            (single-process deployments only; disables the read-only connection pool)
         sizing_strategy: Default position sizing strategy
         copy_ratio: Fixed ratio for fixed_ratio strategy (optional)
         max_position_size_pct: Maximum position size as % of capital
@@ -78,6 +96,7 @@ class SystemConfig:
     circuit_breaker_threshold: int = 5
     circuit_breaker_timeout: int = 60
     sqlite_path: str = "./copy_trading.db"
+    sqlite_exclusive_lock: bool = False
     sizing_strategy: SizingStrategy = SizingStrategy.CAPITAL_PROPORTIONAL
     copy_ratio: Optional[float] = None
     max_position_size_pct: float = 10.0
@@ -105,6 +124,7 @@ class ConfigLoader:
         SIZING_STRATEGY: capital_proportional/fixed_ratio/risk_based
         ENABLE_COPY_TRADING: true/false (default: true)
         SQLITE_PATH: Database file path (default: ./copy_trading.db)
+        SQLITE_EXCLUSIVE_LOCK: true/false (default: false)
         LOG_LEVEL: DEBUG/INFO/WARNING/ERROR/CRITICAL (default: INFO)
     """
     
@@ -122,7 +142,7 @@ class ConfigLoader:
         return AccountConfig(
             client_id=client_id,
             access_token=access_token,
-            account_type='leader'
+            account_type=ACCOUNT_LEADER
         )
     
     @staticmethod
@@ -139,41 +159,45 @@ class ConfigLoader:
         return AccountConfig(
             client_id=client_id,
             access_token=access_token,
-            account_type='follower'
+            account_type=ACCOUNT_FOLLOWER
         )
     
     @staticmethod
     def load_system_config() -> SystemConfig:
         """Load system configuration from environment."""
-        env_str = os.getenv("DHAN_ENV", "prod").lower()
+        env = os.environ
+        
+        env_str = env.get("DHAN_ENV", "prod").lower()
         environment = Environment.PRODUCTION if env_str == "prod" else Environment.SANDBOX
         
-        base_url = os.getenv("DHAN_API_BASE_URL", "https://api.dhan.co")
-        ws_url = os.getenv("DHAN_WS_URL", "wss://api-feed.dhan.co")
+        base_url = env.get("DHAN_API_BASE_URL", "https://api.dhan.co")
+        ws_url = env.get("DHAN_WS_URL", "wss://api-feed.dhan.co")
         
-        sizing_strategy_str = os.getenv("SIZING_STRATEGY", "capital_proportional").lower()
+        sizing_strategy_str = env.get("SIZING_STRATEGY", "capital_proportional").lower()
         try:
             sizing_strategy = SizingStrategy(sizing_strategy_str)
         except ValueError:
             sizing_strategy = SizingStrategy.CAPITAL_PROPORTIONAL
         
-        copy_ratio_str = os.getenv("COPY_RATIO")
+        copy_ratio_str = env.get("COPY_RATIO")
         copy_ratio = float(copy_ratio_str) if copy_ratio_str else None
         
-        max_position_pct_str = os.getenv("MAX_POSITION_SIZE_PCT", "10.0")
+        max_position_pct_str = env.get("MAX_POSITION_SIZE_PCT", "10.0")
         max_position_size_pct = float(max_position_pct_str)
         
-        enable_copy_str = os.getenv("ENABLE_COPY_TRADING", "true").lower()
-        enable_copy_trading = enable_copy_str in ("true", "1", "yes", "on")
+        enable_copy_str = env.get("ENABLE_COPY_TRADING", "true").lower()
+        enable_copy_trading = enable_copy_str in _TRUE_STRS
         
-        sqlite_path = os.getenv("SQLITE_PATH", "./copy_trading.db")
-        log_level = os.getenv("LOG_LEVEL", "INFO").upper()
+        sqlite_path = env.get("SQLITE_PATH", "./copy_trading.db")
+        sqlite_exclusive_lock = env.get("SQLITE_EXCLUSIVE_LOCK", "false").lower() in _TRUE_STRS
+        log_level = env.get("LOG_LEVEL", "INFO").upper()
         
         return SystemConfig(
             environment=environment,
             base_url=base_url,
             ws_url=ws_url,
             sqlite_path=sqlite_path,
+            sqlite_exclusive_lock=sqlite_exclusive_lock,
             sizing_strategy=sizing_strategy,
             copy_ratio=copy_ratio,
             max_position_size_pct=max_position_size_pct,
@@ -198,6 +222,7 @@ class ConfigLoader:
 
 # Global configuration instance (singleton pattern)
 _config_instance: Optional[tuple[AccountConfig, AccountConfig, SystemConfig]] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> tuple[AccountConfig, AccountConfig, SystemConfig]:
@@ -209,10 +234,15 @@ def get_config() -> tuple[AccountConfig, AccountConfig, SystemConfig]:
     """
     global _config_instance
     
-    if _config_instance is None:
-        _config_instance = ConfigLoader.load_all()
+    # Fast path: no lock once loaded
+    config = _config_instance
+    if config is not None:
+        return config
     
-    return _config_instance
+    with _config_lock:
+        if _config_instance is None:
+            _config_instance = ConfigLoader.load_all()
+        return _config_instance
 
 
 def reload_config() -> tuple[AccountConfig, AccountConfig, SystemConfig]:
@@ -223,6 +253,8 @@ def reload_config() -> tuple[AccountConfig, AccountConfig, SystemConfig]:
         Tuple of (leader_config, follower_config, system_config)
     """
     global _config_instance
-    _config_instance = ConfigLoader.load_all()
-    return _config_instance
+    
+    with _config_lock:
+        _config_instance = ConfigLoader.load_all()
+        return _config_instance
 
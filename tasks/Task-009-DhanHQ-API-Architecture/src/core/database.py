@@ -6,18 +6,259 @@ Updated for new architecture with proper imports from core.models.
 """
 
 import sqlite3
+import functools
 import logging
+import queue
+import threading
 import time
 import json
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from dataclasses import fields
+from typing import Optional, List, Dict, Any, Iterator, Deque
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; audit payloads fall back to stdlib json
+    orjson = None
+
 from .config import get_config
-from .models import Order, OrderEvent, Trade, Position, Funds, Instrument, CopyMapping
+from .models import (
+    ACCOUNT_LEADER, Order, OrderEvent, Trade, Position, Funds, Instrument, CopyMapping, LeaderOrder
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> str:
+    """Encode a payload for a JSON TEXT column (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+# Base schema applied by initialize_schema(); SCHEMA_VERSION matches the
+# PRAGMA user_version it stamps (migration scripts stamp their own version)
+_SCHEMA_PATH = Path(__file__).parent / "database" / "schema.sql"
+SCHEMA_VERSION = 1
+
+
+@functools.lru_cache(maxsize=None)
+def _load_schema_sql() -> str:
+    """Read the base schema once per process."""
+    return _SCHEMA_PATH.read_text()
+
+
+def _select_columns(model, aliases: Optional[Dict[str, str]] = None) -> str:
+    """SELECT list in the model's field order, so rows feed ``Model.from_row``."""
+    aliases = aliases or {}
+    return ", ".join(aliases.get(f.name, f.name) for f in fields(model))
+
+
+def _event_row(event: OrderEvent) -> tuple:
+    """Parameters for _SQL_SAVE_ORDER_EVENT."""
+    return (event.order_id, event.event_type, event.event_data, event.event_ts, event.sequence)
+
+
+# Column lists for the positional fetch paths (trades store side/product)
+_ORDER_COLUMNS = _select_columns(Order)
+_ORDER_EVENT_COLUMNS = _select_columns(OrderEvent)
+_TRADE_COLUMNS = _select_columns(Trade, {'transaction_type': 'side', 'product_type': 'product'})
+_POSITION_COLUMNS = _select_columns(Position)
+
+# Hot-path write statements: one shared string object per statement keeps
+# sqlite3's per-connection statement cache hitting on every call
+_SQL_SAVE_ORDER = """
+    INSERT OR REPLACE INTO orders (
+        id, account_type, correlation_id, status, order_status, side, product, order_type,
+        validity, security_id, exchange_segment, trading_symbol, quantity, price, trigger_price,
+        disclosed_qty, traded_qty, remaining_qty, avg_price, exchange_order_id, exchange_time,
+        algo_id, drv_expiry_date, drv_option_type, drv_strike_price,
+        oms_error_code, oms_error_description,
+        co_stop_loss_value, co_trigger_price, bo_profit_value,
+        bo_stop_loss_value, bo_order_type, parent_order_id, leg_type,
+        amo_time, slice_order_id, slice_index, total_slice_quantity,
+        created_at, updated_at, completed_at, raw_request, raw_response,
+        after_market_order, is_sliced_order
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Placeholder orders row so copy_mappings' foreign keys hold before the full
+# order is saved; a later save_order() replaces it
+_SQL_SAVE_ORDER_STUB = """
+    INSERT OR IGNORE INTO orders (
+        id, account_type, correlation_id, status, side, product, order_type, validity,
+        security_id, exchange_segment, quantity, price, trigger_price, created_at, updated_at
+    ) VALUES (?, ?, ?, 'PENDING', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SAVE_ORDER_EVENT = """
+    INSERT OR IGNORE INTO order_events (
+        order_id, event_type, event_data, event_ts, sequence
+    ) VALUES (?, ?, ?, ?, ?)
+"""
+
+# Order events are buffered and written together: flush when the buffer
+# fills or when the previous flush is older than the interval
+_EVENT_BUFFER_SIZE = 256
+_EVENT_FLUSH_INTERVAL = 0.05  # seconds
+
+_SQL_SAVE_COPY_MAPPING = """
+    INSERT OR REPLACE INTO copy_mappings (
+        leader_order_id, follower_order_id, leader_quantity, follower_quantity,
+        sizing_strategy, capital_ratio, status, error_message, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# A NULL follower_order_id keeps the stored value
+_SQL_UPDATE_COPY_MAPPING_STATUS = """
+    UPDATE copy_mappings
+    SET status = ?, follower_order_id = COALESCE(?, follower_order_id), error_message = ?, updated_at = ?
+    WHERE leader_order_id = ?
+"""
+
+# SQLite 3.35+ hands the new row id back from the INSERT itself
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_SQL_SAVE_COPY_MAPPING_RETURNING = _SQL_SAVE_COPY_MAPPING.rstrip() + " RETURNING id\n"
+
+# Claim a leader order for replication: inserts a 'pending' row, or takes over
+# a 'failed' one for a retry. Touches no row (rowcount 0) if the leader order
+# is already pending, placed or cancelled - UNIQUE(leader_order_id) decides.
+_SQL_CLAIM_COPY_MAPPING = """
+    INSERT INTO copy_mappings (
+        leader_order_id, follower_order_id, leader_quantity, follower_quantity,
+        sizing_strategy, capital_ratio, status, error_message, created_at, updated_at
+    ) VALUES (?, NULL, ?, 0, NULL, NULL, 'pending', NULL, ?, ?)
+    ON CONFLICT(leader_order_id) DO UPDATE SET
+        status = 'pending',
+        follower_order_id = NULL,
+        error_message = NULL,
+        updated_at = excluded.updated_at
+    WHERE copy_mappings.status = 'failed'
+"""
+
+# Leader orders this process has claimed, most recent last. A repeat update for
+# one of them (TRANSIT, PENDING, OPEN ...) is refused without a database write;
+# a mapping saved as 'failed' is dropped so a retry reaches the database
+_CLAIM_CACHE_SIZE = 10_000
+
+_SQL_SAVE_TRADE = """
+    INSERT OR REPLACE INTO trades (
+        id, order_id, account_type, exchange_order_id, exchange_trade_id,
+        security_id, exchange_segment, trading_symbol,
+        side, product, order_type,
+        quantity, price,
+        trade_ts, created_at, updated_at, exchange_time,
+        drv_expiry_date, drv_option_type, drv_strike_price,
+        raw_data
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SAVE_POSITION = """
+    INSERT OR REPLACE INTO positions (
+        snapshot_ts, account_type, security_id, exchange_segment,
+        quantity, avg_price, realized_pl, unrealized_pl, product, raw_data
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SAVE_FUNDS = """
+    INSERT OR REPLACE INTO funds (
+        snapshot_ts, account_type, available_balance, collateral, margin_used, raw_data
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_AUDIT = """
+    INSERT INTO audit_log (
+        action, account_type, request_data, response_data,
+        status_code, error_message, duration_ms, ts
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Audit rows (and queued copy mappings) are written off the caller's thread: the
+# writer commits up to _AUDIT_BATCH_SIZE rows at once, waiting at most
+# _AUDIT_FLUSH_INTERVAL to fill a batch
+_AUDIT_BATCH_SIZE = 256
+_AUDIT_FLUSH_INTERVAL = 0.05  # seconds
+_AUDIT_STOP = object()  # Queue sentinel: drain and exit
+
+# How often a flush waiting on the background writer checks that it is still alive
+_WRITER_WAIT_SLICE = 0.1  # seconds
+
+_SQL_PURGE_AUDIT = "DELETE FROM audit_log WHERE ts < ?"
+
+_SQL_SELECT_CONFIG = "SELECT value FROM config WHERE key = ?"
+
+# Most recently read config values kept in process; set_config_value keeps it current
+_CONFIG_CACHE_SIZE = 256
+
+# Update in place on conflict rather than delete + re-insert (OR REPLACE)
+_SQL_UPSERT_CONFIG_FULL = """
+    INSERT INTO config (key, value, description, updated_at)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value,
+        description = excluded.description,
+        updated_at = excluded.updated_at
+"""
+
+# Common case (no description): bind three values and leave a stored description alone
+_SQL_UPSERT_CONFIG_NODESC = """
+    INSERT INTO config (key, value, updated_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value,
+        updated_at = excluded.updated_at
+"""
+
+# Write-then-read callers get the stored value back from the upsert itself (SQLite 3.35+)
+_SQL_UPSERT_CONFIG_FULL_RETURNING = _SQL_UPSERT_CONFIG_FULL.rstrip() + " RETURNING value\n"
+_SQL_UPSERT_CONFIG_NODESC_RETURNING = _SQL_UPSERT_CONFIG_NODESC.rstrip() + " RETURNING value\n"
+
+# Trade queries: every filter is always bound (NULL = no filter, LIMIT -1 = no limit)
+# so each query is a single statement that stays prepared
+_SQL_GET_TRADES = f"""
+    SELECT {_TRADE_COLUMNS} FROM trades
+    WHERE (? IS NULL OR trade_ts >= ?)
+      AND (? IS NULL OR trade_ts <= ?)
+      AND (? IS NULL OR security_id = ?)
+      AND (? IS NULL OR exchange_segment = ?)
+    ORDER BY trade_ts DESC
+    LIMIT ?
+"""
+
+# Same query with a plain account_type equality so idx_trades_account_ts
+# serves both the filter and the ORDER BY (an OR-guarded column can't use it)
+_SQL_GET_TRADES_BY_ACCOUNT = f"""
+    SELECT {_TRADE_COLUMNS} FROM trades
+    WHERE account_type = ?
+      AND (? IS NULL OR trade_ts >= ?)
+      AND (? IS NULL OR trade_ts <= ?)
+      AND (? IS NULL OR security_id = ?)
+      AND (? IS NULL OR exchange_segment = ?)
+    ORDER BY trade_ts DESC
+    LIMIT ?
+"""
+
+_SQL_GET_TRADES_SUMMARY = """
+    SELECT 
+        COUNT(*) as total_trades,
+        SUM(CASE WHEN side = 'BUY' THEN quantity ELSE 0 END) as total_buy_qty,
+        SUM(CASE WHEN side = 'SELL' THEN quantity ELSE 0 END) as total_sell_qty,
+        SUM(quantity * price) as total_value,
+        AVG(price) as avg_price
+    FROM trades
+    WHERE account_type = ?
+      AND (? IS NULL OR trade_ts >= ?)
+      AND (? IS NULL OR trade_ts <= ?)
+"""
+
+
+class _MappingRow(tuple):
+    """Copy mapping row on the background writer queue (audit rows are plain tuples)."""
+    __slots__ = ()
+
+
 class DatabaseManager:
     """
     Manage SQLite database operations.
@@ -30,16 +271,55 @@ class DatabaseManager:
     - Migration support
     """
     
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, read_pool_size: int = 4, exclusive_lock: bool = False):
         """
         Initialize database manager.
         
         Args:
             db_path: Path to SQLite database file
+            read_pool_size: Read-only connections for get_* queries (0 = read on the writer)
+            exclusive_lock: Use PRAGMA locking_mode=EXCLUSIVE. Only safe when this
+                process is the sole user of the file; no other connection (including
+                the read pool, which is disabled) can open it while the lock is held.
         """
         self.db_path = db_path
-        self.conn: Optional[sqlite3.Connection] = None
+        self._in_memory = db_path == ':memory:'
+        self.conn: Optional[sqlite3.Connection] = None  # Single writer connection
         self._busy_timeout = 5000  # 5 seconds
+        
+        # Held for a whole batch() or single write, so threads sharing the writer
+        # connection never interleave statements in one transaction
+        self._write_lock = threading.RLock()
+        # Per-thread batch() state: whether one is open, and its shared timestamp
+        self._batch_state = threading.local()
+        self._exclusive_lock = exclusive_lock
+        
+        # Read-only connections, opened on demand up to read_pool_size
+        self._read_pool_size = 0 if exclusive_lock else read_pool_size
+        self._read_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._read_conns: List[sqlite3.Connection] = []
+        self._read_lock = threading.Lock()
+        
+        # Pending order event rows, written by flush_events(). Unbounded so a
+        # failing flush never pushes out events; save_order_event() flushes it
+        # once it holds _EVENT_BUFFER_SIZE rows
+        self._event_buf: Deque[tuple] = deque()
+        self._event_lock = threading.RLock()
+        self._last_event_flush = 0.0
+        
+        # Audit and copy mapping rows queued for the background writer thread
+        # (started on first use)
+        self._audit_q: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._audit_thread: Optional[threading.Thread] = None
+        self._audit_start_lock = threading.Lock()
+        
+        # Config values by key (LRU); only this process's writes invalidate it
+        self._config_cache: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._config_lock = threading.Lock()
+        
+        # Leader order IDs claimed by claim_copy_mapping() (LRU)
+        self._claimed: "OrderedDict[str, None]" = OrderedDict()
+        self._claimed_lock = threading.Lock()
     
     def connect(self) -> sqlite3.Connection:
         """
@@ -56,39 +336,65 @@ class DatabaseManager:
         # Create directory if it doesn't exist
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         
+        # Autocommit mode: no hidden BEGIN before DML. Single statements commit on
+        # their own; multi-statement writes open BEGIN IMMEDIATE via batch()
         self.conn = sqlite3.connect(
             self.db_path,
             timeout=self._busy_timeout / 1000,
-            check_same_thread=False  # Allow multi-threaded access (with care)
+            isolation_level=None,
+            check_same_thread=False,  # Allow multi-threaded access (with care)
+            cached_statements=512  # Room for every statement the manager prepares
         )
         
-        # Enable row factory for dict-like access
-        self.conn.row_factory = sqlite3.Row
-        
         # Enable foreign keys
         self.conn.execute("PRAGMA foreign_keys = ON")
         
-        # Enable WAL mode for better concurrency
-        self.conn.execute("PRAGMA journal_mode = WAL")
+        # Enable WAL mode for better concurrency (in-memory databases have no WAL)
+        if not self._in_memory:
+            self.conn.execute("PRAGMA journal_mode = WAL")
         
         # Set synchronous mode
         self.conn.execute("PRAGMA synchronous = NORMAL")
         
+        # Single-process deployments: keep the file lock instead of re-taking it per transaction
+        if self._exclusive_lock:
+            self.conn.execute("PRAGMA locking_mode = EXCLUSIVE")
+        
+        # Keep temp tables/indices in memory
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        
+        # Memory-map up to 1 GiB of the database file for reads
+        self.conn.execute("PRAGMA mmap_size = 1073741824")
+        
+        # 64 MiB page cache (negative value = KiB)
+        self.conn.execute("PRAGMA cache_size = -65536")
+        
+        # Checkpoint the WAL every 1000 pages
+        self.conn.execute("PRAGMA wal_autocheckpoint = 1000")
+        
+        # Busy timeout at the SQLite level as well, so it applies to every handle
+        self.conn.execute(f"PRAGMA busy_timeout = {self._busy_timeout}")
+        
         logger.info("Database connection established")
         
         return self.conn
     
     def initialize_schema(self) -> None:
-        """Initialize database schema from SQL file."""
-        schema_path = Path(__file__).parent / "database" / "schema.sql"
+        """
+        Initialize database schema from SQL file.
         
-        logger.info("Initializing database schema")
+        Skipped entirely when PRAGMA user_version shows the schema is already
+        applied. The script is not wrapped in a transaction because its
+        leading PRAGMAs (synchronous) cannot run inside one.
+        """
+        user_version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if user_version >= SCHEMA_VERSION:
+            logger.info(f"Database schema already at version {user_version}")
+            return
         
-        with open(schema_path, 'r') as f:
-            schema_sql = f.read()
+        logger.info("Initializing database schema")
         
-        self.conn.executescript(schema_sql)
-        self.conn.commit()
+        self.conn.executescript(f"{_load_schema_sql()}\nPRAGMA user_version = {SCHEMA_VERSION};")
         
         logger.info("Database schema initialized successfully")
     
@@ -99,14 +405,176 @@ class DatabaseManager:
         Returns:
             Schema version number
         """
+        user_version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if user_version:
+            return user_version
+        
+        # Databases created before user_version was stamped
         cursor = self.conn.execute(
             "SELECT value FROM config WHERE key = 'schema_version'"
         )
         row = cursor.fetchone()
-        return int(row['value']) if row else 0
+        return int(row[0]) if row else 0
+    
+    @property
+    def _in_batch(self) -> bool:
+        """True while this thread has a batch() open (save_* methods then skip commit)."""
+        return getattr(self._batch_state, 'active', False)
+    
+    @property
+    def _batch_now(self) -> int:
+        """Timestamp shared by every write in this thread's open batch()."""
+        return self._batch_state.now
+    
+    @contextmanager
+    def batch(self) -> Iterator['DatabaseManager']:
+        """
+        Group writes into a single transaction (one commit for N writes).
+        
+        Usage:
+            with db.batch():
+                for event in events:
+                    db.save_order_event(event)
+        
+        Nested batches join the outermost one. Rolls back if the block or the
+        commit raises. Buffered order events are not written here; they stay
+        in the buffer for the next flush_events() outside the batch. Other
+        threads' writes wait until the batch commits or rolls back.
+        
+        Yields:
+            This DatabaseManager
+        """
+        if self._in_batch:
+            yield self
+            return
+        
+        with self._write_lock:
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN IMMEDIATE")
+            state = self._batch_state
+            state.now = int(time.time())
+            state.active = True
+            try:
+                yield self
+                self.conn.commit()
+            except Exception:
+                self._rollback()
+                raise
+            finally:
+                state.active = False
+    
+    def _rollback(self) -> None:
+        """Roll back the open transaction and drop cached values it may have written."""
+        self.conn.rollback()
+        with self._config_lock:
+            self._config_cache.clear()
+        with self._claimed_lock:
+            self._claimed.clear()
+    
+    def _now(self) -> int:
+        """Epoch seconds for a write; one clock read per batch() instead of per row."""
+        return self._batch_now if self._in_batch else int(time.time())
+    
+    def _commit(self) -> None:
+        """Commit unless a batch() transaction is open."""
+        if not self._in_batch:
+            self.conn.commit()
+    
+    @contextmanager
+    def _writing(self) -> Iterator[sqlite3.Connection]:
+        """
+        Hold the writer connection for one write and commit it (joins an open batch()).
+        
+        Yields:
+            The writer connection
+        """
+        with self._write_lock:
+            try:
+                yield self.conn
+            except Exception:
+                if not self._in_batch:
+                    self.conn.rollback()
+                raise
+            self._commit()
+    
+    def _open_read_connection(self) -> sqlite3.Connection:
+        """Open a read-only connection to the database file."""
+        conn = sqlite3.connect(
+            f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+            uri=True,
+            timeout=self._busy_timeout / 1000,
+            check_same_thread=False,  # Checked out by one thread at a time
+            cached_statements=512
+        )
+        conn.execute("PRAGMA query_only = 1")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 1073741824")
+        conn.execute(f"PRAGMA busy_timeout = {self._busy_timeout}")
+        return conn
+    
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Check out a read-only connection for the duration of a query.
+        
+        WAL lets these readers run alongside the writer. Reads fall back to
+        the writer connection while a batch() is open (so they see its
+        uncommitted rows), for in-memory databases, and when the pool is disabled.
+        
+        Yields:
+            SQLite connection to run SELECTs on
+        """
+        if self._in_batch or self._read_pool_size <= 0 or self._in_memory:
+            with self._write_lock:
+                yield self.conn
+            return
+        
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            with self._read_lock:
+                can_open = len(self._read_conns) < self._read_pool_size
+                if can_open:
+                    conn = self._open_read_connection()
+                    self._read_conns.append(conn)
+            if not can_open:
+                conn = self._read_pool.get()
+        
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+    
+    def _row_cursor(self, conn: sqlite3.Connection, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """
+        Execute a query whose rows support access by column name.
+        
+        Connections return plain tuples, which the positional ``Model.from_row``
+        fetch paths stream directly; only readers that build models or dicts
+        from column names pay for sqlite3.Row.
+        """
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        return cursor.execute(sql, params)
     
     def close(self) -> None:
-        """Close database connection."""
+        """Close the writer and any pooled read connections."""
+        if self._audit_thread is not None:
+            self._audit_q.put(_AUDIT_STOP)
+            self._audit_thread.join()
+            self._audit_thread = None
+        
+        if self.conn:
+            # Rows a failed background writer left on its queue
+            self._write_queued_rows()
+            self.flush_events()
+        
+        with self._read_lock:
+            for read_conn in self._read_conns:
+                read_conn.close()
+            self._read_conns.clear()
+            self._read_pool = queue.Queue()
+        
         if self.conn:
             self.conn.close()
             self.conn = None
@@ -123,36 +591,53 @@ class DatabaseManager:
         Args:
             order: Order object to save
         """
-        self.conn.execute("""
-            INSERT OR REPLACE INTO orders (
-                id, account_type, correlation_id, status, order_status, side, product, order_type,
-                validity, security_id, exchange_segment, trading_symbol, quantity, price, trigger_price,
-                disclosed_qty, traded_qty, remaining_qty, avg_price, exchange_order_id, exchange_time,
-                algo_id, drv_expiry_date, drv_option_type, drv_strike_price,
-                oms_error_code, oms_error_description,
-                co_stop_loss_value, co_trigger_price, bo_profit_value,
-                bo_stop_loss_value, bo_order_type, parent_order_id, leg_type,
-                after_market_order, amo_time, is_sliced_order, slice_order_id, slice_index, total_slice_quantity,
-                created_at, updated_at, completed_at, raw_request, raw_response
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            order.id, order.account_type, order.correlation_id, order.status,
-            order.order_status, order.side, order.product, order.order_type, order.validity,
-            order.security_id, order.exchange_segment, order.trading_symbol, order.quantity,
-            order.price, order.trigger_price, order.disclosed_qty,
-            order.traded_qty, order.remaining_qty, order.avg_price, order.exchange_order_id, order.exchange_time,
-            order.algo_id, order.drv_expiry_date, order.drv_option_type, order.drv_strike_price,
-            order.oms_error_code, order.oms_error_description,
-            order.co_stop_loss_value, order.co_trigger_price, order.bo_profit_value,
-            order.bo_stop_loss_value, order.bo_order_type, order.parent_order_id,
-            order.leg_type, 1 if order.after_market_order else 0, order.amo_time,
-            1 if order.is_sliced_order else 0, order.slice_order_id, order.slice_index, order.total_slice_quantity,
-            order.created_at, order.updated_at, order.completed_at, order.raw_request, order.raw_response
-        ))
-        self.conn.commit()
+        with self._writing() as conn:
+            conn.execute(_SQL_SAVE_ORDER, order.to_row())
         
         logger.debug(f"Saved order: {order.id} ({order.account_type})")
     
+    def save_order_stub(
+        self,
+        order_id: str,
+        account_type: str,
+        order: LeaderOrder,
+        quantity: int,
+        correlation_id: Optional[str] = None
+    ) -> None:
+        """
+        Save a placeholder orders row unless the order is already stored.
+        
+        copy_mappings references orders(id) for both legs, so the replicator
+        stores the leader and follower orders this way before mapping them.
+        
+        Args:
+            order_id: Order ID
+            account_type: 'leader' or 'follower'
+            order: Leader order the row describes (or replicates)
+            quantity: Order quantity for this account
+            correlation_id: Correlation ID linking leader and follower
+        """
+        with self._writing() as conn:
+            now = self._now()
+            conn.execute(_SQL_SAVE_ORDER_STUB, (
+                order_id, account_type, correlation_id,
+                order.transaction_type, order.product_type or '', order.order_type or '',
+                order.validity or 'DAY', order.security_id, order.exchange_segment,
+                quantity, order.price, order.trigger_price, now, now
+            ))
+    
+    def save_orders(self, orders: List[Order]) -> None:
+        """
+        Save or update several orders with one executemany and one commit.
+        
+        Args:
+            orders: Order objects to save
+        """
+        with self.batch():
+            self.conn.executemany(_SQL_SAVE_ORDER, [order.to_row() for order in orders])
+        
+        logger.debug(f"Saved {len(orders)} orders")
+    
     def save_bracket_order_leg(self, leg_data: Dict[str, Any]) -> bool:
         """
         Save bracket order leg to tracking table.
@@ -160,24 +645,29 @@ class DatabaseManager:
         Args:
             leg_data: Dictionary with parent_order_id, leg_type, leg_order_id, status, etc.
         """
+        # One clock read, and only used when the caller didn't supply timestamps
+        now = self._now()
+        created_at = leg_data.get('created_at') or now
+        updated_at = leg_data.get('updated_at') or now
+        
         try:
-            self.conn.execute('''
-                INSERT OR REPLACE INTO bracket_order_legs (
-                    parent_order_id, leg_type, leg_order_id, status,
-                    quantity, price, trigger_price, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                leg_data.get('parent_order_id'),
-                leg_data.get('leg_type'),
-                leg_data.get('leg_order_id'),
-                leg_data.get('status', 'PENDING'),
-                leg_data.get('quantity', 0),
-                leg_data.get('price', 0),
-                leg_data.get('trigger_price', 0),
-                leg_data.get('created_at', int(time.time())),
-                leg_data.get('updated_at', int(time.time()))
-            ))
-            self.conn.commit()
+            with self._writing() as conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO bracket_order_legs (
+                        parent_order_id, leg_type, leg_order_id, status,
+                        quantity, price, trigger_price, created_at, updated_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    leg_data.get('parent_order_id'),
+                    leg_data.get('leg_type'),
+                    leg_data.get('leg_order_id'),
+                    leg_data.get('status', 'PENDING'),
+                    leg_data.get('quantity', 0),
+                    leg_data.get('price', 0),
+                    leg_data.get('trigger_price', 0),
+                    created_at,
+                    updated_at
+                ))
             logger.debug(f"BO leg saved: parent={leg_data.get('parent_order_id')}, leg={leg_data.get('leg_type')}")
             return True
         except Exception as e:
@@ -195,26 +685,12 @@ class DatabaseManager:
             List of leg dictionaries
         """
         try:
-            cursor = self.conn.execute('''
-                SELECT * FROM bracket_order_legs WHERE parent_order_id = ?
-            ''', (parent_order_id,))
-            rows = cursor.fetchall()
-            
-            legs = []
-            for row in rows:
-                legs.append({
-                    'id': row[0],
-                    'parent_order_id': row[1],
-                    'leg_type': row[2],
-                    'leg_order_id': row[3],
-                    'status': row[4],
-                    'quantity': row[5],
-                    'price': row[6],
-                    'trigger_price': row[7],
-                    'created_at': row[8],
-                    'updated_at': row[9]
-                })
-            return legs
+            with self._reader() as conn:
+                cursor = self._row_cursor(conn, '''
+                    SELECT * FROM bracket_order_legs WHERE parent_order_id = ?
+                ''', (parent_order_id,))
+                
+                return [dict(row) for row in cursor]
         except Exception as e:
             logger.error(f"Error fetching BO legs: {e}")
             return []
@@ -228,12 +704,12 @@ class DatabaseManager:
             status: New status
         """
         try:
-            self.conn.execute('''
-                UPDATE bracket_order_legs 
-                SET status = ?, updated_at = ?
-                WHERE id = ?
-            ''', (status, int(time.time()), leg_id))
-            self.conn.commit()
+            with self._writing() as conn:
+                conn.execute('''
+                    UPDATE bracket_order_legs 
+                    SET status = ?, updated_at = ?
+                    WHERE id = ?
+                ''', (status, self._now(), leg_id))
             logger.debug(f"BO leg {leg_id} status updated to {status}")
             return True
         except Exception as e:
@@ -250,13 +726,14 @@ class DatabaseManager:
         Returns:
             Order object or None
         """
-        cursor = self.conn.execute(
-            "SELECT * FROM orders WHERE id = ?", (order_id,)
-        )
-        row = cursor.fetchone()
+        with self._reader() as conn:
+            cursor = conn.execute(
+                f"SELECT {_ORDER_COLUMNS} FROM orders WHERE id = ?", (order_id,)
+            )
+            row = cursor.fetchone()
         
         if row:
-            return Order(**dict(row))
+            return Order.from_row(row)
         return None
     
     def get_orders_by_account(self, account_type: str, limit: int = 100) -> List[Order]:
@@ -270,14 +747,15 @@ class DatabaseManager:
         Returns:
             List of Order objects
         """
-        cursor = self.conn.execute("""
-            SELECT * FROM orders 
-            WHERE account_type = ?
-            ORDER BY created_at DESC
-            LIMIT ?
-        """, (account_type, limit))
-        
-        return [Order(**dict(row)) for row in cursor.fetchall()]
+        with self._reader() as conn:
+            cursor = conn.execute(f"""
+                SELECT {_ORDER_COLUMNS} FROM orders 
+                WHERE account_type = ?
+                ORDER BY created_at DESC
+                LIMIT ?
+            """, (account_type, limit))
+            
+            return list(map(Order.from_row, cursor))
     
     def get_order_by_correlation_id(self, correlation_id: str) -> Optional[Order]:
         """
@@ -292,17 +770,18 @@ class DatabaseManager:
         Returns:
             Order object or None (returns most recent if multiple matches)
         """
-        cursor = self.conn.execute("""
-            SELECT * FROM orders 
-            WHERE correlation_id = ?
-            ORDER BY created_at DESC
-            LIMIT 1
-        """, (correlation_id,))
-        
-        row = cursor.fetchone()
+        with self._reader() as conn:
+            cursor = conn.execute(f"""
+                SELECT {_ORDER_COLUMNS} FROM orders 
+                WHERE correlation_id = ?
+                ORDER BY created_at DESC
+                LIMIT 1
+            """, (correlation_id,))
+            
+            row = cursor.fetchone()
         
         if row:
-            return Order(**dict(row))
+            return Order.from_row(row)
         return None
     
     def update_order_status(self, order_id: str, status: str) -> None:
@@ -313,15 +792,28 @@ class DatabaseManager:
             order_id: Order ID
             status: New status
         """
-        self.conn.execute("""
-            UPDATE orders 
-            SET status = ?, updated_at = ?
-            WHERE id = ?
-        """, (status, int(time.time()), order_id))
-        self.conn.commit()
+        with self._writing() as conn:
+            conn.execute("""
+                UPDATE orders 
+                SET status = ?, updated_at = ?
+                WHERE id = ?
+            """, (status, self._now(), order_id))
         
         logger.debug(f"Updated order {order_id} status to {status}")
     
+    def update_order_status_with_event(self, order_id: str, status: str, event: OrderEvent) -> None:
+        """
+        Update order status and record the matching lifecycle event in one transaction.
+        
+        Args:
+            order_id: Order ID
+            status: New status
+            event: OrderEvent describing the transition
+        """
+        with self.batch():
+            self.update_order_status(order_id, status)
+            self.conn.execute(_SQL_SAVE_ORDER_EVENT, _event_row(event))
+    
     def save_order_modification(
         self,
         order_id: str,
@@ -342,16 +834,16 @@ class DatabaseManager:
             status: Modification status (PENDING, SUCCESS, FAILED)
             error_message: Error message if failed
         """
-        self.conn.execute("""
-            INSERT INTO order_modifications (
+        with self._writing() as conn:
+            conn.execute("""
+                INSERT INTO order_modifications (
+                    order_id, modification_type, old_value, new_value,
+                    status, error_message, modified_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (
                 order_id, modification_type, old_value, new_value,
-                status, error_message, modified_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            order_id, modification_type, old_value, new_value,
-            status, error_message, int(time.time())
-        ))
-        self.conn.commit()
+                status, error_message, self._now()
+            ))
         
         logger.debug(f"Saved modification for order {order_id}: {modification_type}")
     
@@ -365,13 +857,14 @@ class DatabaseManager:
         Returns:
             List of modification records
         """
-        cursor = self.conn.execute("""
-            SELECT * FROM order_modifications
-            WHERE order_id = ?
-            ORDER BY modified_at DESC
-        """, (order_id,))
-        
-        return [dict(row) for row in cursor.fetchall()]
+        with self._reader() as conn:
+            cursor = self._row_cursor(conn, """
+                SELECT * FROM order_modifications
+                WHERE order_id = ?
+                ORDER BY modified_at DESC
+            """, (order_id,))
+            
+            return [dict(row) for row in cursor]
     
     # =========================================================================
     # Order Event Operations
@@ -381,21 +874,88 @@ class DatabaseManager:
         """
         Save order event.
         
+        Events are buffered and written in one transaction once the buffer
+        fills or the last flush is older than the flush interval. Call
+        flush_events() to force pending events to disk.
+        
         Args:
             event: OrderEvent object
         """
-        self.conn.execute("""
-            INSERT OR IGNORE INTO order_events (
-                order_id, event_type, event_data, event_ts, sequence
-            ) VALUES (?, ?, ?, ?, ?)
-        """, (
-            event.order_id, event.event_type, event.event_data,
-            event.event_ts, event.sequence
-        ))
-        self.conn.commit()
+        with self._event_lock:
+            self._event_buf.append(_event_row(event))
+            flush = (len(self._event_buf) >= _EVENT_BUFFER_SIZE
+                     or time.monotonic() - self._last_event_flush > _EVENT_FLUSH_INTERVAL)
+        # Outside the event lock: flush_events() takes the writer lock first
+        if flush and not self._in_batch:
+            self.flush_events()
         
         logger.debug(f"Saved order event: {event.event_type} for order {event.order_id}")
     
+    def flush_events(self) -> int:
+        """
+        Write all buffered order events with one executemany and one commit.
+        
+        Events get a transaction of their own, so a bad event never fails an
+        unrelated write; inside a batch() this does nothing. If the batch
+        write fails, events are retried one by one: an event the schema
+        rejects (e.g. for an unknown order) is logged and dropped, and on any
+        other error the unwritten events go back to the buffer.
+        
+        Returns:
+            Number of events written
+        
+        Raises:
+            sqlite3.Error: If the events could not be written for another reason
+        """
+        if not self._event_buf or self._in_batch:
+            return 0
+        
+        with self._write_lock:
+            with self._event_lock:
+                rows = list(self._event_buf)
+                self._event_buf.clear()
+            if not rows:
+                return 0
+            self._last_event_flush = time.monotonic()
+            
+            try:
+                with self.batch():
+                    self.conn.executemany(_SQL_SAVE_ORDER_EVENT, rows)
+                written = len(rows)
+            except sqlite3.Error:
+                written = self._save_events_one_by_one(rows)
+        
+        logger.debug(f"Flushed {written} order events")
+        return written
+    
+    def _save_events_one_by_one(self, rows: List[tuple]) -> int:
+        """
+        Write order event rows one transaction each, dropping rows the schema rejects.
+        
+        Args:
+            rows: Order event rows whose batch write failed
+        
+        Returns:
+            Number of events written
+        
+        Raises:
+            sqlite3.Error: Any error other than a constraint violation; the
+                unwritten rows are back in the buffer
+        """
+        written = 0
+        for index, row in enumerate(rows):
+            try:
+                with self._writing() as conn:
+                    conn.execute(_SQL_SAVE_ORDER_EVENT, row)
+                written += 1
+            except sqlite3.IntegrityError as e:
+                logger.error(f"Dropping order event {row[1]} for order {row[0]}: {e}")
+            except sqlite3.Error:
+                with self._event_lock:
+                    self._event_buf.extendleft(reversed(rows[index:]))
+                raise
+        return written
+    
     def get_order_events(self, order_id: str) -> List[OrderEvent]:
         """
         Get all events for an order.
@@ -406,13 +966,16 @@ class DatabaseManager:
         Returns:
             List of OrderEvent objects
         """
-        cursor = self.conn.execute("""
-            SELECT * FROM order_events
-            WHERE order_id = ?
-            ORDER BY event_ts ASC
-        """, (order_id,))
+        self.flush_events()
         
-        return [OrderEvent(**dict(row)) for row in cursor.fetchall()]
+        with self._reader() as conn:
+            cursor = conn.execute(f"""
+                SELECT {_ORDER_EVENT_COLUMNS} FROM order_events
+                WHERE order_id = ?
+                ORDER BY event_ts ASC
+            """, (order_id,))
+            
+            return list(map(OrderEvent.from_row, cursor))
     
     # =========================================================================
     # Copy Mapping Operations
@@ -428,25 +991,123 @@ class DatabaseManager:
         Returns:
             Mapping ID
         """
-        cursor = self.conn.execute("""
-            INSERT OR REPLACE INTO copy_mappings (
-                leader_order_id, follower_order_id, leader_quantity, follower_quantity,
-                sizing_strategy, capital_ratio, status, error_message, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        params = (
             mapping.leader_order_id, mapping.follower_order_id,
             mapping.leader_quantity, mapping.follower_quantity,
             mapping.sizing_strategy, mapping.capital_ratio,
             mapping.status, mapping.error_message,
             mapping.created_at, mapping.updated_at
-        ))
-        self.conn.commit()
+        )
+        
+        # Read the id before committing so the RETURNING statement has finished
+        with self._writing() as conn:
+            if _HAS_RETURNING:
+                mapping_id = conn.execute(_SQL_SAVE_COPY_MAPPING_RETURNING, params).fetchone()[0]
+            else:
+                mapping_id = conn.execute(_SQL_SAVE_COPY_MAPPING, params).lastrowid
+        if mapping.status == 'failed':
+            self._forget_claim(mapping.leader_order_id)
         
-        mapping_id = cursor.lastrowid
         logger.debug(f"Saved copy mapping: {mapping.leader_order_id} -> {mapping.follower_order_id}")
         
         return mapping_id
     
+    def save_copy_mapping_row(self, row: tuple) -> None:
+        """
+        Save a copy mapping from raw column values, without building a CopyMapping.
+        
+        created_at and updated_at are both stamped from a single clock read.
+        
+        Args:
+            row: (leader_order_id, follower_order_id, leader_quantity,
+                follower_quantity, sizing_strategy, capital_ratio, status,
+                error_message)
+        """
+        with self._writing() as conn:
+            now = self._now()
+            conn.execute(_SQL_SAVE_COPY_MAPPING, row + (now, now))
+        if row[6] == 'failed':
+            self._forget_claim(row[0])
+    
+    def queue_copy_mapping_row(self, row: tuple) -> None:
+        """
+        Queue a copy mapping for the background writer.
+        
+        Mappings saved in quick succession share one transaction (and one
+        fsync) instead of committing one by one. Takes the same row as
+        save_copy_mapping_row(); call flush_copy_mappings() to wait for it.
+        In-memory and exclusively locked databases write it immediately.
+        
+        'failed' mappings are also written immediately: a retry can only
+        reclaim the order once the row on disk says 'failed'.
+        
+        Args:
+            row: (leader_order_id, follower_order_id, leader_quantity,
+                follower_quantity, sizing_strategy, capital_ratio, status,
+                error_message)
+        """
+        if self._in_memory or self._exclusive_lock or row[6] == 'failed':
+            self.save_copy_mapping_row(row)
+            return
+        
+        now = int(time.time())
+        self._start_writer()
+        self._audit_q.put(_MappingRow(row + (now, now)))
+    
+    def flush_copy_mappings(self) -> None:
+        """Block until every queued copy mapping has been committed."""
+        self._flush_writer()
+    
+    def claim_copy_mapping(
+        self,
+        leader_order_id: str,
+        leader_quantity: int,
+        leader_order: Optional[LeaderOrder] = None
+    ) -> bool:
+        """
+        Atomically claim a leader order before placing its follower order.
+        
+        The UNIQUE(leader_order_id) constraint makes this the idempotency check:
+        of two concurrent deliveries of the same leader order, only one claims it.
+        A previously failed mapping can be claimed again for a retry. Orders
+        this process already claimed are refused from memory.
+        
+        Args:
+            leader_order_id: Leader order ID
+            leader_quantity: Leader order quantity
+            leader_order: Parsed leader order; when given, a placeholder orders
+                row is saved in the same transaction so the claim's foreign key
+                holds even if the leader order was never stored
+        
+        Returns:
+            True if this caller now owns the mapping, False if it is already
+            pending, placed or cancelled
+        """
+        with self._claimed_lock:
+            if leader_order_id in self._claimed:
+                self._claimed.move_to_end(leader_order_id)
+                return False
+        
+        with self.batch():
+            if leader_order is not None:
+                self.save_order_stub(leader_order_id, ACCOUNT_LEADER, leader_order, leader_quantity)
+            now = self._now()
+            claimed = self.conn.execute(
+                _SQL_CLAIM_COPY_MAPPING, (leader_order_id, leader_quantity, now, now)
+            ).rowcount > 0
+        
+        if claimed:
+            with self._claimed_lock:
+                self._claimed[leader_order_id] = None
+                if len(self._claimed) > _CLAIM_CACHE_SIZE:
+                    self._claimed.popitem(last=False)
+        return claimed
+    
+    def _forget_claim(self, leader_order_id: str) -> None:
+        """Drop a leader order from the claim cache so it can be claimed again."""
+        with self._claimed_lock:
+            self._claimed.pop(leader_order_id, None)
+    
     def get_copy_mapping_by_leader(self, leader_order_id: str) -> Optional[CopyMapping]:
         """
         Get copy mapping by leader order ID.
@@ -457,11 +1118,15 @@ class DatabaseManager:
         Returns:
             CopyMapping object or None
         """
-        cursor = self.conn.execute(
-            "SELECT * FROM copy_mappings WHERE leader_order_id = ?",
-            (leader_order_id,)
-        )
-        row = cursor.fetchone()
+        self.flush_copy_mappings()
+        
+        with self._reader() as conn:
+            cursor = self._row_cursor(
+                conn,
+                "SELECT * FROM copy_mappings WHERE leader_order_id = ?",
+                (leader_order_id,)
+            )
+            row = cursor.fetchone()
         
         if row:
             return CopyMapping(**dict(row))
@@ -479,20 +1144,15 @@ class DatabaseManager:
             follower_order_id: Follower order ID (optional)
             error_message: Error message if failed (optional)
         """
-        if follower_order_id:
-            self.conn.execute("""
-                UPDATE copy_mappings
-                SET status = ?, follower_order_id = ?, error_message = ?, updated_at = ?
-                WHERE leader_order_id = ?
-            """, (status, follower_order_id, error_message, int(time.time()), leader_order_id))
-        else:
-            self.conn.execute("""
-                UPDATE copy_mappings
-                SET status = ?, error_message = ?, updated_at = ?
-                WHERE leader_order_id = ?
-            """, (status, error_message, int(time.time()), leader_order_id))
+        # A queued mapping written after this update would overwrite it
+        self.flush_copy_mappings()
         
-        self.conn.commit()
+        with self._writing() as conn:
+            conn.execute(_SQL_UPDATE_COPY_MAPPING_STATUS, (
+                status, follower_order_id or None, error_message, self._now(), leader_order_id
+            ))
+        if status == 'failed':
+            self._forget_claim(leader_order_id)
         
         logger.debug(f"Updated copy mapping {leader_order_id} status to {status}")
     
@@ -507,30 +1167,23 @@ class DatabaseManager:
         Args:
             trade: Trade object with all fields from Trade Book API
         """
-        self.conn.execute("""
-            INSERT OR REPLACE INTO trades (
-                id, order_id, account_type, exchange_order_id, exchange_trade_id,
-                security_id, exchange_segment, trading_symbol,
-                side, product, order_type,
-                quantity, price, trade_value,
-                trade_ts, created_at, updated_at, exchange_time,
-                drv_expiry_date, drv_option_type, drv_strike_price,
-                raw_data
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            trade.id, trade.order_id, trade.account_type,
-            trade.exchange_order_id, trade.exchange_trade_id,
-            trade.security_id, trade.exchange_segment, trade.trading_symbol,
-            trade.transaction_type, trade.product_type, trade.order_type,
-            trade.quantity, trade.price, trade.quantity * trade.price if trade.quantity and trade.price else None,
-            trade.trade_ts, trade.created_at, trade.updated_at, trade.exchange_time,
-            trade.drv_expiry_date, trade.drv_option_type, trade.drv_strike_price,
-            trade.raw_data
-        ))
-        self.conn.commit()
+        with self._writing() as conn:
+            conn.execute(_SQL_SAVE_TRADE, trade.to_row())
         
         logger.debug(f"Saved trade: {trade.id} for order {trade.order_id}")
     
+    def save_trades(self, trades: List[Trade]) -> None:
+        """
+        Save several trades with one executemany and one commit.
+        
+        Args:
+            trades: Trade objects from the Trade Book API
+        """
+        with self.batch():
+            self.conn.executemany(_SQL_SAVE_TRADE, [trade.to_row() for trade in trades])
+        
+        logger.debug(f"Saved {len(trades)} trades")
+    
     def get_trade_by_id(self, trade_id: str) -> Optional[Trade]:
         """
         Get trade by ID.
@@ -541,14 +1194,15 @@ class DatabaseManager:
         Returns:
             Trade object or None
         """
-        cursor = self.conn.execute("""
-            SELECT * FROM trades WHERE id = ?
-        """, (trade_id,))
-        
-        row = cursor.fetchone()
+        with self._reader() as conn:
+            cursor = conn.execute(f"""
+                SELECT {_TRADE_COLUMNS} FROM trades WHERE id = ?
+            """, (trade_id,))
+            
+            row = cursor.fetchone()
         
         if row:
-            return Trade(**dict(row))
+            return Trade.from_row(row)
         return None
     
     def get_trades_by_order_id(self, order_id: str) -> List[Trade]:
@@ -570,13 +1224,14 @@ class DatabaseManager:
         Returns:
             List of Trade objects ordered by trade_ts (chronological)
         """
-        cursor = self.conn.execute("""
-            SELECT * FROM trades 
-            WHERE order_id = ? 
-            ORDER BY trade_ts
-        """, (order_id,))
-        
-        return [Trade(**dict(row)) for row in cursor.fetchall()]
+        with self._reader() as conn:
+            cursor = conn.execute(f"""
+                SELECT {_TRADE_COLUMNS} FROM trades 
+                WHERE order_id = ? 
+                ORDER BY trade_ts
+            """, (order_id,))
+            
+            return list(map(Trade.from_row, cursor))
     
     def get_trades(
         self,
@@ -601,40 +1256,28 @@ class DatabaseManager:
         Returns:
             List of Trade objects
         """
-        conditions = []
-        params = []
+        # Unset (falsy) filters bind as NULL and are skipped by the static statement
+        from_ts = from_ts or None
+        to_ts = to_ts or None
+        security_id = security_id or None
+        exchange_segment = exchange_segment or None
+        params = (
+            from_ts, from_ts,
+            to_ts, to_ts,
+            security_id, security_id,
+            exchange_segment, exchange_segment,
+            limit or -1
+        )
         
         if account_type:
-            conditions.append("account_type = ?")
-            params.append(account_type)
-        
-        if from_ts:
-            conditions.append("trade_ts >= ?")
-            params.append(from_ts)
-        
-        if to_ts:
-            conditions.append("trade_ts <= ?")
-            params.append(to_ts)
-        
-        if security_id:
-            conditions.append("security_id = ?")
-            params.append(security_id)
-        
-        if exchange_segment:
-            conditions.append("exchange_segment = ?")
-            params.append(exchange_segment)
-        
-        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-        limit_clause = f"LIMIT {limit}" if limit else ""
-        
-        cursor = self.conn.execute(f"""
-            SELECT * FROM trades 
-            {where_clause}
-            ORDER BY trade_ts DESC
-            {limit_clause}
-        """, params)
+            sql, params = _SQL_GET_TRADES_BY_ACCOUNT, (account_type,) + params
+        else:
+            sql = _SQL_GET_TRADES
         
-        return [Trade(**dict(row)) for row in cursor.fetchall()]
+        with self._reader() as conn:
+            cursor = conn.execute(sql, params)
+            
+            return list(map(Trade.from_row, cursor))
     
     def get_trades_summary(
         self,
@@ -653,31 +1296,17 @@ class DatabaseManager:
         Returns:
             Dict with summary statistics
         """
-        conditions = ["account_type = ?"]
-        params = [account_type]
-        
-        if from_ts:
-            conditions.append("trade_ts >= ?")
-            params.append(from_ts)
-        
-        if to_ts:
-            conditions.append("trade_ts <= ?")
-            params.append(to_ts)
-        
-        where_clause = f"WHERE {' AND '.join(conditions)}"
+        from_ts = from_ts or None
+        to_ts = to_ts or None
         
-        cursor = self.conn.execute(f"""
-            SELECT 
-                COUNT(*) as total_trades,
-                SUM(CASE WHEN side = 'BUY' THEN quantity ELSE 0 END) as total_buy_qty,
-                SUM(CASE WHEN side = 'SELL' THEN quantity ELSE 0 END) as total_sell_qty,
-                SUM(trade_value) as total_value,
-                AVG(price) as avg_price
-            FROM trades
-            {where_clause}
-        """, params)
-        
-        row = cursor.fetchone()
+        with self._reader() as conn:
+            cursor = self._row_cursor(conn, _SQL_GET_TRADES_SUMMARY, (
+                account_type,
+                from_ts, from_ts,
+                to_ts, to_ts
+            ))
+            
+            row = cursor.fetchone()
         
         if row:
             return dict(row)
@@ -701,19 +1330,20 @@ class DatabaseManager:
         Args:
             positions: List of Position objects
         """
-        for pos in positions:
-            self.conn.execute("""
-                INSERT OR REPLACE INTO positions (
-                    snapshot_ts, account_type, security_id, exchange_segment,
-                    quantity, avg_price, realized_pl, unrealized_pl, product, raw_data
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        rows = [
+            (
                 pos.snapshot_ts, pos.account_type, pos.security_id,
                 pos.exchange_segment, pos.quantity, pos.avg_price,
                 pos.realized_pl, pos.unrealized_pl, pos.product, pos.raw_data
-            ))
-        
-        self.conn.commit()
+            )
+            for pos in positions
+        ]
+        
+        # Take the WAL write lock up front and insert all rows in one call
+        with self._writing() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(_SQL_SAVE_POSITION, rows)
         logger.debug(f"Saved {len(positions)} positions")
     
     def get_latest_positions(self, account_type: str) -> List[Position]:
@@ -726,12 +1356,13 @@ class DatabaseManager:
         Returns:
             List of Position objects
         """
-        cursor = self.conn.execute("""
-            SELECT * FROM v_latest_positions
-            WHERE account_type = ?
-        """, (account_type,))
-        
-        return [Position(**dict(row)) for row in cursor.fetchall()]
+        with self._reader() as conn:
+            cursor = conn.execute(f"""
+                SELECT {_POSITION_COLUMNS} FROM v_latest_positions
+                WHERE account_type = ?
+            """, (account_type,))
+            
+            return list(map(Position.from_row, cursor))
     
     # =========================================================================
     # Funds Operations
@@ -744,18 +1375,30 @@ class DatabaseManager:
         Args:
             funds: Funds object
         """
-        self.conn.execute("""
-            INSERT OR REPLACE INTO funds (
-                snapshot_ts, account_type, available_balance, collateral, margin_used, raw_data
-            ) VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            funds.snapshot_ts, funds.account_type, funds.available_balance,
-            funds.collateral, funds.margin_used, funds.raw_data
-        ))
-        self.conn.commit()
+        with self._writing() as conn:
+            conn.execute(_SQL_SAVE_FUNDS, (
+                funds.snapshot_ts, funds.account_type, funds.available_balance,
+                funds.collateral, funds.margin_used, funds.raw_data
+            ))
         
         logger.debug(f"Saved funds snapshot for {funds.account_type}")
     
+    def save_funds_batch(self, funds_list: List[Funds]) -> None:
+        """
+        Save multiple funds snapshots in a single transaction.
+        
+        Args:
+            funds_list: List of Funds objects (e.g. leader and follower)
+        """
+        with self.batch():
+            self.conn.executemany(_SQL_SAVE_FUNDS, [
+                (f.snapshot_ts, f.account_type, f.available_balance,
+                 f.collateral, f.margin_used, f.raw_data)
+                for f in funds_list
+            ])
+        
+        logger.debug(f"Saved {len(funds_list)} funds snapshots")
+    
     def get_latest_funds(self, account_type: str) -> Optional[Funds]:
         """
         Get latest funds for an account.
@@ -766,12 +1409,13 @@ class DatabaseManager:
         Returns:
             Funds object or None
         """
-        cursor = self.conn.execute("""
-            SELECT * FROM v_latest_funds
-            WHERE account_type = ?
-        """, (account_type,))
-        
-        row = cursor.fetchone()
+        with self._reader() as conn:
+            cursor = self._row_cursor(conn, """
+                SELECT * FROM v_latest_funds
+                WHERE account_type = ?
+            """, (account_type,))
+            
+            row = cursor.fetchone()
         if row:
             return Funds(**dict(row))
         return None
@@ -787,20 +1431,20 @@ class DatabaseManager:
         Args:
             instrument: Instrument object
         """
-        self.conn.execute("""
-            INSERT OR REPLACE INTO instruments (
-                security_id, exchange_segment, symbol, name, instrument_type,
-                expiry_date, strike_price, option_type, lot_size, tick_size,
-                underlying_security_id, meta, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            instrument.security_id, instrument.exchange_segment, instrument.symbol,
-            instrument.name, instrument.instrument_type, instrument.expiry_date,
-            instrument.strike_price, instrument.option_type, instrument.lot_size,
-            instrument.tick_size, instrument.underlying_security_id, instrument.meta,
-            instrument.updated_at
-        ))
-        self.conn.commit()
+        with self._writing() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO instruments (
+                    security_id, exchange_segment, symbol, name, instrument_type,
+                    expiry_date, strike_price, option_type, lot_size, tick_size,
+                    underlying_security_id, meta, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                instrument.security_id, instrument.exchange_segment, instrument.symbol,
+                instrument.name, instrument.instrument_type, instrument.expiry_date,
+                instrument.strike_price, instrument.option_type, instrument.lot_size,
+                instrument.tick_size, instrument.underlying_security_id, instrument.meta,
+                instrument.updated_at
+            ))
         
         logger.debug(f"Saved instrument: {instrument.symbol} ({instrument.security_id})")
     
@@ -814,11 +1458,13 @@ class DatabaseManager:
         Returns:
             Instrument object or None
         """
-        cursor = self.conn.execute(
-            "SELECT * FROM instruments WHERE security_id = ?",
-            (security_id,)
-        )
-        row = cursor.fetchone()
+        with self._reader() as conn:
+            cursor = self._row_cursor(
+                conn,
+                "SELECT * FROM instruments WHERE security_id = ?",
+                (security_id,)
+            )
+            row = cursor.fetchone()
         
         if row:
             return Instrument(**dict(row))
@@ -834,6 +1480,9 @@ class DatabaseManager:
         """
         Log API interaction to audit trail.
         
+        The row is queued for the background audit writer, so the caller never
+        waits on the commit; use flush_audit() to wait for it to land.
+        
         Args:
             action: API action name
             account_type: 'leader' or 'follower'
@@ -842,20 +1491,257 @@ class DatabaseManager:
             status_code: HTTP status code
             error_message: Error message if applicable
             duration_ms: Request duration in milliseconds
+        
+        The row's ``ts`` is epoch nanoseconds, so entries keep sub-second order.
+        """
+        self._queue_audit_rows([(
+            action, account_type,
+            _dumps(request_data) if request_data else None,
+            _dumps(response_data) if response_data else None,
+            status_code, error_message, duration_ms, time.time_ns()
+        )])
+    
+    def log_audit_many(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Log several API interactions through the background audit writer.
+        
+        Args:
+            entries: Dicts with the log_audit() keyword arguments
+                (action and account_type required, the rest optional)
+        """
+        rows = []
+        append, dumps, now = rows.append, _dumps, time.time_ns  # Hoisted out of the loop
+        for entry in entries:
+            get = entry.get
+            request_data = get('request_data')
+            response_data = get('response_data')
+            append((
+                entry['action'], entry['account_type'],
+                dumps(request_data) if request_data else None,
+                dumps(response_data) if response_data else None,
+                get('status_code'), get('error_message'),
+                get('duration_ms'), now()
+            ))
+        
+        self._queue_audit_rows(rows)
+        logger.debug(f"Queued {len(rows)} audit entries")
+    
+    def flush_audit(self) -> None:
+        """Block until every audit row queued so far has been committed."""
+        self._flush_writer()
+    
+    def _flush_writer(self) -> None:
+        """
+        Block until the background writer has committed everything queued so far.
+        
+        If the writer thread has died, the rows it left queued are written on
+        this thread instead, so a flush never waits forever.
         """
-        request_json = json.dumps(request_data) if request_data else None
-        response_json = json.dumps(response_data) if response_data else None
+        thread = self._audit_thread
+        if thread is None:
+            return
         
-        self.conn.execute("""
-            INSERT INTO audit_log (
-                action, account_type, request_data, response_data,
-                status_code, error_message, duration_ms, ts
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            action, account_type, request_json, response_json,
-            status_code, error_message, duration_ms, int(time.time())
-        ))
-        self.conn.commit()
+        done = threading.Event()
+        self._audit_q.put(done)
+        while not done.wait(_WRITER_WAIT_SLICE):
+            if not thread.is_alive():
+                break
+        
+        # A writer that stopped without a close() clears _audit_thread first
+        if self._audit_thread is not thread or not thread.is_alive():
+            self._write_queued_rows()
+    
+    def _write_queued_rows(self) -> None:
+        """Write rows left on the background writer queue, on the writer connection."""
+        rows: List[tuple] = []
+        mapping_rows: List[tuple] = []
+        waiters: List[threading.Event] = []
+        while True:
+            try:
+                item = self._audit_q.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            elif isinstance(item, _MappingRow):
+                mapping_rows.append(item)
+            elif item is not _AUDIT_STOP:
+                rows.append(item)
+        
+        try:
+            if rows:
+                with self.batch():
+                    self.conn.executemany(_SQL_INSERT_AUDIT, rows)
+            for row in mapping_rows:
+                try:
+                    with self._writing() as conn:
+                        conn.execute(_SQL_SAVE_COPY_MAPPING, row)
+                except sqlite3.Error as e:
+                    logger.error(f"Failed to save copy mapping for {row[0]}: {e}")
+        finally:
+            for waiter in waiters:
+                waiter.set()
+    
+    def purge_audit_log(self, before_ts_ns: int) -> int:
+        """
+        Delete audit entries older than a cutoff and shrink the WAL.
+        
+        Args:
+            before_ts_ns: Cutoff in epoch nanoseconds (same unit as audit_log.ts)
+        
+        Returns:
+            Number of entries deleted
+        """
+        self.flush_audit()
+        with self.batch():
+            deleted = self.conn.execute(_SQL_PURGE_AUDIT, (before_ts_ns,)).rowcount
+        
+        if not self._in_memory:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        
+        logger.info(f"Purged {deleted} audit entries")
+        return deleted
+    
+    def _queue_audit_rows(self, rows: List[tuple]) -> None:
+        """
+        Hand audit rows to the background writer.
+        
+        In-memory and exclusively locked databases cannot be opened by a second
+        connection, so there the rows are written on the writer connection instead.
+        """
+        if self._in_memory or self._exclusive_lock:
+            with self.batch():
+                self.conn.executemany(_SQL_INSERT_AUDIT, rows)
+            return
+        
+        self._start_writer()
+        for row in rows:
+            self._audit_q.put(row)
+    
+    def _start_writer(self) -> None:
+        """Start the background writer thread if it is not running yet."""
+        if self._audit_thread is None:
+            with self._audit_start_lock:
+                if self._audit_thread is None:
+                    self._audit_thread = threading.Thread(
+                        target=self._drain_audit, name="audit-writer", daemon=True
+                    )
+                    self._audit_thread.start()
+    
+    def _drain_audit(self) -> None:
+        """
+        Background writer: commit queued audit and copy mapping rows in batches on its own connection.
+        
+        If the writer fails, the rows it was holding go back on the queue and
+        waiting flushes are released to write them on their own threads.
+        """
+        conn = None
+        rows: List[tuple] = []
+        mapping_rows: List[tuple] = []
+        waiters: List[threading.Event] = []
+        stopping = False
+        try:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self._busy_timeout / 1000,
+                isolation_level=None
+            )
+            conn.execute(f"PRAGMA busy_timeout = {self._busy_timeout}")
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._drain_audit_loop(conn, rows, mapping_rows, waiters)
+            stopping = True
+        except Exception as e:
+            logger.error(f"Background writer stopped: {e}", exc_info=True)
+        finally:
+            if not stopping:
+                with self._audit_start_lock:
+                    self._audit_thread = None
+                for row in rows + mapping_rows:
+                    self._audit_q.put(row)
+            for waiter in waiters:
+                waiter.set()
+            if conn is not None:
+                conn.close()
+    
+    def _drain_audit_loop(
+        self,
+        conn: sqlite3.Connection,
+        rows: List[tuple],
+        mapping_rows: List[tuple],
+        waiters: List[threading.Event]
+    ) -> None:
+        """
+        Run the background writer until close() queues _AUDIT_STOP.
+        
+        Args:
+            conn: The writer thread's connection
+            rows: Audit rows taken off the queue and not yet written
+            mapping_rows: Copy mapping rows taken off the queue and not yet written
+            waiters: Flush events to set once the rows above are written
+        """
+        # Bound once: the loop runs for every queued row
+        get = self._audit_q.get
+        monotonic = time.monotonic
+        execute = conn.execute
+        executemany = conn.executemany
+        Event = threading.Event
+        
+        stopping = False
+        while not stopping:
+            item = get()
+            deadline = monotonic() + _AUDIT_FLUSH_INTERVAL
+            
+            while True:
+                if item is _AUDIT_STOP:
+                    stopping = True
+                elif isinstance(item, Event):
+                    waiters.append(item)
+                elif isinstance(item, _MappingRow):
+                    mapping_rows.append(item)
+                else:
+                    rows.append(item)
+                
+                # A flush or close() request writes what we have right away
+                if stopping or waiters or len(rows) + len(mapping_rows) >= _AUDIT_BATCH_SIZE:
+                    break
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = get(timeout=remaining)
+                except queue.Empty:
+                    break
+            
+            if rows:
+                try:
+                    execute("BEGIN IMMEDIATE")
+                    executemany(_SQL_INSERT_AUDIT, rows)
+                    execute("COMMIT")
+                except sqlite3.Error as e:
+                    if conn.in_transaction:
+                        execute("ROLLBACK")
+                    logger.error(f"Failed to write {len(rows)} audit entries: {e}")
+            
+            if mapping_rows:
+                try:
+                    execute("BEGIN IMMEDIATE")
+                    executemany(_SQL_SAVE_COPY_MAPPING, mapping_rows)
+                    execute("COMMIT")
+                except sqlite3.Error:
+                    if conn.in_transaction:
+                        execute("ROLLBACK")
+                    # Retry one by one so a single bad row does not drop the rest
+                    for row in mapping_rows:
+                        try:
+                            execute(_SQL_SAVE_COPY_MAPPING, row)
+                        except sqlite3.Error as e:
+                            logger.error(f"Failed to save copy mapping for {row[0]}: {e}")
+            
+            rows.clear()
+            mapping_rows.clear()
+            for waiter in waiters:
+                waiter.set()
+            waiters.clear()
     
     # =========================================================================
     # Configuration Operations
@@ -871,11 +1757,28 @@ class DatabaseManager:
         Returns:
             Configuration value or None
         """
-        cursor = self.conn.execute(
-            "SELECT value FROM config WHERE key = ?", (key,)
-        )
-        row = cursor.fetchone()
-        return row['value'] if row else None
+        with self._config_lock:
+            if key in self._config_cache:
+                self._config_cache.move_to_end(key)
+                return self._config_cache[key]
+        
+        with self._reader() as conn:
+            row = conn.execute(_SQL_SELECT_CONFIG, (key,)).fetchone()
+        value = row[0] if row else None
+        
+        if not self._in_batch:  # Uncommitted values are cached by set_config_value only
+            # A set_config_value that landed while we queried wins over what we read
+            self._cache_config_value(key, value, overwrite=False)
+        return value
+    
+    def _cache_config_value(self, key: str, value: Optional[str], overwrite: bool = True) -> None:
+        """Store a config value, evicting the least recently used key when full."""
+        with self._config_lock:
+            if overwrite or key not in self._config_cache:
+                self._config_cache[key] = value
+            self._config_cache.move_to_end(key)
+            if len(self._config_cache) > _CONFIG_CACHE_SIZE:
+                self._config_cache.popitem(last=False)
     
     def set_config_value(self, key: str, value: str, description: Optional[str] = None) -> None:
         """
@@ -884,33 +1787,73 @@ class DatabaseManager:
         Args:
             key: Configuration key
             value: Configuration value
-            description: Optional description
+            description: Optional description (None keeps the stored one)
+        """
+        with self._writing() as conn:
+            if description is None:
+                conn.execute(_SQL_UPSERT_CONFIG_NODESC, (key, value, self._now()))
+            else:
+                conn.execute(_SQL_UPSERT_CONFIG_FULL, (key, value, description, self._now()))
+        self._cache_config_value(key, value)
+    
+    def set_config_value_returning(self, key: str, value: str, description: Optional[str] = None) -> str:
         """
-        self.conn.execute("""
-            INSERT OR REPLACE INTO config (key, value, description, updated_at)
-            VALUES (?, ?, ?, ?)
-        """, (key, value, description, int(time.time())))
-        self.conn.commit()
+        Set configuration value and return what was stored, in one statement.
+        
+        For write-then-read callers; replaces set_config_value() + get_config_value().
+        
+        Args:
+            key: Configuration key
+            value: Configuration value
+            description: Optional description (None keeps the stored one)
+        
+        Returns:
+            Stored configuration value
+        """
+        with self._writing() as conn:
+            if not _HAS_RETURNING:
+                self.set_config_value(key, value, description)
+                stored = conn.execute(_SQL_SELECT_CONFIG, (key,)).fetchone()[0]
+            elif description is None:
+                stored = conn.execute(
+                    _SQL_UPSERT_CONFIG_NODESC_RETURNING, (key, value, self._now())
+                ).fetchone()[0]
+            else:
+                stored = conn.execute(
+                    _SQL_UPSERT_CONFIG_FULL_RETURNING, (key, value, description, self._now())
+                ).fetchone()[0]
+        self._cache_config_value(key, stored)
+        return stored
 
 
-# Global database manager instance
+# Global database manager instance; created once under _init_lock
 _db_manager: Optional[DatabaseManager] = None
+_init_lock = threading.Lock()
 
 
 def init_database() -> DatabaseManager:
     """
     Initialize database (singleton pattern).
     
+    Safe to call from several threads: the manager is built once, and only
+    published after its connection and schema are ready.
+    
     Returns:
         DatabaseManager instance
     """
     global _db_manager
     
     if _db_manager is None:
-        _, _, system_config = get_config()
-        _db_manager = DatabaseManager(system_config.sqlite_path)
-        _db_manager.connect()
-        _db_manager.initialize_schema()
+        with _init_lock:
+            if _db_manager is None:
+                _, _, system_config = get_config()
+                db = DatabaseManager(
+                    system_config.sqlite_path,
+                    exclusive_lock=system_config.sqlite_exclusive_lock
+                )
+                db.connect()
+                db.initialize_schema()
+                _db_manager = db
     
     return _db_manager
 
@@ -929,3 +1872,18 @@ def get_db() -> DatabaseManager:
         raise ValueError("Database not initialized. Call init_database() first.")
     return _db_manager
 
+
+def get_ro():
+    """
+    Check out a pooled read-only connection from the database manager.
+    
+    Use as ``with get_ro() as conn: conn.execute(...)``. Writes go through
+    ``get_db()``, which owns the single writer connection.
+    
+    Returns:
+        Context manager yielding a SQLite connection
+    
+    Raises:
+        ValueError: If database not initialized
+    """
+    return get_db()._reader()
@@ -424,7 +424,7 @@ ALTER TABLE funds ADD COLUMN blocked_margin REAL;
 -- Enhance trades table
 ALTER TABLE trades ADD COLUMN exchange_trade_id TEXT;
 ALTER TABLE trades ADD COLUMN trading_symbol TEXT;
-ALTER TABLE trades ADD COLUMN trade_value REAL;
+ALTER TABLE trades ADD COLUMN trade_value REAL GENERATED ALWAYS AS (CASE WHEN quantity IS NOT NULL AND price IS NOT NULL THEN quantity * price END) VIRTUAL;
 ALTER TABLE trades ADD COLUMN brokerage REAL DEFAULT 0;
 ALTER TABLE trades ADD COLUMN exchange_charges REAL DEFAULT 0;
 ALTER TABLE trades ADD COLUMN clearing_charges REAL DEFAULT 0;
@@ -448,6 +448,7 @@ CREATE INDEX IF NOT EXISTS idx_instruments_trading_symbol ON instruments(trading
 CREATE INDEX IF NOT EXISTS idx_instruments_isin ON instruments(isin);
 CREATE INDEX IF NOT EXISTS idx_trades_exchange ON trades(exchange_order_id);
 CREATE INDEX IF NOT EXISTS idx_audit_module ON audit_log(module, ts);
+CREATE INDEX IF NOT EXISTS idx_audit_ts ON audit_log(ts);  -- Time-range scans and retention purges
 
 -- =============================================================================
 -- 3. UPDATE CONFIGURATION
@@ -455,6 +456,7 @@ CREATE INDEX IF NOT EXISTS idx_audit_module ON audit_log(module, ts);
 
 -- Update schema version
 UPDATE config SET value = '3', updated_at = strftime('%s', 'now') WHERE key = 'schema_version';
+PRAGMA user_version = 3;
 
 -- Add new configuration entries
 INSERT OR IGNORE INTO config (key, value, data_type, category, description, updated_at) VALUES
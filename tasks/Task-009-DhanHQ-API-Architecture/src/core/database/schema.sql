@@ -38,9 +38,12 @@ CREATE TABLE IF NOT EXISTS orders (
     CHECK (account_type IN ('leader', 'follower'))
 );
 
-CREATE INDEX IF NOT EXISTS idx_orders_correlation ON orders(correlation_id);
+DROP INDEX IF EXISTS idx_orders_correlation;  -- superseded by idx_orders_correlation_created
+CREATE INDEX IF NOT EXISTS idx_orders_correlation_created ON orders(correlation_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_orders_account ON orders(account_type, created_at);
 CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status);
+-- Partial index over working orders only; predicate matches v_active_orders
+CREATE INDEX IF NOT EXISTS idx_orders_open ON orders(account_type, created_at) WHERE status IN ('PENDING', 'OPEN');
 CREATE INDEX IF NOT EXISTS idx_orders_security ON orders(security_id, exchange_segment);
 
 -- Order events: Track order lifecycle events
@@ -75,6 +78,7 @@ CREATE TABLE IF NOT EXISTS trades (
 
 CREATE INDEX IF NOT EXISTS idx_trades_order ON trades(order_id);
 CREATE INDEX IF NOT EXISTS idx_trades_account_ts ON trades(account_type, trade_ts);
+CREATE INDEX IF NOT EXISTS idx_trades_ts ON trades(trade_ts);  -- Ordered scan for unfiltered get_trades
 CREATE INDEX IF NOT EXISTS idx_trades_security ON trades(security_id, exchange_segment);
 
 -- Positions: Periodic snapshots of positions
@@ -164,12 +168,13 @@ CREATE TABLE IF NOT EXISTS audit_log (
     status_code INTEGER,
     error_message TEXT,
     duration_ms INTEGER,
-    ts INTEGER NOT NULL,
+    ts INTEGER NOT NULL,                   -- Epoch nanoseconds (time.time_ns)
     CHECK (account_type IN ('leader', 'follower'))
 );
 
 CREATE INDEX IF NOT EXISTS idx_audit_action_ts ON audit_log(action, ts);
 CREATE INDEX IF NOT EXISTS idx_audit_account ON audit_log(account_type, ts);
+CREATE INDEX IF NOT EXISTS idx_audit_ts ON audit_log(ts);  -- Time-range scans and retention purges
 
 -- Configuration: System configuration and state
 CREATE TABLE IF NOT EXISTS config (
@@ -43,6 +43,7 @@ CREATE INDEX IF NOT EXISTS idx_bo_legs_type ON bracket_order_legs(leg_type, stat
 
 -- Update schema version
 UPDATE config SET value = '2', updated_at = strftime('%s', 'now') WHERE key = 'schema_version';
+PRAGMA user_version = 2;
 
 -- Add CO/BO specific config
 INSERT OR IGNORE INTO config (key, value, description, updated_at) VALUES
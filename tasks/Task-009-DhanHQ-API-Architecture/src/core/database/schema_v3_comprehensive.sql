@@ -168,9 +168,12 @@ CREATE TABLE IF NOT EXISTS orders (
     CHECK (after_market_order IN (0, 1))
 );
 
-CREATE INDEX IF NOT EXISTS idx_orders_correlation ON orders(correlation_id);
+DROP INDEX IF EXISTS idx_orders_correlation;  -- superseded by idx_orders_correlation_created
+CREATE INDEX IF NOT EXISTS idx_orders_correlation_created ON orders(correlation_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_orders_account ON orders(account_type, created_at);
 CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status);
+-- Partial index over working orders only; predicate matches v_active_orders
+CREATE INDEX IF NOT EXISTS idx_orders_open ON orders(account_type, created_at) WHERE status IN ('PENDING', 'TRANSIT', 'OPEN', 'PARTIAL');
 CREATE INDEX IF NOT EXISTS idx_orders_security ON orders(security_id, exchange_segment);
 CREATE INDEX IF NOT EXISTS idx_orders_parent ON orders(parent_order_id);
 CREATE INDEX IF NOT EXISTS idx_orders_leg_type ON orders(leg_type);
@@ -601,7 +604,7 @@ CREATE TABLE IF NOT EXISTS trades (
     -- Quantity and pricing
     quantity INTEGER NOT NULL,             -- tradedQuantity
     price REAL NOT NULL,                   -- tradedPrice
-    trade_value REAL,                      -- Trade value (qty * price)
+    trade_value REAL GENERATED ALWAYS AS (CASE WHEN quantity IS NOT NULL AND price IS NOT NULL THEN quantity * price END) VIRTUAL,  -- Trade value (qty * price)
     
     -- Charges (not in API response, for local calculation)
     brokerage REAL DEFAULT 0,
@@ -636,6 +639,7 @@ CREATE TABLE IF NOT EXISTS trades (
 
 CREATE INDEX IF NOT EXISTS idx_trades_order ON trades(order_id);
 CREATE INDEX IF NOT EXISTS idx_trades_account_ts ON trades(account_type, trade_ts);
+CREATE INDEX IF NOT EXISTS idx_trades_ts ON trades(trade_ts);  -- Ordered scan for unfiltered get_trades
 CREATE INDEX IF NOT EXISTS idx_trades_security ON trades(security_id, exchange_segment);
 CREATE INDEX IF NOT EXISTS idx_trades_exchange ON trades(exchange_order_id);
 CREATE INDEX IF NOT EXISTS idx_trades_exchange_trade ON trades(exchange_trade_id);
@@ -837,13 +841,14 @@ CREATE TABLE IF NOT EXISTS audit_log (
     status_code INTEGER,
     error_message TEXT,
     duration_ms INTEGER,
-    ts INTEGER NOT NULL,
+    ts INTEGER NOT NULL,                   -- Epoch nanoseconds (time.time_ns)
     CHECK (account_type IN ('leader', 'follower'))
 );
 
 CREATE INDEX IF NOT EXISTS idx_audit_action_ts ON audit_log(action, ts);
 CREATE INDEX IF NOT EXISTS idx_audit_account ON audit_log(account_type, ts);
 CREATE INDEX IF NOT EXISTS idx_audit_module ON audit_log(module, ts);
+CREATE INDEX IF NOT EXISTS idx_audit_ts ON audit_log(ts);  -- Time-range scans and retention purges
 
 -- Error log: Track errors and exceptions
 CREATE TABLE IF NOT EXISTS error_log (
@@ -898,6 +903,8 @@ INSERT OR REPLACE INTO config (key, value, data_type, category, description, upd
     -- Postback
     ('postback_enabled', 'false', 'boolean', 'postback', 'Postback webhook enabled', strftime('%s', 'now'));
 
+PRAGMA user_version = 3;
+
 -- =============================================================================
 -- VIEWS FOR CONVENIENCE
 -- =============================================================================
@@ -4,12 +4,158 @@ Data models for database entities.
 Core business logic data structures. Does NOT include DhanHQ API-specific code.
 """
 
-from dataclasses import dataclass
-from typing import Optional, Literal
+import json
+import sys
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Literal
 
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the batch analytics helpers
+    np = None
 
-@dataclass
-class Order:
+try:
+    import orjson
+except ImportError:  # orjson is optional; to_json() falls back to the standard library
+    orjson = None
+
+
+# Interned account types so equality checks across modules hit the identity fast path
+ACCOUNT_LEADER = sys.intern('leader')
+ACCOUNT_FOLLOWER = sys.intern('follower')
+
+# Hot-path models are slotted on Python 3.10+ so construction skips the per-instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _to_dict_method(keys):
+    """
+    Generate a ``to_dict`` whose body is one straight-line dict literal over ``keys``.
+    
+    Compiled once at import; a literal of ``self.<key>`` loads beats zipping an
+    attrgetter tuple back into a dict on CPython 3.11+.
+    """
+    items = ''.join(f"        {key!r}: self.{key},\n" for key in keys)
+    source = f"def to_dict(self) -> dict:\n    return {{\n{items}    }}\n"
+    namespace = {}
+    exec(compile(source, "<generated to_dict>", 'exec'), namespace)
+    to_dict = namespace['to_dict']
+    to_dict.__doc__ = "Convert to dictionary."
+    return to_dict
+
+
+def _to_json(self) -> str:
+    """Serialize to a JSON string (orjson encodes the dataclass fields directly, in C)."""
+    if orjson is not None:
+        return orjson.dumps(self).decode()
+    return json.dumps(self.to_dict())
+
+
+def _intern_post_init(names):
+    """
+    Generate a ``__post_init__`` that interns low-cardinality string fields.
+    
+    Straight-line attribute loads and stores, compiled once at import, so the
+    per-instance cost stays well below a getattr/setattr loop.
+    """
+    body = ''.join(
+        f"    value = self.{name}\n"
+        f"    if value.__class__ is str:\n"
+        f"        self.{name} = _intern(value)\n"
+        for name in names
+    )
+    source = f"def __post_init__(self) -> None:\n{body}"
+    namespace = {'_intern': sys.intern}
+    exec(compile(source, "<generated __post_init__>", 'exec'), namespace)
+    return namespace['__post_init__']
+
+
+# Enum-like string fields interned on construction (from API payloads and DB rows)
+_ORDER_INTERNED = (
+    'account_type', 'status', 'side', 'product', 'order_type', 'validity',
+    'exchange_segment', 'leg_type'
+)
+_TRADE_INTERNED = ('account_type', 'exchange_segment', 'transaction_type', 'product_type', 'order_type')
+_POSITION_INTERNED = ('account_type', 'exchange_segment', 'product')
+
+
+# INSERT column order for orders: every column except the two trailing boolean flags
+_ORDER_ROW = attrgetter(
+    'id', 'account_type', 'correlation_id', 'status', 'order_status', 'side', 'product', 'order_type',
+    'validity', 'security_id', 'exchange_segment', 'trading_symbol', 'quantity', 'price', 'trigger_price',
+    'disclosed_qty', 'traded_qty', 'remaining_qty', 'avg_price', 'exchange_order_id', 'exchange_time',
+    'algo_id', 'drv_expiry_date', 'drv_option_type', 'drv_strike_price',
+    'oms_error_code', 'oms_error_description',
+    'co_stop_loss_value', 'co_trigger_price', 'bo_profit_value',
+    'bo_stop_loss_value', 'bo_order_type', 'parent_order_id', 'leg_type',
+    'amo_time', 'slice_order_id', 'slice_index', 'total_slice_quantity',
+    'created_at', 'updated_at', 'completed_at', 'raw_request', 'raw_response'
+)
+
+_TRADE_ROW = attrgetter(
+    'id', 'order_id', 'account_type', 'exchange_order_id', 'exchange_trade_id',
+    'security_id', 'exchange_segment', 'trading_symbol',
+    'transaction_type', 'product_type', 'order_type',
+    'quantity', 'price',
+    'trade_ts', 'created_at', 'updated_at', 'exchange_time',
+    'drv_expiry_date', 'drv_option_type', 'drv_strike_price',
+    'raw_data'
+)
+
+
+class _ArrayConvertible:
+    """Struct-of-arrays conversion for batch analytics (P&L, reconciliation).
+    
+    Fields listed in ``_NUMPY_DTYPES`` become typed arrays; every other field
+    (strings and Optional values) becomes an object array so round-trips are exact.
+    """
+    __slots__ = ()
+    _NUMPY_DTYPES = {}
+    
+    @classmethod
+    def to_numpy(cls, items: List) -> Dict[str, "np.ndarray"]:
+        """
+        Convert a list of instances into a dict of column arrays.
+        
+        Args:
+            items: Instances of this class
+            
+        Returns:
+            Mapping of field name to numpy array
+        """
+        if np is None:
+            raise ImportError("numpy is required for to_numpy(); install it with 'pip install numpy'")
+        
+        count = len(items)
+        arrays = {}
+        for field in fields(cls):
+            name = field.name
+            dtype = cls._NUMPY_DTYPES.get(name)
+            if dtype is not None:
+                arrays[name] = np.fromiter((getattr(item, name) for item in items), dtype, count)
+            else:
+                arrays[name] = np.array([getattr(item, name) for item in items], dtype=object)
+        return arrays
+    
+    @classmethod
+    def from_numpy(cls, **arrays) -> List:
+        """
+        Build instances from column arrays (inverse of ``to_numpy``).
+        
+        Args:
+            **arrays: Field name to numpy array; omitted fields use their defaults
+            
+        Returns:
+            List of instances
+        """
+        names = list(arrays)
+        columns = [arrays[name].tolist() for name in names]
+        return [cls(**dict(zip(names, row))) for row in zip(*columns)]
+
+
+@dataclass(**_SLOTS)
+class Order(_ArrayConvertible):
     """Represents an order in the database."""
     id: str  # DhanHQ orderId
     account_type: Literal['leader', 'follower']
@@ -65,58 +211,42 @@ class Order:
     slice_index: Optional[int] = None  # Order number within slice (1, 2, 3, etc.)
     total_slice_quantity: Optional[int] = None  # Original total quantity before slicing
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
-            'id': self.id,
-            'account_type': self.account_type,
-            'correlation_id': self.correlation_id,
-            'status': self.status,
-            'order_status': self.order_status,
-            'side': self.side,
-            'product': self.product,
-            'order_type': self.order_type,
-            'validity': self.validity,
-            'security_id': self.security_id,
-            'exchange_segment': self.exchange_segment,
-            'quantity': self.quantity,
-            'price': self.price,
-            'trigger_price': self.trigger_price,
-            'disclosed_qty': self.disclosed_qty,
-            'traded_qty': self.traded_qty,
-            'remaining_qty': self.remaining_qty,
-            'avg_price': self.avg_price,
-            'exchange_order_id': self.exchange_order_id,
-            'exchange_time': self.exchange_time,
-            'completed_at': self.completed_at,
-            'trading_symbol': self.trading_symbol,
-            'algo_id': self.algo_id,
-            'drv_expiry_date': self.drv_expiry_date,
-            'drv_option_type': self.drv_option_type,
-            'drv_strike_price': self.drv_strike_price,
-            'oms_error_code': self.oms_error_code,
-            'oms_error_description': self.oms_error_description,
-            'co_stop_loss_value': self.co_stop_loss_value,
-            'co_trigger_price': self.co_trigger_price,
-            'bo_profit_value': self.bo_profit_value,
-            'bo_stop_loss_value': self.bo_stop_loss_value,
-            'bo_order_type': self.bo_order_type,
-            'parent_order_id': self.parent_order_id,
-            'leg_type': self.leg_type,
-            'after_market_order': self.after_market_order,
-            'amo_time': self.amo_time,
-            'is_sliced_order': self.is_sliced_order,
-            'slice_order_id': self.slice_order_id,
-            'slice_index': self.slice_index,
-            'total_slice_quantity': self.total_slice_quantity,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at,
-            'raw_request': self.raw_request,
-            'raw_response': self.raw_response
-        }
-
-
-@dataclass
+    _NUMPY_DTYPES = {
+        'quantity': 'int64',
+        'traded_qty': 'int64',
+        'created_at': 'int64',
+        'updated_at': 'int64',
+    }
+    
+    __post_init__ = _intern_post_init(_ORDER_INTERNED)
+    
+    @classmethod
+    def from_row(cls, row) -> "Order":
+        """Build from a plain row tuple whose columns follow field order."""
+        return cls(*row)
+    
+    def to_row(self) -> tuple:
+        """Values in ``save_order`` INSERT column order; the two flags are stored as 0/1."""
+        return _ORDER_ROW(self) + (
+            1 if self.after_market_order else 0,
+            1 if self.is_sliced_order else 0
+        )
+    
+    to_dict = _to_dict_method((
+        'id', 'account_type', 'correlation_id', 'status', 'order_status', 'side', 'product',
+        'order_type', 'validity', 'security_id', 'exchange_segment', 'quantity', 'price',
+        'trigger_price', 'disclosed_qty', 'traded_qty', 'remaining_qty', 'avg_price',
+        'exchange_order_id', 'exchange_time', 'completed_at', 'trading_symbol', 'algo_id',
+        'drv_expiry_date', 'drv_option_type', 'drv_strike_price', 'oms_error_code',
+        'oms_error_description', 'co_stop_loss_value', 'co_trigger_price', 'bo_profit_value',
+        'bo_stop_loss_value', 'bo_order_type', 'parent_order_id', 'leg_type',
+        'after_market_order', 'amo_time', 'is_sliced_order', 'slice_order_id', 'slice_index',
+        'total_slice_quantity', 'created_at', 'updated_at', 'raw_request', 'raw_response'
+    ))
+    to_json = _to_json
+
+
+@dataclass(**_SLOTS)
 class OrderEvent:
     """Represents an order lifecycle event."""
     order_id: str
@@ -126,20 +256,19 @@ class OrderEvent:
     sequence: Optional[int] = None
     id: Optional[int] = None
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
-            'id': self.id,
-            'order_id': self.order_id,
-            'event_type': self.event_type,
-            'event_data': self.event_data,
-            'event_ts': self.event_ts,
-            'sequence': self.sequence
-        }
+    @classmethod
+    def from_row(cls, row) -> "OrderEvent":
+        """Build from a plain row tuple whose columns follow field order."""
+        return cls(*row)
+    
+    to_dict = _to_dict_method((
+        'id', 'order_id', 'event_type', 'event_data', 'event_ts', 'sequence'
+    ))
+    to_json = _to_json
 
 
-@dataclass
-class Trade:
+@dataclass(**_SLOTS)
+class Trade(_ArrayConvertible):
     """
     Represents a trade execution from DhanHQ Trade Book API.
     
@@ -183,35 +312,36 @@ class Trade:
     # Raw data
     raw_data: Optional[str] = None  # JSON
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
-            'id': self.id,
-            'order_id': self.order_id,
-            'account_type': self.account_type,
-            'exchange_order_id': self.exchange_order_id,
-            'exchange_trade_id': self.exchange_trade_id,
-            'security_id': self.security_id,
-            'exchange_segment': self.exchange_segment,
-            'trading_symbol': self.trading_symbol,
-            'transaction_type': self.transaction_type,
-            'product_type': self.product_type,
-            'order_type': self.order_type,
-            'quantity': self.quantity,
-            'price': self.price,
-            'trade_ts': self.trade_ts,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at,
-            'exchange_time': self.exchange_time,
-            'drv_expiry_date': self.drv_expiry_date,
-            'drv_option_type': self.drv_option_type,
-            'drv_strike_price': self.drv_strike_price,
-            'raw_data': self.raw_data
-        }
-
-
-@dataclass
-class Position:
+    _NUMPY_DTYPES = {
+        'quantity': 'int64',
+        'price': 'float64',
+        'trade_ts': 'int64',
+        'created_at': 'int64',
+    }
+    
+    __post_init__ = _intern_post_init(_TRADE_INTERNED)
+    
+    @classmethod
+    def from_row(cls, row) -> "Trade":
+        """Build from a plain row tuple whose columns follow field order."""
+        return cls(*row)
+    
+    def to_row(self) -> tuple:
+        """Values in ``save_trade`` INSERT column order (which is field order)."""
+        return _TRADE_ROW(self)
+    
+    to_dict = _to_dict_method((
+        'id', 'order_id', 'account_type', 'exchange_order_id', 'exchange_trade_id',
+        'security_id', 'exchange_segment', 'trading_symbol', 'transaction_type',
+        'product_type', 'order_type', 'quantity', 'price', 'trade_ts', 'created_at',
+        'updated_at', 'exchange_time', 'drv_expiry_date', 'drv_option_type',
+        'drv_strike_price', 'raw_data'
+    ))
+    to_json = _to_json
+
+
+@dataclass(**_SLOTS)
+class Position(_ArrayConvertible):
     """Represents a position snapshot."""
     snapshot_ts: int
     account_type: Literal['leader', 'follower']
@@ -224,23 +354,27 @@ class Position:
     product: Optional[str] = None
     raw_data: Optional[str] = None
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
-            'snapshot_ts': self.snapshot_ts,
-            'account_type': self.account_type,
-            'security_id': self.security_id,
-            'exchange_segment': self.exchange_segment,
-            'quantity': self.quantity,
-            'avg_price': self.avg_price,
-            'realized_pl': self.realized_pl,
-            'unrealized_pl': self.unrealized_pl,
-            'product': self.product,
-            'raw_data': self.raw_data
-        }
-
-
-@dataclass
+    _NUMPY_DTYPES = {
+        'snapshot_ts': 'int64',
+        'quantity': 'int64',
+        'avg_price': 'float64',
+    }
+    
+    __post_init__ = _intern_post_init(_POSITION_INTERNED)
+    
+    @classmethod
+    def from_row(cls, row) -> "Position":
+        """Build from a plain row tuple whose columns follow field order."""
+        return cls(*row)
+    
+    to_dict = _to_dict_method((
+        'snapshot_ts', 'account_type', 'security_id', 'exchange_segment', 'quantity',
+        'avg_price', 'realized_pl', 'unrealized_pl', 'product', 'raw_data'
+    ))
+    to_json = _to_json
+
+
+@dataclass(**_SLOTS)
 class Funds:
     """Represents fund limits snapshot."""
     snapshot_ts: int
@@ -250,19 +384,14 @@ class Funds:
     margin_used: Optional[float] = None
     raw_data: Optional[str] = None
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
-            'snapshot_ts': self.snapshot_ts,
-            'account_type': self.account_type,
-            'available_balance': self.available_balance,
-            'collateral': self.collateral,
-            'margin_used': self.margin_used,
-            'raw_data': self.raw_data
-        }
+    to_dict = _to_dict_method((
+        'snapshot_ts', 'account_type', 'available_balance', 'collateral', 'margin_used',
+        'raw_data'
+    ))
+    to_json = _to_json
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Instrument:
     """Represents instrument metadata."""
     security_id: str
@@ -279,23 +408,12 @@ class Instrument:
     underlying_security_id: Optional[str] = None
     meta: Optional[str] = None
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
-            'security_id': self.security_id,
-            'exchange_segment': self.exchange_segment,
-            'symbol': self.symbol,
-            'name': self.name,
-            'instrument_type': self.instrument_type,
-            'expiry_date': self.expiry_date,
-            'strike_price': self.strike_price,
-            'option_type': self.option_type,
-            'lot_size': self.lot_size,
-            'tick_size': self.tick_size,
-            'underlying_security_id': self.underlying_security_id,
-            'meta': self.meta,
-            'updated_at': self.updated_at
-        }
+    to_dict = _to_dict_method((
+        'security_id', 'exchange_segment', 'symbol', 'name', 'instrument_type', 'expiry_date',
+        'strike_price', 'option_type', 'lot_size', 'tick_size', 'underlying_security_id',
+        'meta', 'updated_at'
+    ))
+    to_json = _to_json
     
     def is_option(self) -> bool:
         """Check if instrument is an option."""
@@ -306,7 +424,7 @@ class Instrument:
         return self.instrument_type in ('FUTIDX', 'FUTSTK')
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CopyMapping:
     """Represents a mapping between leader and follower orders."""
     leader_order_id: str
@@ -321,24 +439,15 @@ class CopyMapping:
     capital_ratio: Optional[float] = None
     error_message: Optional[str] = None
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
-            'id': self.id,
-            'leader_order_id': self.leader_order_id,
-            'follower_order_id': self.follower_order_id,
-            'leader_quantity': self.leader_quantity,
-            'follower_quantity': self.follower_quantity,
-            'sizing_strategy': self.sizing_strategy,
-            'capital_ratio': self.capital_ratio,
-            'status': self.status,
-            'error_message': self.error_message,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at
-        }
-
-
-@dataclass
+    to_dict = _to_dict_method((
+        'id', 'leader_order_id', 'follower_order_id', 'leader_quantity', 'follower_quantity',
+        'sizing_strategy', 'capital_ratio', 'status', 'error_message', 'created_at',
+        'updated_at'
+    ))
+    to_json = _to_json
+
+
+@dataclass(**_SLOTS)
 class BracketOrderLeg:
     """
     Represents a bracket order leg relationship.
@@ -353,16 +462,65 @@ class BracketOrderLeg:
     updated_at: int
     id: Optional[int] = None
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
-            'id': self.id,
-            'parent_order_id': self.parent_order_id,
-            'leg_order_id': self.leg_order_id,
-            'leg_type': self.leg_type,
-            'account_type': self.account_type,
-            'status': self.status,
-            'created_at': self.created_at,
-            'updated_at': self.updated_at
-        }
+    to_dict = _to_dict_method((
+        'id', 'parent_order_id', 'leg_order_id', 'leg_type', 'account_type', 'status',
+        'created_at', 'updated_at'
+    ))
+    to_json = _to_json
 
+
+@dataclass(frozen=True, **_SLOTS)
+class LeaderOrder:
+    """
+    Leader order fields the replicator uses, parsed once from the WebSocket/API payload.
+    
+    Required fields are Optional here so a malformed payload can still be
+    parsed and then rejected by the replicator's validation.
+    """
+    order_id: Optional[str]
+    security_id: Optional[str]
+    exchange_segment: Optional[str]
+    transaction_type: Optional[str]
+    quantity: Optional[int]
+    product_type: Optional[str] = None
+    order_type: Optional[str] = None
+    price: Optional[float] = 0
+    trigger_price: Optional[float] = None
+    validity: Optional[str] = 'DAY'
+    disclosed_quantity: Optional[int] = None
+    after_market_order: bool = False
+    amo_time: Optional[str] = None
+    co_stop_loss_value: Optional[float] = None
+    bo_stop_loss_value: Optional[float] = None
+    bo_profit_value: Optional[float] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LeaderOrder":
+        """Build from a DhanHQ order payload (camelCase keys; unknown keys are ignored)."""
+        get = data.get
+        return cls(
+            order_id=get('orderId') or get('dhanOrderId'),
+            security_id=get('securityId'),
+            exchange_segment=get('exchangeSegment'),
+            transaction_type=get('transactionType'),
+            quantity=get('quantity'),
+            product_type=get('productType'),
+            order_type=get('orderType'),
+            price=get('price', 0),
+            trigger_price=get('triggerPrice'),
+            validity=get('validity', 'DAY'),
+            disclosed_quantity=get('disclosedQuantity'),
+            after_market_order=get('afterMarketOrder', False),
+            amo_time=get('amoTime'),
+            co_stop_loss_value=get('stopLossValue') or get('coStopLossValue'),
+            bo_stop_loss_value=get('boStopLossValue'),
+            bo_profit_value=get('boProfitValue')
+        )
+    
+    to_dict = _to_dict_method((
+        'order_id', 'security_id', 'exchange_segment', 'transaction_type', 'quantity',
+        'product_type', 'order_type', 'price', 'trigger_price', 'validity',
+        'disclosed_quantity', 'after_market_order', 'amo_time', 'co_stop_loss_value',
+        'bo_stop_loss_value', 'bo_profit_value'
+    ))
+    to_json = _to_json
@@ -6,16 +6,35 @@ Integrates position sizing, margin validation, and order placement.
 """
 
 import logging
-import time
-from typing import Dict, Any, Optional
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Union
 
 from .config import get_config
 from .database import DatabaseManager
 from .position_sizer import PositionSizer
-from .models import Order, CopyMapping
+from .models import ACCOUNT_FOLLOWER, LeaderOrder, Order
 
 logger = logging.getLogger(__name__)
 
+# Follower orders from one replicate_orders() call placed concurrently, at most this many at once
+_MAX_PARALLEL_PLACEMENTS = 8
+
+
+@dataclass
+class _Replication:
+    """One leader order on its way through replicate_orders()."""
+    order: LeaderOrder
+    leader_order_id: str
+    leader_quantity: int
+    follower_quantity: int = 0
+    follower_disclosed_qty: Optional[int] = None
+    follower_order_id: Optional[str] = None
+    error: Optional[str] = None
+    reserved_margin: float = 0.0  # Held in the position sizer's ledger until placed
+    pending: bool = False  # Passed its checks, not yet placed
+
 
 class OrderReplicator:
     """
@@ -48,313 +67,387 @@ class OrderReplicator:
         self.position_sizer = position_sizer
         self.db = db
         
+        # Placement helper by product type; everything else is a basic order
+        self._placers = {
+            'CO': self._place_cover_order,
+            'BO': self._place_bracket_order,
+        }
+        
         _, _, self.system_config = get_config()
         
         logger.info("Order replicator initialized")
     
-    def replicate_order(self, leader_order_data: Dict[str, Any]) -> Optional[str]:
+    def replicate_order(self, leader_order_data: Union[LeaderOrder, Dict[str, Any]]) -> Optional[str]:
         """
         Replicate a leader order to follower account.
         
         Args:
-            leader_order_data: Leader order details from WebSocket or API
+            leader_order_data: Parsed leader order, or its raw WebSocket/API payload
         
         Returns:
             Follower order ID if successful, None otherwise
         """
-        try:
-            # Extract order details
-            leader_order_id = leader_order_data.get('orderId') or leader_order_data.get('dhanOrderId')
-            security_id = leader_order_data.get('securityId')
-            exchange_segment = leader_order_data.get('exchangeSegment')
-            transaction_type = leader_order_data.get('transactionType')
-            quantity = leader_order_data.get('quantity')
-            order_type = leader_order_data.get('orderType')
-            product_type = leader_order_data.get('productType')
-            price = leader_order_data.get('price', 0)
-            trigger_price = leader_order_data.get('triggerPrice')
-            validity = leader_order_data.get('validity', 'DAY')
-            disclosed_qty = leader_order_data.get('disclosedQuantity')
-            
-            # Validate required fields
-            if not all([leader_order_id, security_id, exchange_segment, transaction_type, quantity]):
-                logger.error("Missing required order fields", extra={"order": leader_order_data})
-                return None
+        return self.replicate_orders([leader_order_data])[0]
+    
+    def replicate_orders(
+        self,
+        leader_orders: List[Union[LeaderOrder, Dict[str, Any]]]
+    ) -> List[Optional[str]]:
+        """
+        Replicate a burst of leader orders to follower account.
+        
+        Sizing and margin checks run in-process first, against cached funds and a
+        local margin ledger; the follower orders are then placed concurrently
+        (DhanHQ has no multi-order endpoint), one lane per security so orders on
+        the same instrument keep their sequence. A burst costs about one round
+        trip instead of one per order. Copy mappings are queued for the database's
+        background writer, which commits them in batches.
+        
+        Args:
+            leader_orders: Parsed leader orders, or their raw WebSocket/API payloads
+        
+        Returns:
+            Follower order ID (or None) for each leader order, in input order
+        """
+        # Size the whole burst, and record its capital ratio, against one funds snapshot
+        replications: List[Optional[_Replication]] = []
+        with self.position_sizer.use_snapshot():
+            for leader_order_data in leader_orders:
+                try:
+                    replications.append(self._plan_replication(leader_order_data))
+                except Exception as e:
+                    logger.error("Error replicating order", exc_info=True, extra={
+                        "error": str(e),
+                        "order": leader_order_data
+                    })
+                    replications.append(None)
             
-            logger.info(f"Replicating order: {leader_order_id}", extra={
+            to_save = [r for r in replications if r is not None]
+            capital_ratio = self._capital_ratio() if to_save else None
+        
+        # Place every order that passed its checks. Orders on different securities
+        # commute and go out concurrently; orders on the same security keep leader order
+        lanes: Dict[str, List[_Replication]] = {}
+        for replication in replications:
+            if replication is not None and replication.pending:
+                lanes.setdefault(replication.order.security_id, []).append(replication)
+        
+        if len(lanes) == 1:
+            self._place_in_order(next(iter(lanes.values())))
+        elif lanes:
+            workers = min(len(lanes), _MAX_PARALLEL_PLACEMENTS)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="replicate") as pool:
+                list(pool.map(self._place_in_order, lanes.values()))
+        
+        # Queue placed and failed mappings; the background writer commits mappings
+        # from back-to-back replications in one transaction
+        for replication in to_save:
+            try:
+                self._save_replication(replication, capital_ratio)
+            except Exception as e:
+                logger.error("Error saving copy mapping", exc_info=True, extra={
+                    "error": str(e),
+                    "leader_order_id": replication.leader_order_id
+                })
+        
+        # Skip building the per-order extra dicts when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            for replication in to_save:
+                if replication.follower_order_id:
+                    logger.info("✅ Order replicated successfully", extra={
+                        "leader_order_id": replication.leader_order_id,
+                        "follower_order_id": replication.follower_order_id,
+                        "leader_qty": replication.leader_quantity,
+                        "follower_qty": replication.follower_quantity
+                    })
+        
+        return [r.follower_order_id if r is not None else None for r in replications]
+    
+    def _plan_replication(
+        self,
+        leader_order_data: Union[LeaderOrder, Dict[str, Any]]
+    ) -> Optional["_Replication"]:
+        """
+        Size and validate one leader order without placing it.
+        
+        Args:
+            leader_order_data: Parsed leader order, or its raw WebSocket/API payload
+        
+        Returns:
+            Replication to place (or record as failed), or None if the order is
+            missing required fields or another delivery already claimed it
+        """
+        if isinstance(leader_order_data, LeaderOrder):
+            order = leader_order_data
+        else:
+            order = LeaderOrder.from_dict(leader_order_data)
+        
+        leader_order_id = order.order_id
+        security_id = order.security_id
+        quantity = order.quantity
+        price = order.price
+        
+        # Validate required fields
+        if not (leader_order_id and security_id and order.exchange_segment
+                and order.transaction_type and quantity):
+            logger.error("Missing required order fields", extra={"order": leader_order_data})
+            return None
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Replicating order: %s", leader_order_id, extra={
                 "security_id": security_id,
-                "side": transaction_type,
+                "side": order.transaction_type,
                 "quantity": quantity,
-                "product": product_type
+                "product": order.product_type
             })
-            
-            # Check if already replicated
-            existing_mapping = self.db.get_copy_mapping_by_leader(leader_order_id)
-            if existing_mapping and existing_mapping.status == 'placed':
-                logger.info(f"Order {leader_order_id} already replicated")
-                return existing_mapping.follower_order_id
-            
+        
+        # Claim the leader order; a duplicate delivery (replay, retry) loses here.
+        # Without a claim there is no idempotency, so a failed claim skips the order
+        try:
+            claimed = self.db.claim_copy_mapping(leader_order_id, quantity, leader_order=order)
+        except sqlite3.Error as e:
+            logger.error("Could not claim order %s, not replicating: %s", leader_order_id, e)
+            return None
+        
+        if not claimed:
+            logger.info("Order %s already replicated or in progress", leader_order_id)
+            return None
+        
+        replication = _Replication(order, leader_order_id, quantity)
+        
+        try:
             # Calculate follower quantity
             follower_quantity = self.position_sizer.calculate_quantity(
                 leader_quantity=quantity,
                 security_id=security_id,
                 premium=price if price > 0 else None
             )
+            replication.follower_quantity = follower_quantity
             
             if follower_quantity == 0:
-                logger.warning(f"Calculated quantity is 0 for order {leader_order_id}, skipping")
-                self._save_failed_mapping(leader_order_id, quantity, 0, "Calculated quantity is 0")
-                return None
+                logger.warning("Calculated quantity is 0 for order %s, skipping", leader_order_id)
+                replication.error = "Calculated quantity is 0"
+                return replication
             
-            # Validate sufficient margin
+            # Validate and reserve margin against the local funds ledger (no round trip)
+            premium = price if price > 0 else None
             is_valid, error_msg = self.position_sizer.validate_sufficient_margin(
                 quantity=follower_quantity,
                 security_id=security_id,
-                premium=price if price > 0 else None
+                premium=premium,
+                reserve=True
             )
-            
-            if not is_valid:
-                logger.warning(f"Insufficient margin: {error_msg}")
-                self._save_failed_mapping(leader_order_id, quantity, follower_quantity, error_msg)
-                return None
-            
-            # Calculate proportional disclosed quantity
-            follower_disclosed_qty = None
-            if disclosed_qty and follower_quantity > 0:
-                disclosed_ratio = disclosed_qty / quantity
-                follower_disclosed_qty = int(follower_quantity * disclosed_ratio)
-                follower_disclosed_qty = min(follower_disclosed_qty, follower_quantity)
-            
-            # Place order based on product type
-            if product_type == 'CO':
-                # Cover Order
-                follower_order_id = self._place_cover_order(
-                    leader_order_data, follower_quantity, follower_disclosed_qty
-                )
-            elif product_type == 'BO':
-                # Bracket Order
-                follower_order_id = self._place_bracket_order(
-                    leader_order_data, follower_quantity, follower_disclosed_qty
-                )
-            else:
-                # Basic order
-                follower_order_id = self._place_basic_order(
-                    security_id=security_id,
-                    exchange_segment=exchange_segment,
-                    transaction_type=transaction_type,
-                    quantity=follower_quantity,
-                    order_type=order_type,
-                    product_type=product_type,
-                    price=price,
-                    trigger_price=trigger_price,
-                    validity=validity,
-                    disclosed_qty=follower_disclosed_qty,
-                    after_market_order=leader_order_data.get('afterMarketOrder', False),
-                    amo_time=leader_order_data.get('amoTime')
-                )
-            
-            if follower_order_id:
-                # Save copy mapping
-                self._save_copy_mapping(
-                    leader_order_id=leader_order_id,
-                    follower_order_id=follower_order_id,
-                    leader_quantity=quantity,
-                    follower_quantity=follower_quantity,
-                    status='placed'
-                )
-                
-                logger.info(f"✅ Order replicated successfully", extra={
-                    "leader_order_id": leader_order_id,
-                    "follower_order_id": follower_order_id,
-                    "leader_qty": quantity,
-                    "follower_qty": follower_quantity
-                })
-                
-                return follower_order_id
-            else:
-                self._save_failed_mapping(
-                    leader_order_id, quantity, follower_quantity,
-                    "Failed to place follower order"
-                )
-                return None
-            
+            if is_valid:
+                replication.reserved_margin = self.position_sizer.estimate_margin(follower_quantity, premium)
         except Exception as e:
-            logger.error("Error replicating order", exc_info=True, extra={
+            # Record the claim as failed so a later delivery can retry it
+            logger.error("Error sizing order", exc_info=True, extra={
                 "error": str(e),
-                "order": leader_order_data
+                "leader_order_id": leader_order_id
             })
-            return None
+            replication.error = f"Sizing error: {e}"
+            return replication
+        
+        if not is_valid:
+            logger.warning("Insufficient margin: %s", error_msg)
+            replication.error = error_msg
+            return replication
+        
+        # Proportional disclosed quantity, in integer math (no float rounding)
+        if order.disclosed_quantity:
+            replication.follower_disclosed_qty = min(
+                follower_quantity, order.disclosed_quantity * follower_quantity // quantity
+            )
+        
+        replication.pending = True
+        return replication
+    
+    def _place_follower_order(self, replication: "_Replication") -> None:
+        """
+        Place one planned follower order, recording its ID or the failure.
+        
+        Args:
+            replication: Replication produced by _plan_replication()
+        """
+        order = replication.order
+        correlation_id = f"LR-{replication.leader_order_id}"  # Deterministic per leader order
+        
+        place = self._placers.get(order.product_type, self._place_basic_order)
+        follower_order_id = place(
+            order, replication.follower_quantity, replication.follower_disclosed_qty, correlation_id
+        )
+        
+        replication.pending = False
+        if follower_order_id:
+            replication.follower_order_id = follower_order_id
+            self.position_sizer.confirm_margin(replication.reserved_margin)
+        else:
+            replication.error = "Failed to place follower order"
+            self.position_sizer.release_margin(replication.reserved_margin)
+    
+    def _place_in_order(self, replications: List["_Replication"]) -> None:
+        """Place replications for one security one after another, in leader order."""
+        for replication in replications:
+            self._place_follower_order(replication)
     
     def _place_basic_order(
         self,
-        security_id: str,
-        exchange_segment: str,
-        transaction_type: str,
-        quantity: int,
-        order_type: str,
-        product_type: str,
-        price: float,
-        trigger_price: Optional[float],
-        validity: str,
-        disclosed_qty: Optional[int],
-        after_market_order: bool = False,
-        amo_time: Optional[str] = None
+        order: LeaderOrder,
+        follower_quantity: int,
+        follower_disclosed_qty: Optional[int],
+        correlation_id: Optional[str] = None
     ) -> Optional[str]:
         """Place basic order using OrdersAPI."""
         try:
             response = self.orders_api.place_order(
-                security_id=security_id,
-                exchange_segment=exchange_segment,
-                transaction_type=transaction_type,
-                quantity=quantity,
-                order_type=order_type,
-                product_type=product_type,
-                price=price,
-                trigger_price=trigger_price,
-                disclosed_quantity=disclosed_qty,
-                validity=validity,
-                after_market_order=after_market_order,
-                amo_time=amo_time
+                security_id=order.security_id,
+                exchange_segment=order.exchange_segment,
+                transaction_type=order.transaction_type,
+                quantity=follower_quantity,
+                order_type=order.order_type,
+                product_type=order.product_type,
+                price=order.price,
+                trigger_price=order.trigger_price,
+                disclosed_quantity=follower_disclosed_qty,
+                validity=order.validity,
+                after_market_order=order.after_market_order,
+                amo_time=order.amo_time,
+                correlation_id=correlation_id
             )
             
-            if response and 'orderId' in response:
-                return str(response['orderId'])
-            return None
+            order_id = response.get('orderId') if response else None
+            return str(order_id) if order_id is not None else None
             
         except Exception as e:
-            logger.error(f"Error placing basic order: {e}")
+            logger.error("Error placing basic order: %s", e)
             return None
     
     def _place_cover_order(
         self,
-        leader_order_data: Dict[str, Any],
+        order: LeaderOrder,
         follower_quantity: int,
-        follower_disclosed_qty: Optional[int]
+        follower_disclosed_qty: Optional[int],
+        correlation_id: Optional[str] = None
     ) -> Optional[str]:
         """Place cover order using SuperOrderAPI."""
         try:
-            security_id = leader_order_data['securityId']
-            exchange_segment = leader_order_data['exchangeSegment']
-            transaction_type = leader_order_data['transactionType']
-            order_type = leader_order_data['orderType']
-            price = leader_order_data.get('price', 0)
-            trigger_price = leader_order_data.get('triggerPrice')
-            stop_loss_value = leader_order_data.get('stopLossValue') or leader_order_data.get('coStopLossValue')
-            
-            if not stop_loss_value:
+            if not order.co_stop_loss_value:
                 logger.error("Cover Order missing stop_loss_value")
                 return None
             
             response = self.super_orders_api.place_cover_order(
-                security_id=security_id,
-                exchange_segment=exchange_segment,
-                transaction_type=transaction_type,
+                security_id=order.security_id,
+                exchange_segment=order.exchange_segment,
+                transaction_type=order.transaction_type,
                 quantity=follower_quantity,
-                order_type=order_type,
-                price=price,
-                stop_loss_value=stop_loss_value,
-                trigger_price=trigger_price,
-                disclosed_quantity=follower_disclosed_qty
+                order_type=order.order_type,
+                price=order.price,
+                stop_loss_value=order.co_stop_loss_value,
+                trigger_price=order.trigger_price,
+                disclosed_quantity=follower_disclosed_qty,
+                correlation_id=correlation_id
             )
             
-            if response and 'orderId' in response:
-                return str(response['orderId'])
-            return None
+            order_id = response.get('orderId') if response else None
+            return str(order_id) if order_id is not None else None
             
         except Exception as e:
-            logger.error(f"Error placing cover order: {e}")
+            logger.error("Error placing cover order: %s", e)
             return None
     
     def _place_bracket_order(
         self,
-        leader_order_data: Dict[str, Any],
+        order: LeaderOrder,
         follower_quantity: int,
-        follower_disclosed_qty: Optional[int]
+        follower_disclosed_qty: Optional[int],
+        correlation_id: Optional[str] = None
     ) -> Optional[str]:
         """Place bracket order using SuperOrderAPI."""
         try:
-            security_id = leader_order_data['securityId']
-            exchange_segment = leader_order_data['exchangeSegment']
-            transaction_type = leader_order_data['transactionType']
-            order_type = leader_order_data['orderType']
-            price = leader_order_data.get('price', 0)
-            stop_loss_value = leader_order_data.get('boStopLossValue')
-            profit_value = leader_order_data.get('boProfitValue')
-            
-            if not stop_loss_value or not profit_value:
+            if not order.bo_stop_loss_value or not order.bo_profit_value:
                 logger.error("Bracket Order missing stop_loss_value or profit_value")
                 return None
             
             response = self.super_orders_api.place_bracket_order(
-                security_id=security_id,
-                exchange_segment=exchange_segment,
-                transaction_type=transaction_type,
+                security_id=order.security_id,
+                exchange_segment=order.exchange_segment,
+                transaction_type=order.transaction_type,
                 quantity=follower_quantity,
-                order_type=order_type,
-                price=price,
-                stop_loss_value=stop_loss_value,
-                profit_value=profit_value,
-                disclosed_quantity=follower_disclosed_qty
+                order_type=order.order_type,
+                price=order.price,
+                stop_loss_value=order.bo_stop_loss_value,
+                profit_value=order.bo_profit_value,
+                disclosed_quantity=follower_disclosed_qty,
+                correlation_id=correlation_id
             )
             
-            if response and 'orderId' in response:
-                return str(response['orderId'])
-            return None
+            order_id = response.get('orderId') if response else None
+            return str(order_id) if order_id is not None else None
             
         except Exception as e:
-            logger.error(f"Error placing bracket order: {e}")
+            logger.error("Error placing bracket order: %s", e)
             return None
     
+    def _capital_ratio(self) -> Optional[float]:
+        """Capital ratio recorded with copy mappings, or None if funds are unavailable."""
+        try:
+            return self.position_sizer.get_capital_ratio()
+        except Exception as e:
+            logger.warning("Could not read capital ratio: %s", e)
+            return None
+    
+    def _save_replication(self, replication: "_Replication", capital_ratio: Optional[float]) -> None:
+        """Save the copy mapping for a placed or failed replication."""
+        if replication.follower_order_id:
+            # The mapping references the follower order, so store it first
+            self.db.save_order_stub(
+                replication.follower_order_id, ACCOUNT_FOLLOWER, replication.order,
+                replication.follower_quantity, correlation_id=f"LR-{replication.leader_order_id}"
+            )
+            self._save_copy_mapping(
+                leader_order_id=replication.leader_order_id,
+                follower_order_id=replication.follower_order_id,
+                leader_quantity=replication.leader_quantity,
+                follower_quantity=replication.follower_quantity,
+                status='placed',
+                capital_ratio=capital_ratio
+            )
+        else:
+            self._save_failed_mapping(
+                replication.leader_order_id, replication.leader_quantity,
+                replication.follower_quantity, replication.error, capital_ratio
+            )
+    
     def _save_copy_mapping(
         self,
         leader_order_id: str,
         follower_order_id: str,
         leader_quantity: int,
         follower_quantity: int,
-        status: str
+        status: str,
+        capital_ratio: Optional[float]
     ) -> None:
         """Save copy mapping to database."""
-        capital_ratio = self.position_sizer.get_capital_ratio()
-        
-        mapping = CopyMapping(
-            leader_order_id=leader_order_id,
-            follower_order_id=follower_order_id,
-            leader_quantity=leader_quantity,
-            follower_quantity=follower_quantity,
-            sizing_strategy=self.system_config.sizing_strategy.value,
-            capital_ratio=capital_ratio,
-            status=status,
-            error_message=None,
-            created_at=int(time.time()),
-            updated_at=int(time.time())
-        )
-        
-        self.db.save_copy_mapping(mapping)
+        self.db.queue_copy_mapping_row((
+            leader_order_id, follower_order_id, leader_quantity, follower_quantity,
+            self.system_config.sizing_strategy.value,
+            capital_ratio, status, None
+        ))
     
     def _save_failed_mapping(
         self,
         leader_order_id: str,
         leader_quantity: int,
         follower_quantity: int,
-        error_message: str
+        error_message: str,
+        capital_ratio: Optional[float]
     ) -> None:
         """Save failed copy mapping to database."""
-        capital_ratio = self.position_sizer.get_capital_ratio()
-        
-        mapping = CopyMapping(
-            leader_order_id=leader_order_id,
-            follower_order_id=None,
-            leader_quantity=leader_quantity,
-            follower_quantity=follower_quantity,
-            sizing_strategy=self.system_config.sizing_strategy.value,
-            capital_ratio=capital_ratio,
-            status='failed',
-            error_message=error_message,
-            created_at=int(time.time()),
-            updated_at=int(time.time())
-        )
-        
-        self.db.save_copy_mapping(mapping)
+        self.db.queue_copy_mapping_row((
+            leader_order_id, None, leader_quantity, follower_quantity,
+            self.system_config.sizing_strategy.value,
+            capital_ratio, 'failed', error_message
+        ))
 
 
 def create_order_replicator(
@@ -12,12 +12,14 @@ Updated for new architecture with integration to FundsAPI.
 
 import logging
 import math
+import threading
 import time
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 from .config import SizingStrategy, get_config
 from .database import DatabaseManager, get_db
-from .models import Funds, Instrument
+from .models import ACCOUNT_LEADER, ACCOUNT_FOLLOWER, Funds, Instrument
 
 logger = logging.getLogger(__name__)
 
@@ -67,51 +69,151 @@ class PositionSizer:
         self._funds_last_updated: int = 0
         self._funds_ttl: int = 30  # Refresh every 30 seconds
         
+        # Margin held locally so a burst cannot overspend a stale snapshot. Checks run
+        # against balance minus both: reserved is approved but not yet placed; placed
+        # is acknowledged by the broker but maybe not yet in the fetched balance
+        self._reserved_margin: float = 0.0
+        self._placed_margin: float = 0.0
+        self._funds_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        
+        # Funds snapshot pinned by use_snapshot() for the calling thread
+        self._pinned = threading.local()
+        
+        # Resolve the strategy handler once instead of per order
+        self._strategy_fn = {
+            SizingStrategy.CAPITAL_PROPORTIONAL:
+                lambda qty, instrument, premium: self._calculate_capital_proportional(qty),
+            SizingStrategy.FIXED_RATIO:
+                lambda qty, instrument, premium: self._calculate_fixed_ratio(qty),
+            SizingStrategy.RISK_BASED: self._calculate_risk_based,
+        }.get(strategy)
+        
         logger.info(f"Position sizer initialized with strategy: {strategy.value}")
     
     def _refresh_funds(self, force: bool = False) -> tuple[Funds, Funds]:
         """
         Refresh fund limits for both accounts.
         
+        Once a snapshot exists, an expired one is refreshed on a background
+        thread and the cached snapshot is served meanwhile, so order checks
+        never wait on the funds round trips.
+        
         Args:
-            force: Force refresh even if within TTL
+            force: Force refresh even if within TTL (fetches synchronously)
         
         Returns:
             Tuple of (leader_funds, follower_funds)
         """
+        pinned = getattr(self._pinned, 'funds', None)
+        if pinned is not None and not force:
+            return pinned
+        
         current_time = int(time.time())
         
-        if force or (current_time - self._funds_last_updated) > self._funds_ttl:
-            logger.debug("Refreshing fund limits")
-            
-            # Fetch from API using new FundsAPI
-            leader_funds_data = self.leader_funds_api.get_fund_limits()
-            follower_funds_data = self.follower_funds_api.get_fund_limits()
-            
-            # Parse and create Funds objects
-            self._leader_funds = self._parse_funds_response(leader_funds_data, 'leader')
-            self._follower_funds = self._parse_funds_response(follower_funds_data, 'follower')
-            
-            # Save to database
-            self.db.save_funds_snapshot(self._leader_funds)
-            self.db.save_funds_snapshot(self._follower_funds)
-            
-            self._funds_last_updated = current_time
-            
-            logger.info("Fund limits refreshed", extra={
-                "leader_balance": self._leader_funds.available_balance,
-                "follower_balance": self._follower_funds.available_balance
-            })
+        if force or self._follower_funds is None:
+            self._fetch_funds()
+        elif (current_time - self._funds_last_updated) > self._funds_ttl:
+            self._start_background_refresh()
         
         return self._leader_funds, self._follower_funds
     
-    def _parse_funds_response(self, funds_data: dict, account_type: str) -> Funds:
+    @contextmanager
+    def use_snapshot(self) -> Iterator[Optional[tuple[Funds, Funds]]]:
+        """
+        Size every order in the block against one funds snapshot.
+        
+        Capital ratio, risk limits and margin checks inside the block reuse the
+        snapshot taken on entry instead of re-checking its age per call. The
+        margin ledger still applies. Nested blocks share the outer snapshot. If
+        no snapshot can be fetched, nothing is pinned and each call fetches (and
+        fails) on its own.
+        
+        Yields:
+            Tuple of (leader_funds, follower_funds), or None if unavailable
+        """
+        pinned = getattr(self._pinned, 'funds', None)
+        if pinned is not None:
+            yield pinned
+            return
+        
+        try:
+            pinned = self._refresh_funds()
+        except Exception as e:
+            logger.warning(f"Could not pin funds snapshot: {e}")
+        
+        if pinned is None:
+            yield None
+            return
+        
+        self._pinned.funds = pinned
+        try:
+            yield pinned
+        finally:
+            self._pinned.funds = None
+    
+    def _fetch_funds(self) -> None:
+        """Fetch both accounts' fund limits, store the snapshots, and settle reservations."""
+        logger.debug("Refreshing fund limits")
+        
+        current_time = int(time.time())
+        with self._funds_lock:
+            placed_before_fetch = self._placed_margin
+        
+        # Fetch from API using new FundsAPI
+        leader_funds_data = self.leader_funds_api.get_fund_limits()
+        follower_funds_data = self.follower_funds_api.get_fund_limits()
+        
+        # Parse and create Funds objects
+        leader_funds = self._parse_funds_response(leader_funds_data, ACCOUNT_LEADER, current_time)
+        follower_funds = self._parse_funds_response(follower_funds_data, ACCOUNT_FOLLOWER, current_time)
+        
+        # Save both snapshots in one transaction
+        self.db.save_funds_batch([leader_funds, follower_funds])
+        
+        with self._funds_lock:
+            self._leader_funds = leader_funds
+            self._follower_funds = follower_funds
+            # Orders placed before the fetch started are in the broker's balance;
+            # reservations for orders not yet placed still apply
+            self._placed_margin = max(0.0, self._placed_margin - placed_before_fetch)
+            self._funds_last_updated = current_time
+        
+        logger.info("Fund limits refreshed", extra={
+            "leader_balance": leader_funds.available_balance,
+            "follower_balance": follower_funds.available_balance
+        })
+    
+    def _start_background_refresh(self) -> None:
+        """Start a funds refresh thread unless one is already running."""
+        with self._funds_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh, name="funds-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+    
+    def _background_refresh(self) -> None:
+        """Thread target: refresh funds, keeping the cached snapshot on failure."""
+        try:
+            self._fetch_funds()
+        except Exception as e:
+            logger.error("Background funds refresh failed", exc_info=True, extra={"error": str(e)})
+    
+    def _parse_funds_response(
+        self,
+        funds_data: dict,
+        account_type: str,
+        snapshot_ts: Optional[int] = None
+    ) -> Funds:
         """
         Parse DhanHQ funds response into Funds object.
         
         Args:
             funds_data: API response from FundsAPI
             account_type: 'leader' or 'follower'
+            snapshot_ts: Snapshot timestamp (defaults to now)
         
         Returns:
             Funds object
@@ -127,7 +229,7 @@ class PositionSizer:
         margin_used = funds_data.get('utilizedAmount', 0.0)
         
         return Funds(
-            snapshot_ts=int(time.time()),
+            snapshot_ts=snapshot_ts if snapshot_ts is not None else int(time.time()),
             account_type=account_type,
             available_balance=float(available),
             collateral=float(collateral) if collateral else None,
@@ -182,12 +284,8 @@ class PositionSizer:
             return leader_quantity
         
         # Calculate raw quantity based on strategy
-        if self.strategy == SizingStrategy.CAPITAL_PROPORTIONAL:
-            raw_qty = self._calculate_capital_proportional(leader_quantity)
-        elif self.strategy == SizingStrategy.FIXED_RATIO:
-            raw_qty = self._calculate_fixed_ratio(leader_quantity)
-        elif self.strategy == SizingStrategy.RISK_BASED:
-            raw_qty = self._calculate_risk_based(leader_quantity, instrument, premium)
+        if self._strategy_fn is not None:
+            raw_qty = self._strategy_fn(leader_quantity, instrument, premium)
         else:
             logger.warning(f"Unknown strategy {self.strategy}, using leader quantity")
             raw_qty = float(leader_quantity)
@@ -320,42 +418,64 @@ class PositionSizer:
         
         _, follower_funds = self._refresh_funds()
         
-        # Calculate position value
-        if premium:
-            position_value = quantity * premium
-        else:
-            # Conservative estimate if premium not available
-            position_value = quantity * 100  # Arbitrary, should fetch quote
-        
         # Check if within max position size
         max_position_value = follower_funds.available_balance * (self.max_position_size_pct / 100.0)
         
+        if not premium:
+            # Conservative estimate of 100 per unit if premium not available (should fetch quote)
+            max_quantity = int(max_position_value // 100 // instrument.lot_size) * instrument.lot_size
+            if quantity > max_quantity:
+                logger.warning(f"Estimated position value {quantity * 100} exceeds limit {max_position_value}, reducing")
+                return max_quantity
+            return quantity
+        
+        position_value = quantity * premium
+        
         if position_value > max_position_value:
             logger.warning(f"Position value {position_value} exceeds limit {max_position_value}, reducing")
             
             # Reduce to max lots
-            if premium:
-                max_lots = int(max_position_value / (premium * instrument.lot_size))
-            else:
-                max_lots = int(quantity / instrument.lot_size) - 1
-            
+            max_lots = int(max_position_value / (premium * instrument.lot_size))
             quantity = max_lots * instrument.lot_size
         
         return quantity
     
+    def estimate_margin(self, quantity: int, premium: Optional[float]) -> float:
+        """
+        Rough margin estimate for an order (actual margin depends on broker rules).
+        
+        Args:
+            quantity: Order quantity
+            premium: Option premium
+        
+        Returns:
+            Estimated margin
+        """
+        if premium:
+            return quantity * premium
+        # Very rough estimate
+        return quantity * 50  # Should use margin calculator API
+    
     def validate_sufficient_margin(
         self,
         quantity: int,
         security_id: str,
-        premium: Optional[float]
+        premium: Optional[float],
+        reserve: bool = False
     ) -> tuple[bool, str]:
         """
         Validate that follower has sufficient margin for order.
         
+        Checked against the cached balance minus margin already reserved, with
+        no funds round trip. With ``reserve`` the estimate is reserved in the
+        same step; pass it to confirm_margin() once the order is placed, or to
+        release_margin() if it is not.
+        
         Args:
             quantity: Order quantity
             security_id: Security ID
             premium: Option premium
+            reserve: Reserve the estimated margin when the check passes
         
         Returns:
             Tuple of (is_valid, error_message)
@@ -363,24 +483,50 @@ class PositionSizer:
         if quantity == 0:
             return False, "Quantity is 0"
         
-        _, follower_funds = self._refresh_funds()
+        self._refresh_funds()
         
         instrument = self.db.get_instrument(security_id)
         
         if not instrument:
             return False, f"Instrument {security_id} not found"
         
-        # Rough margin estimate (actual margin depends on broker rules)
-        if premium:
-            estimated_margin = quantity * premium
-        else:
-            # Very rough estimate
-            estimated_margin = quantity * 50  # Should use margin calculator API
+        estimated_margin = self.estimate_margin(quantity, premium)
         
-        if estimated_margin > follower_funds.available_balance:
-            return False, f"Insufficient margin: need {estimated_margin}, have {follower_funds.available_balance}"
+        with self._funds_lock:
+            available = (self._follower_funds.available_balance
+                         - self._reserved_margin - self._placed_margin)
+            if estimated_margin > available:
+                return False, f"Insufficient margin: need {estimated_margin}, have {available}"
+            if reserve:
+                self._reserved_margin += estimated_margin
         
         return True, ""
+    
+    def release_margin(self, amount: float) -> None:
+        """
+        Return margin reserved by validate_sufficient_margin() for an order that was not placed.
+        
+        Args:
+            amount: Margin to release
+        """
+        with self._funds_lock:
+            self._reserved_margin = max(0.0, self._reserved_margin - amount)
+    
+    def confirm_margin(self, amount: float) -> None:
+        """
+        Mark margin reserved by validate_sufficient_margin() as used by a placed order.
+        
+        The amount stays held until a funds fetch that started after this call,
+        which is the first one the broker's balance is sure to include. The
+        follower's cached fund limits are dropped so that fetch reads the broker.
+        
+        Args:
+            amount: Margin reserved for the placed order
+        """
+        with self._funds_lock:
+            self._reserved_margin = max(0.0, self._reserved_margin - amount)
+            self._placed_margin += amount
+        self.follower_funds_api.invalidate_funds()
 
 
 # Global position sizer instance
@@ -4,20 +4,45 @@ DhanHQ API v2 Module
 Aligned with DhanHQ v2 API documentation structure.
 Each sub-module maps to a specific API category.
 
+Sub-modules are imported on first attribute access (PEP 562), so a process
+that only places orders does not load EDIS, statements, trader controls, etc.
+
 API Documentation: https://dhanhq.co/docs/v2/
 """
 
-from .authentication import DhanAuthManager, authenticate_accounts, get_leader_client, get_follower_client
-from .orders import OrdersAPI
-from .super_order import SuperOrderAPI
-from .forever_order import ForeverOrderAPI
-from .portfolio import PortfolioAPI
-from .edis import EDISAPI
-from .traders_control import TradersControlAPI
-from .funds import FundsAPI
-from .statement import StatementAPI
-from .postback import PostbackHandler
-from .live_order_update import LiveOrderUpdateManager
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .authentication import DhanAuthManager, authenticate_accounts, get_leader_client, get_follower_client
+    from .orders import OrdersAPI
+    from .super_order import SuperOrderAPI
+    from .forever_order import ForeverOrderAPI
+    from .portfolio import PortfolioAPI
+    from .edis import EDISAPI
+    from .traders_control import TradersControlAPI
+    from .funds import FundsAPI
+    from .statement import StatementAPI
+    from .postback import PostbackHandler
+    from .live_order_update import LiveOrderUpdateManager
+
+# Exported name -> sub-module that defines it
+_LAZY = {
+    'DhanAuthManager': 'authentication',
+    'authenticate_accounts': 'authentication',
+    'get_leader_client': 'authentication',
+    'get_follower_client': 'authentication',
+    'OrdersAPI': 'orders',
+    'SuperOrderAPI': 'super_order',
+    'ForeverOrderAPI': 'forever_order',
+    'PortfolioAPI': 'portfolio',
+    'EDISAPI': 'edis',
+    'TradersControlAPI': 'traders_control',
+    'FundsAPI': 'funds',
+    'StatementAPI': 'statement',
+    'PostbackHandler': 'postback',
+    'LiveOrderUpdateManager': 'live_order_update',
+}
 
 __all__ = [
     # Authentication
@@ -41,3 +66,18 @@ __all__ = [
 
 __version__ = '2.0.0'
 
+
+def __getattr__(name: str):
+    """Import the sub-module defining ``name`` on first use and cache the attribute."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List lazily imported names alongside the loaded ones."""
+    return sorted(set(globals()) | set(__all__))
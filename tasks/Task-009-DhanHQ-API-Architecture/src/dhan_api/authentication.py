@@ -8,11 +8,72 @@ API Documentation: https://dhanhq.co/docs/v2/authentication/
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dhanhq import dhanhq
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool shared by every DhanHQ client in the process
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 32
+
+# Transient failures retried by the shared session. urllib3 never retries POST
+# by default, so order placement is not repeated
+_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Get the process-wide pooled HTTP session (created on first use).
+    
+    Returns:
+        requests.Session with a keep-alive connection pool and retries
+    """
+    global _shared_session
+    
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(
+                    pool_connections=_POOL_CONNECTIONS,
+                    pool_maxsize=_POOL_MAXSIZE,
+                    max_retries=_RETRY
+                ))
+                _shared_session = session
+    return _shared_session
+
+
+def use_shared_session(client: dhanhq) -> dhanhq:
+    """
+    Route a DhanHQ client's requests through the shared pooled session.
+    
+    Credentials are sent as per-request headers, so clients for different
+    accounts can share the pool.
+    
+    Args:
+        client: DhanHQ client
+    
+    Returns:
+        The same client
+    """
+    # dhanhq>=2.1 keeps its session on a DhanHTTP helper
+    getattr(client, 'dhan_http', client).session = get_shared_session()
+    return client
+
+# How long a successful validate_connection result is reused (seconds)
+_VALIDATION_TTL = 30.0
+
 
 class DhanAuthManager:
     """
@@ -23,6 +84,10 @@ class DhanAuthManager:
     - Tokens are obtained via OAuth flow (not handled here)
     - Token rotation supported via hot reload
     
+    Both clients send their requests through the shared pooled session (see
+    get_shared_session) so warm TCP/TLS connections are reused across
+    accounts and API calls.
+    
     Attributes:
         leader_client: Initialized DhanHQ client for leader account
         follower_client: Initialized DhanHQ client for follower account
@@ -46,6 +111,36 @@ class DhanAuthManager:
         
         self.leader_client: Optional[dhanhq] = None
         self.follower_client: Optional[dhanhq] = None
+        
+        # (account_type, id(client)) -> monotonic time of last successful check
+        self._validated_at: dict[tuple[str, int], float] = {}
+        self._validated_lock = threading.Lock()
+    
+    def _build_client(self, client_id: str, access_token: str) -> dhanhq:
+        """
+        Create a DhanHQ client that uses the shared HTTP session.
+        
+        Args:
+            client_id: Account client ID
+            access_token: Account access token
+        
+        Returns:
+            DhanHQ client bound to the shared connection pool
+        """
+        return use_shared_session(dhanhq(client_id, access_token))
+    
+    @staticmethod
+    def _set_access_token(client: dhanhq, access_token: str) -> None:
+        """
+        Swap the access token on an existing client in place.
+        
+        Args:
+            client: DhanHQ client to update
+            access_token: New access token
+        """
+        http = getattr(client, 'dhan_http', client)
+        http.access_token = access_token
+        http.header['access-token'] = access_token
     
     def authenticate_leader(self) -> dhanhq:
         """
@@ -64,10 +159,11 @@ class DhanAuthManager:
         })
         
         try:
-            self.leader_client = dhanhq(
-                self.leader_client_id,
-                self.leader_access_token
-            )
+            if self.leader_client is None:
+                self.leader_client = self._build_client(
+                    self.leader_client_id,
+                    self.leader_access_token
+                )
             
             # Validate credentials by fetching fund limits
             funds = self.leader_client.get_fund_limits()
@@ -75,6 +171,7 @@ class DhanAuthManager:
             if funds is None or 'status' in funds and funds['status'] == 'failure':
                 raise ValueError(f"Leader authentication failed: {funds}")
             
+            self._mark_validated(self.leader_client, 'leader')
             logger.info("Leader account authenticated successfully", extra={
                 "client_id": self.leader_client_id
             })
@@ -105,10 +202,11 @@ class DhanAuthManager:
         })
         
         try:
-            self.follower_client = dhanhq(
-                self.follower_client_id,
-                self.follower_access_token
-            )
+            if self.follower_client is None:
+                self.follower_client = self._build_client(
+                    self.follower_client_id,
+                    self.follower_access_token
+                )
             
             # Validate credentials by fetching fund limits
             funds = self.follower_client.get_fund_limits()
@@ -116,6 +214,7 @@ class DhanAuthManager:
             if funds is None or 'status' in funds and funds['status'] == 'failure':
                 raise ValueError(f"Follower authentication failed: {funds}")
             
+            self._mark_validated(self.follower_client, 'follower')
             logger.info("Follower account authenticated successfully", extra={
                 "client_id": self.follower_client_id
             })
@@ -131,7 +230,7 @@ class DhanAuthManager:
     
     def authenticate_all(self) -> tuple[dhanhq, dhanhq]:
         """
-        Authenticate both leader and follower accounts.
+        Authenticate both leader and follower accounts concurrently.
         
         Returns:
             Tuple of (leader_client, follower_client)
@@ -139,8 +238,11 @@ class DhanAuthManager:
         Raises:
             Exception: If either authentication fails
         """
-        leader = self.authenticate_leader()
-        follower = self.authenticate_follower()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader_future = executor.submit(self.authenticate_leader)
+            follower_future = executor.submit(self.authenticate_follower)
+            leader = leader_future.result()
+            follower = follower_future.result()
         
         logger.info("Both accounts authenticated successfully")
         
@@ -150,6 +252,10 @@ class DhanAuthManager:
         """
         Validate that the client connection is still active.
         
+        A successful check is reused for _VALIDATION_TTL seconds so frequent
+        health checks do not spend rate-limit budget; failures are never
+        cached, so the next call retries immediately.
+        
         Args:
             client: DhanHQ client to validate
             account_type: 'leader' or 'follower'
@@ -157,6 +263,11 @@ class DhanAuthManager:
         Returns:
             True if connection is valid, False otherwise
         """
+        key = (account_type, id(client))
+        validated_at = self._validated_at.get(key)
+        if validated_at is not None and time.monotonic() - validated_at < _VALIDATION_TTL:
+            return True
+        
         try:
             funds = client.get_fund_limits()
             if funds is None or 'status' in funds and funds['status'] == 'failure':
@@ -164,20 +275,55 @@ class DhanAuthManager:
                     "account_type": account_type,
                     "response": funds
                 })
+                self._invalidate_validation(account_type)
                 return False
+            self._mark_validated(client, account_type)
             return True
         except Exception as e:
             logger.error(f"{account_type} connection validation error", extra={
                 "account_type": account_type,
                 "error": str(e)
             })
+            self._invalidate_validation(account_type)
             return False
     
+    def _mark_validated(self, client: dhanhq, account_type: str) -> None:
+        """Record a successful validation for the TTL cache."""
+        with self._validated_lock:
+            self._validated_at[(account_type, id(client))] = time.monotonic()
+    
+    def _invalidate_validation(self, account_type: str) -> None:
+        """Drop cached validation results for an account."""
+        with self._validated_lock:
+            for key in [k for k in self._validated_at if k[0] == account_type]:
+                del self._validated_at[key]
+    
+    def validate_all_connections(self) -> tuple[bool, bool]:
+        """
+        Validate leader and follower connections concurrently.
+        
+        Returns:
+            Tuple of (leader_ok, follower_ok); an unauthenticated account is not ok
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.validate_connection, client, account_type)
+                if client is not None else None
+                for client, account_type in ((self.leader_client, 'leader'),
+                                             (self.follower_client, 'follower'))
+            ]
+            leader_ok, follower_ok = (f.result() if f is not None else False for f in futures)
+        
+        return leader_ok, follower_ok
+    
     def rotate_tokens(self, new_leader_token: Optional[str] = None, 
                       new_follower_token: Optional[str] = None) -> None:
         """
         Rotate access tokens without restart (hot reload).
         
+        Existing clients keep their pooled connections; only the
+        access-token header is replaced before re-validating.
+        
         Args:
             new_leader_token: New access token for leader (if rotating)
             new_follower_token: New access token for follower (if rotating)
@@ -185,24 +331,65 @@ class DhanAuthManager:
         if new_leader_token:
             logger.info("Rotating leader access token")
             self.leader_access_token = new_leader_token
-            self.leader_client = None
+            self._invalidate_validation('leader')
+            if self.leader_client is not None:
+                self._set_access_token(self.leader_client, new_leader_token)
             self.authenticate_leader()
         
         if new_follower_token:
             logger.info("Rotating follower access token")
             self.follower_access_token = new_follower_token
-            self.follower_client = None
+            self._invalidate_validation('follower')
+            if self.follower_client is not None:
+                self._set_access_token(self.follower_client, new_follower_token)
             self.authenticate_follower()
 
 
-# Global auth manager instance (singleton pattern)
+# Process-wide default auth manager (the first account pair authenticated), and
+# how many account pairs this process has authenticated in total
 _auth_manager: Optional[DhanAuthManager] = None
+_auth_manager_count = 0
+_auth_manager_lock = threading.Lock()
+
+# Per-context auth manager, so one process can serve several leader/follower
+# pairs: run each tenant's handlers in its own context (asyncio.Task or
+# contextvars.copy_context().run). New threads and executor workers start with
+# an empty context, so submit work as copy_context().run(fn, ...). An unset
+# context falls back to the default only while a single pair exists; with
+# several, guessing could place one tenant's orders on another's account.
+_auth_manager_var: ContextVar[Optional[DhanAuthManager]] = ContextVar('auth_manager', default=None)
+
+
+def _current_auth_manager() -> Optional[DhanAuthManager]:
+    """
+    Auth manager bound to the current context, else the only one in the process.
+    
+    Returns:
+        DhanAuthManager, or None if nothing is authenticated yet
+    
+    Raises:
+        RuntimeError: If the context is unbound and several account pairs exist
+    """
+    manager = _auth_manager_var.get()
+    if manager is not None:
+        return manager
+    if _auth_manager_count > 1:
+        raise RuntimeError(
+            "No auth manager bound to this context and several account pairs are "
+            "authenticated; run the caller with contextvars.copy_context().run"
+        )
+    return _auth_manager
 
 
 def authenticate_accounts(leader_client_id: str, leader_access_token: str,
                          follower_client_id: str, follower_access_token: str) -> DhanAuthManager:
     """
-    Initialize and authenticate both accounts (singleton pattern).
+    Initialize and authenticate both accounts for the current context.
+    
+    Returns the current context's manager if it is already authenticated for
+    the same account pair, rotating its tokens if they changed; otherwise
+    authenticates a new one and binds it to the current context. The first
+    manager created also becomes the process-wide default.
     
     Args:
         leader_client_id: Leader account client ID
@@ -216,23 +403,42 @@ def authenticate_accounts(leader_client_id: str, leader_access_token: str,
     Raises:
         Exception: If authentication fails
     """
-    global _auth_manager
-    
-    if _auth_manager is None:
-        _auth_manager = DhanAuthManager(
-            leader_client_id=leader_client_id,
-            leader_access_token=leader_access_token,
-            follower_client_id=follower_client_id,
-            follower_access_token=follower_access_token
-        )
-        _auth_manager.authenticate_all()
+    global _auth_manager, _auth_manager_count
     
-    return _auth_manager
+    current = _auth_manager_var.get()
+    if current is None and _auth_manager_count == 1:
+        current = _auth_manager
+    if (current is not None
+            and current.leader_client_id == leader_client_id
+            and current.follower_client_id == follower_client_id):
+        # Same accounts with new tokens: rotate in place (a no-op when unchanged)
+        new_leader_token = leader_access_token if leader_access_token != current.leader_access_token else None
+        new_follower_token = (follower_access_token
+                              if follower_access_token != current.follower_access_token else None)
+        current.rotate_tokens(new_leader_token, new_follower_token)
+        _auth_manager_var.set(current)
+        return current
+    
+    manager = DhanAuthManager(
+        leader_client_id=leader_client_id,
+        leader_access_token=leader_access_token,
+        follower_client_id=follower_client_id,
+        follower_access_token=follower_access_token
+    )
+    manager.authenticate_all()
+    
+    _auth_manager_var.set(manager)
+    with _auth_manager_lock:
+        _auth_manager_count += 1
+        if _auth_manager is None:
+            _auth_manager = manager
+    
+    return manager
 
 
 def get_leader_client() -> dhanhq:
     """
-    Get authenticated leader client.
+    Get authenticated leader client for the current context.
     
     Returns:
         Leader DhanHQ client
@@ -240,14 +446,15 @@ def get_leader_client() -> dhanhq:
     Raises:
         ValueError: If not authenticated yet
     """
-    if _auth_manager is None or _auth_manager.leader_client is None:
+    manager = _current_auth_manager()
+    if manager is None or manager.leader_client is None:
         raise ValueError("Leader client not authenticated. Call authenticate_accounts() first.")
-    return _auth_manager.leader_client
+    return manager.leader_client
 
 
 def get_follower_client() -> dhanhq:
     """
-    Get authenticated follower client.
+    Get authenticated follower client for the current context.
     
     Returns:
         Follower DhanHQ client
@@ -255,14 +462,15 @@ def get_follower_client() -> dhanhq:
     Raises:
         ValueError: If not authenticated yet
     """
-    if _auth_manager is None or _auth_manager.follower_client is None:
+    manager = _current_auth_manager()
+    if manager is None or manager.follower_client is None:
         raise ValueError("Follower client not authenticated. Call authenticate_accounts() first.")
-    return _auth_manager.follower_client
+    return manager.follower_client
 
 
 def get_auth_manager() -> DhanAuthManager:
     """
-    Get authentication manager instance.
+    Get authentication manager for the current context.
     
     Returns:
         DhanAuthManager instance
@@ -270,7 +478,7 @@ def get_auth_manager() -> DhanAuthManager:
     Raises:
         ValueError: If not initialized
     """
-    if _auth_manager is None:
+    manager = _current_auth_manager()
+    if manager is None:
         raise ValueError("Auth manager not initialized. Call authenticate_accounts() first.")
-    return _auth_manager
-
+    return manager
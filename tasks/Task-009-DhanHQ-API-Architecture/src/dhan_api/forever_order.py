@@ -11,6 +11,8 @@ import logging
 from typing import Optional, Dict, Any, List
 from dhanhq import dhanhq
 
+from .authentication import use_shared_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,7 +35,7 @@ class ForeverOrderAPI:
             client: Authenticated DhanHQ client
             account_type: 'leader' or 'follower'
         """
-        self.client = client
+        self.client = use_shared_session(client)
         self.account_type = account_type
         logger.info(f"Forever Order API initialized for {account_type}")
     
@@ -7,11 +7,24 @@ API Documentation: https://dhanhq.co/docs/v2/funds/
 """
 
 import logging
-from typing import Optional, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from dhanhq import dhanhq
 
+from .authentication import use_shared_session
+
 logger = logging.getLogger(__name__)
 
+# Fund limits are reused for this long, so back-to-back balance and margin reads
+# cost one request (seconds)
+_FUNDS_TTL = 0.5
+
+# calculate_margin_batch() sends this many requests at once, then waits
+# _MARGIN_BATCH_GAP seconds before the next group to stay under the rate limit
+_MARGIN_BATCH_SIZE = 10
+_MARGIN_BATCH_GAP = 1.0
+
 
 class FundsAPI:
     """
@@ -23,6 +36,9 @@ class FundsAPI:
     - Fund Transfer operations (if supported)
     """
     
+    # Shared by all instances; batch margin requests reuse the pooled session
+    _EXECUTOR = ThreadPoolExecutor(max_workers=_MARGIN_BATCH_SIZE, thread_name_prefix="margin")
+    
     def __init__(self, client: dhanhq, account_type: str):
         """
         Initialize Funds API.
@@ -31,8 +47,12 @@ class FundsAPI:
             client: Authenticated DhanHQ client
             account_type: 'leader' or 'follower'
         """
-        self.client = client
+        self.client = use_shared_session(client)
         self.account_type = account_type
+        
+        # (monotonic fetch time, response) of the last successful get_fund_limits()
+        self._funds_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
         logger.info(f"Funds API initialized for {account_type}")
     
     def get_fund_limits(self) -> Optional[Dict[str, Any]]:
@@ -48,13 +68,22 @@ class FundsAPI:
         - blockedPayoutAmount: Blocked payout
         - etc.
         
+        A successful response is reused for _FUNDS_TTL seconds; call
+        invalidate_funds() after placing an order to force a fresh read.
+        
         Returns:
             Fund limits dict
         """
+        cached = self._funds_cache
+        if cached is not None and time.monotonic() - cached[0] < _FUNDS_TTL:
+            return cached[1]
+        
         try:
             response = self.client.get_fund_limits()
             
             if response:
+                self._funds_cache = (time.monotonic(), response)
+                
                 # Extract key fields for logging
                 available = response.get('availableBalance', 0)
                 utilized = response.get('utilizedAmount', 0)
@@ -79,6 +108,10 @@ class FundsAPI:
             })
             return None
     
+    def invalidate_funds(self) -> None:
+        """Drop cached fund limits so the next get_fund_limits() call hits the API."""
+        self._funds_cache = None
+    
     def calculate_margin(
         self,
         security_id: str,
@@ -145,6 +178,34 @@ class FundsAPI:
             })
             return None
     
+    def calculate_margin_batch(self, orders: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Calculate margin requirements for several orders concurrently.
+        
+        Requests go out in groups of _MARGIN_BATCH_SIZE with a _MARGIN_BATCH_GAP
+        pause between groups, so a basket costs about one round trip per group.
+        
+        Args:
+            orders: calculate_margin() keyword arguments, one dict per order
+        
+        Returns:
+            Margin calculation dicts (None where a request failed), in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        
+        for start in range(0, len(orders), _MARGIN_BATCH_SIZE):
+            if start:
+                time.sleep(_MARGIN_BATCH_GAP)
+            
+            futures = [
+                self._EXECUTOR.submit(self.calculate_margin, **order)
+                for order in orders[start:start + _MARGIN_BATCH_SIZE]
+            ]
+            # calculate_margin() logs and returns None on failure, so result() does not raise
+            results.extend(future.result() for future in futures)
+        
+        return results
+    
     def get_available_balance(self) -> float:
         """
         Get available balance (convenience method).
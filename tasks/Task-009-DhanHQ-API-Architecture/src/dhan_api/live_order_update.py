@@ -6,24 +6,48 @@ WebSocket-based real-time order update stream.
 API Documentation: https://dhanhq.co/docs/v2/order-update/
 """
 
+import asyncio
+import json
 import logging
-import time
+import random
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable, Any
-from dhanhq import orderupdate
+
+import websockets
+from websockets.exceptions import ConnectionClosed
 
 logger = logging.getLogger(__name__)
 
+_ORDER_FEED_URL = "wss://api-order-update.dhan.co"
+
+# Protocol-level keepalive; the library closes the socket if a ping goes unanswered
+_PING_INTERVAL = 20  # seconds
+_PING_TIMEOUT = 30  # seconds
+
+# How long start() waits for the first connection (seconds)
+_CONNECT_TIMEOUT = 10.0
+
+# Order statuses passed on to on_order_update
+_RELEVANT_STATUSES = frozenset({
+    'PENDING', 'OPEN', 'TRANSIT', 'MODIFIED', 'CANCELLED',
+    'TRADED', 'EXECUTED', 'REJECTED', 'PARTIALLY_FILLED'
+})
+
+# Most recent (orderId, orderStatus) pairs remembered to drop replayed updates
+_SEEN_CACHE_SIZE = 4096
+
 
 class LiveOrderUpdateManager:
     """
     DhanHQ v2 Live Order Update WebSocket manager.
     
     Features:
-    - Real-time order event streaming via WebSocket
-    - Automatic reconnection with exponential backoff
-    - Event callback handling
-    - Connection health monitoring with heartbeat
+    - Real-time order event streaming via an asyncio WebSocket loop
+    - Automatic reconnection with jittered exponential backoff
+    - Event callbacks on a dedicated thread, in arrival order
+    - Connection health monitoring with WebSocket ping/pong
     - Missed order recovery after reconnection
     """
     
@@ -48,10 +72,22 @@ class LiveOrderUpdateManager:
         self.on_order_update = on_order_update
         self.dhan_client = dhan_client
         
-        self.ws_client: Optional[orderupdate.OrderSocket] = None
         self.is_connected = False
         self.is_running = False
         
+        # Event loop thread and the socket it is reading, while running
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ws: Optional[Any] = None
+        self._connected = threading.Event()
+        
+        # Callbacks run here so a slow handler never stalls the socket;
+        # one worker keeps updates in arrival order
+        self._dispatcher: Optional[ThreadPoolExecutor] = None
+        
+        # LRU of delivered (orderId, orderStatus) pairs; only the dispatcher thread touches it
+        self._seen: "OrderedDict[tuple, None]" = OrderedDict()
+        
         # Reconnection settings
         self._reconnect_attempts = 0
         self._max_reconnect_attempts = 10
@@ -59,116 +95,168 @@ class LiveOrderUpdateManager:
         self._max_reconnect_delay = 60.0
         self._was_disconnected = False
         
-        # Heartbeat/health monitoring
-        self._last_heartbeat = 0
-        self._heartbeat_interval = 30  # seconds
-        self._heartbeat_timeout = 60  # seconds
-        
         logger.info("Live Order Update manager initialized")
     
-    def connect(self) -> bool:
+    async def run(self) -> None:
         """
-        Connect to DhanHQ order WebSocket.
+        Read order updates until disconnect() is called, reconnecting on failure.
         
-        Returns:
-            True if connected successfully, False otherwise
+        Runs on the event loop thread started by start().
+        
+        Liveness is left to WebSocket ping/pong, so a quiet feed with no
+        orders is never mistaken for a dead connection.
         """
-        try:
-            logger.info("Connecting to DhanHQ order WebSocket")
-            
-            # Initialize WebSocket client
-            self.ws_client = orderupdate.OrderSocket(
-                self.client_id,
-                self.access_token
-            )
-            
-            # Set callback
-            self.ws_client.on_order_update = self._handle_order_update
-            
-            # Connect (synchronous)
-            self.ws_client.connect_to_dhan_websocket_sync()
-            
-            self.is_connected = True
-            self._reconnect_attempts = 0
-            self._last_heartbeat = time.time()
-            
-            logger.info("WebSocket connected successfully")
-            
-            # Fetch missed orders if reconnecting
-            if self._was_disconnected and self.dhan_client:
-                logger.info("Reconnected after disconnect, fetching missed orders...")
-                try:
-                    self._fetch_missed_orders()
-                except Exception as e:
-                    logger.error(f"Error fetching missed orders: {e}", exc_info=True)
-            
-            self._was_disconnected = False
+        loop = asyncio.get_running_loop()
+        
+        while self.is_running:
+            try:
+                logger.info("Connecting to DhanHQ order WebSocket")
+                
+                async with websockets.connect(
+                    _ORDER_FEED_URL,
+                    ping_interval=_PING_INTERVAL,
+                    ping_timeout=_PING_TIMEOUT
+                ) as ws:
+                    await ws.send(json.dumps({
+                        "LoginReq": {
+                            "MsgCode": 42,
+                            "ClientId": str(self.client_id),
+                            "Token": str(self.access_token)
+                        },
+                        "UserType": "SELF"
+                    }))
+                    
+                    self._ws = ws
+                    self.is_connected = True
+                    self._reconnect_attempts = 0
+                    self._connected.set()
+                    
+                    logger.info("WebSocket connected successfully")
+                    
+                    # Fetch missed orders if reconnecting; queued ahead of live updates
+                    if self._was_disconnected and self.dhan_client:
+                        logger.info("Reconnected after disconnect, fetching missed orders...")
+                        loop.run_in_executor(self._dispatcher, self._fetch_missed_orders)
+                    
+                    self._was_disconnected = False
+                    
+                    async for raw in ws:
+                        # A bad frame is dropped; it must not tear down a healthy connection
+                        try:
+                            message = json.loads(raw)
+                        except ValueError:
+                            logger.warning("Dropping malformed order update frame: %r", raw[:200])
+                            continue
+                        loop.run_in_executor(self._dispatcher, self._handle_order_update, message)
+                
+            except (ConnectionClosed, OSError, asyncio.TimeoutError) as e:
+                logger.error("WebSocket connection failed", exc_info=True, extra={
+                    "error": str(e)
+                })
+            except Exception as e:
+                logger.error("WebSocket error", exc_info=True, extra={"error": str(e)})
+            finally:
+                self._ws = None
+                self.is_connected = False
             
-            return True
+            if not self.is_running:
+                break
             
-        except Exception as e:
-            logger.error("WebSocket connection failed", exc_info=True, extra={
-                "error": str(e)
-            })
-            self.is_connected = False
             self._was_disconnected = True
-            return False
+            delay = self._next_reconnect_delay()
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
     
     def disconnect(self) -> None:
-        """Disconnect from WebSocket."""
+        """Disconnect from WebSocket and finish callbacks already received."""
         logger.info("Disconnecting from WebSocket")
         
         self.is_running = False
         
-        if self.ws_client:
+        loop, ws = self._loop, self._ws
+        if loop is not None and ws is not None:
             try:
-                self.ws_client.disconnect()
+                asyncio.run_coroutine_threadsafe(ws.close(), loop)
             except Exception as e:
                 logger.warning(f"Error during WebSocket disconnect: {e}")
         
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=_CONNECT_TIMEOUT)
+        self._thread = None
+        
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown(wait=True)
+            self._dispatcher = None
+        
         self.is_connected = False
         logger.info("WebSocket disconnected")
     
     def start(self) -> None:
-        """Start WebSocket event loop in background thread."""
+        """Start the WebSocket event loop in a background thread and wait for it to connect."""
         if self.is_running:
             logger.warning("WebSocket already running")
             return
         
         self.is_running = True
+        self._connected.clear()
+        self._dispatcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="order-update")
+        self._thread = threading.Thread(target=self._run_loop, name="order-update-ws", daemon=True)
+        self._thread.start()
         
-        # Connect
-        if not self.connect():
+        if not self._connected.wait(_CONNECT_TIMEOUT):
             logger.error("Failed to connect WebSocket")
-            self.is_running = False
+            self.disconnect()
             return
         
         logger.info("WebSocket event loop started")
     
+    def _run_loop(self) -> None:
+        """Thread target: run the coroutine on this thread's own event loop."""
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        try:
+            loop.run_until_complete(self.run())
+        finally:
+            self._loop = None
+            loop.close()
+    
     def _handle_order_update(self, message: dict) -> None:
         """
         Handle incoming order update from WebSocket.
         
+        An update whose (orderId, orderStatus) was already delivered is
+        dropped, so missed-order recovery does not replay live updates.
+        
         Args:
             message: Order update message
         """
         try:
-            # Update heartbeat timestamp on any message
-            self._last_heartbeat = time.time()
-            
-            logger.debug("Received order update", extra={"message": message})
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("Received order update", extra={"message": message})
             
             # Extract order status
             order_status = message.get('orderStatus', '')
             
             # Handle all relevant order statuses
-            if order_status in (
-                'PENDING', 'OPEN', 'TRANSIT', 'MODIFIED', 'CANCELLED',
-                'TRADED', 'EXECUTED', 'REJECTED', 'PARTIALLY_FILLED'
-            ):
+            if order_status in _RELEVANT_STATUSES:
+                order_id = message.get('orderId')
+                if order_id is not None:
+                    key = (order_id, order_status)
+                    if key in self._seen:
+                        self._seen.move_to_end(key)
+                        if debug:
+                            logger.debug("Skipping repeated order update: %s %s", order_id, order_status)
+                        return
+                    self._seen[key] = None
+                    if len(self._seen) > _SEEN_CACHE_SIZE:
+                        self._seen.popitem(last=False)
+                
                 self.on_order_update(message)
-            else:
-                logger.debug(f"Ignoring order update with status: {order_status}")
+            elif debug:
+                logger.debug("Ignoring order update with status: %s", order_status)
             
         except Exception as e:
             logger.error("Error handling order update", exc_info=True, extra={
@@ -176,15 +264,21 @@ class LiveOrderUpdateManager:
                 "message": message
             })
     
-    def _reconnect_with_backoff(self) -> None:
-        """Attempt reconnection with exponential backoff."""
-        if not self.is_running:
-            return
+    def _next_reconnect_delay(self) -> Optional[float]:
+        """
+        Count a reconnection attempt and return how long to wait before it.
+        
+        Delays grow exponentially and are scaled by a random factor in
+        [0.5, 1.5) so that many clients dropped by the same outage do not
+        reconnect in lockstep.
         
+        Returns:
+            Delay in seconds, or None once the attempts are used up
+        """
         if self._reconnect_attempts >= self._max_reconnect_attempts:
             logger.error("Maximum reconnection attempts reached, stopping")
             self.is_running = False
-            return
+            return None
         
         self._reconnect_attempts += 1
         
@@ -192,21 +286,14 @@ class LiveOrderUpdateManager:
         delay = min(
             self._reconnect_delay * (2 ** (self._reconnect_attempts - 1)),
             self._max_reconnect_delay
-        )
+        ) * random.uniform(0.5, 1.5)
         
         logger.warning(
-            f"Reconnecting in {delay}s "
+            f"Reconnecting in {delay:.1f}s "
             f"(attempt {self._reconnect_attempts}/{self._max_reconnect_attempts})"
         )
         
-        time.sleep(delay)
-        
-        # Attempt reconnect
-        if self.connect():
-            logger.info("Reconnection successful")
-        else:
-            logger.error("Reconnection failed")
-            self._reconnect_with_backoff()
+        return delay
     
     def _fetch_missed_orders(self) -> None:
         """
@@ -244,32 +331,6 @@ class LiveOrderUpdateManager:
             logger.error("Error in _fetch_missed_orders", exc_info=True, extra={
                 "error": str(e)
             })
-    
-    def monitor_connection(self) -> None:
-        """
-        Monitor connection health with heartbeat timeout detection.
-        
-        Should be called periodically from main event loop.
-        """
-        # Check heartbeat timeout
-        if self.is_connected:
-            time_since_heartbeat = time.time() - self._last_heartbeat
-            if time_since_heartbeat > self._heartbeat_timeout:
-                logger.warning(
-                    f"Heartbeat timeout: {time_since_heartbeat:.1f}s since last message"
-                )
-                self.is_connected = False
-                if self.ws_client:
-                    try:
-                        self.ws_client.disconnect()
-                    except Exception as e:
-                        logger.error(f"Error disconnecting stale WebSocket: {e}")
-        
-        # Attempt reconnection if disconnected
-        if self.is_running and not self.is_connected:
-            logger.warning("WebSocket disconnected, attempting reconnect")
-            self._was_disconnected = True
-            self._reconnect_with_backoff()
 
 
 # Usage example:
@@ -287,11 +348,9 @@ ws_manager = LiveOrderUpdateManager(
     dhan_client=your_dhan_client
 )
 
-ws_manager.start()
+ws_manager.start()  # Returns once connected; updates arrive on a background thread
 
-# Monitor connection in event loop
-while True:
-    ws_manager.monitor_connection()
-    time.sleep(5)
+# ... on shutdown
+ws_manager.disconnect()
 """
 
@@ -16,6 +16,10 @@ Implements all 9 DhanHQ v2 Orders API endpoints:
 
 Does NOT include Super Orders (CO/BO) or Forever Orders (GTT).
 
+Order entry is REST only: the DhanHQ order WebSocket (live_order_update.py)
+streams updates and does not accept orders. Per-order connection setup is
+avoided by the keep-alive session DhanAuthManager shares between clients.
+
 API Documentation: https://dhanhq.co/docs/v2/orders/
 """
 
@@ -75,7 +79,8 @@ class OrdersAPI:
         after_market_order: bool = False,
         amo_time: Optional[str] = None,
         bo_profit_value: Optional[float] = None,
-        bo_stop_loss_value: Optional[float] = None
+        bo_stop_loss_value: Optional[float] = None,
+        correlation_id: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Place a new order.
@@ -97,6 +102,7 @@ class OrdersAPI:
             amo_time: PRE_OPEN, OPEN, OPEN_30, OPEN_60 (timing for AMO orders)
             bo_profit_value: Profit value for BO orders
             bo_stop_loss_value: Stop loss value for BO orders
+            correlation_id: Client tag echoed back on the order (correlationId)
         
         Returns:
             Order response dict with orderId, or None if failed
@@ -135,6 +141,8 @@ class OrdersAPI:
                 request['bo_profit_value'] = bo_profit_value
             if bo_stop_loss_value is not None:
                 request['bo_stop_loss_value'] = bo_stop_loss_value
+            if correlation_id is not None:
+                request['tag'] = correlation_id
             
             start_time = time.time()
             response = self.client.place_order(**request)
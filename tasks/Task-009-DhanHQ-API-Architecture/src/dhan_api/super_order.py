@@ -51,7 +51,8 @@ class SuperOrderAPI:
         price: float,
         stop_loss_value: float,
         trigger_price: Optional[float] = None,
-        disclosed_quantity: Optional[int] = None
+        disclosed_quantity: Optional[int] = None,
+        correlation_id: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Place a Cover Order (CO).
@@ -71,6 +72,7 @@ class SuperOrderAPI:
             stop_loss_value: Stop-loss value (absolute or % based on API)
             trigger_price: Trigger price for entry if stop-loss order
             disclosed_quantity: Disclosed quantity
+            correlation_id: Client tag echoed back on the order (correlationId)
         
         Returns:
             Order response with parent orderId
@@ -99,6 +101,8 @@ class SuperOrderAPI:
                 request['trigger_price'] = trigger_price
             if disclosed_quantity is not None:
                 request['disclosed_quantity'] = disclosed_quantity
+            if correlation_id is not None:
+                request['tag'] = correlation_id
             
             response = self.client.place_order(**request)
             
@@ -129,7 +133,8 @@ class SuperOrderAPI:
         price: float,
         stop_loss_value: float,
         profit_value: float,
-        disclosed_quantity: Optional[int] = None
+        disclosed_quantity: Optional[int] = None,
+        correlation_id: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Place a Bracket Order (BO).
@@ -150,6 +155,7 @@ class SuperOrderAPI:
             stop_loss_value: Stop-loss value (absolute or %)
             profit_value: Target profit value (absolute or %)
             disclosed_quantity: Disclosed quantity
+            correlation_id: Client tag echoed back on the order (correlationId)
         
         Returns:
             Order response with parent orderId
@@ -178,6 +184,8 @@ class SuperOrderAPI:
             
             if disclosed_quantity is not None:
                 request['disclosed_quantity'] = disclosed_quantity
+            if correlation_id is not None:
+                request['tag'] = correlation_id
             
             response = self.client.place_order(**request)
             
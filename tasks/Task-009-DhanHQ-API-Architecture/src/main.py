@@ -6,12 +6,14 @@ Orchestrates all components and manages the copy trading lifecycle.
 """
 
 import logging
+import queue
 import signal
 import sys
+import threading
 import time
-from typing import Dict, Any
+from typing import Dict, Any, List
 
-from core import get_config, init_database
+from core import get_config, init_database, LeaderOrder
 from core.position_sizer import initialize_position_sizer
 from core.order_replicator import create_order_replicator
 from dhan_api import (
@@ -25,6 +27,12 @@ from utils import setup_logging
 
 logger = logging.getLogger(__name__)
 
+# Leader orders are replicated by this many worker threads, partitioned by
+# security: orders for one security stay in arrival order on one worker, while
+# different securities replicate in parallel
+_REPLICATION_WORKERS = 4
+_WORKER_STOP = object()  # Queue sentinel: exit the worker
+
 
 class CopyTradingSystem:
     """
@@ -53,6 +61,13 @@ class CopyTradingSystem:
         self.order_replicator = None
         self.ws_manager = None
         
+        # Per-security replication partitions (started by start())
+        self._replication_queues: List["queue.SimpleQueue[Any]"] = []
+        self._replication_workers: List[threading.Thread] = []
+        
+        # Last value written to last_leader_event_ts (whole seconds)
+        self._last_event_ts = 0
+        
         # Configuration
         self.leader_config = None
         self.follower_config = None
@@ -164,6 +179,8 @@ class CopyTradingSystem:
             sys.exit(1)
         
         try:
+            self._start_replication_workers()
+            
             # Connect WebSocket
             logger.info("Connecting to WebSocket...")
             self.ws_manager.start()
@@ -201,15 +218,22 @@ class CopyTradingSystem:
         """
         Main event loop.
         
-        WebSocket callbacks handle order updates.
-        This loop performs health checks and maintenance.
+        WebSocket callbacks handle order updates and the WebSocket manager
+        reconnects on its own; this loop only reports its health.
         """
         while self.is_running:
             try:
                 # Health check
+                if not self.ws_manager.is_running:
+                    logger.error("WebSocket manager stopped, shutting down")
+                    self.shutdown()
+                    break
+                
                 if not self.ws_manager.is_connected:
-                    logger.warning("WebSocket disconnected, monitoring for reconnection")
-                    self.ws_manager.monitor_connection()
+                    logger.warning("WebSocket disconnected, waiting for reconnection")
+                
+                # Backstop for events buffered outside an order update tick
+                self._flush_order_events()
                 
                 # Sleep to avoid busy loop
                 time.sleep(5)
@@ -218,10 +242,75 @@ class CopyTradingSystem:
                 logger.error("Error in event loop", exc_info=True, extra={"error": str(e)})
                 time.sleep(5)
     
+    def _start_replication_workers(self) -> None:
+        """Start the partitioned replication worker threads."""
+        for i in range(_REPLICATION_WORKERS):
+            work_queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+            worker = threading.Thread(
+                target=self._replication_worker, args=(work_queue,),
+                name=f"replicator-{i}", daemon=True
+            )
+            self._replication_queues.append(work_queue)
+            self._replication_workers.append(worker)
+            worker.start()
+    
+    def _stop_replication_workers(self) -> None:
+        """Let each worker finish its queued orders, then stop it."""
+        for work_queue in self._replication_queues:
+            work_queue.put(_WORKER_STOP)
+        for worker in self._replication_workers:
+            worker.join()
+        self._replication_queues = []
+        self._replication_workers = []
+    
+    def _replication_worker(self, work_queue: "queue.SimpleQueue[Any]") -> None:
+        """Thread target: replicate the orders of one partition in arrival order."""
+        while True:
+            order = work_queue.get()
+            if order is _WORKER_STOP:
+                return
+            self._replicate(order)
+    
+    def _replicate(self, order: LeaderOrder) -> None:
+        """
+        Replicate one leader order and record the processed event.
+        
+        Args:
+            order: Leader order parsed from the WebSocket update
+        """
+        order_id = order.order_id
+        try:
+            follower_order_id = self.order_replicator.replicate_order(order)
+            
+            if follower_order_id:
+                logger.info(f"✅ Order replicated", extra={
+                    "leader_order_id": order_id,
+                    "follower_order_id": follower_order_id
+                })
+                
+                # Update last processed event timestamp; it has one-second
+                # resolution, so write only when the second changes
+                now = int(time.time())
+                if now != self._last_event_ts:
+                    self._last_event_ts = now
+                    self.db.set_config_value('last_leader_event_ts', str(now))
+            else:
+                logger.warning(f"⚠️ Order replication skipped or failed: {order_id}")
+            
+        except Exception as e:
+            logger.error("Error replicating order", exc_info=True, extra={
+                "error": str(e),
+                "order": order
+            })
+    
     def _handle_order_update(self, order_data: Dict[str, Any]) -> None:
         """
         Handle order update from WebSocket.
         
+        New orders are handed to the replication worker for their security, so
+        a slow replication never holds up the WebSocket thread or other
+        securities.
+        
         Args:
             order_data: Order update from leader account
         """
@@ -238,18 +327,12 @@ class CopyTradingSystem:
             
             # Replicate new orders
             if order_status in ('PENDING', 'TRANSIT', 'OPEN'):
-                follower_order_id = self.order_replicator.replicate_order(order_data)
-                
-                if follower_order_id:
-                    logger.info(f"✅ Order replicated", extra={
-                        "leader_order_id": order_id,
-                        "follower_order_id": follower_order_id
-                    })
-                    
-                    # Update last processed event timestamp
-                    self.db.set_config_value('last_leader_event_ts', str(int(time.time())))
+                order = LeaderOrder.from_dict(order_data)
+                if self._replication_queues:
+                    partition = hash(security_id) % len(self._replication_queues)
+                    self._replication_queues[partition].put(order)
                 else:
-                    logger.warning(f"⚠️ Order replication skipped or failed: {order_id}")
+                    self._replicate(order)
             else:
                 logger.debug(f"Ignoring order with status: {order_status}")
             
@@ -258,6 +341,16 @@ class CopyTradingSystem:
                 "error": str(e),
                 "order_data": order_data
             })
+        
+        # Write order events buffered during this tick now, not on the next one
+        self._flush_order_events()
+    
+    def _flush_order_events(self) -> None:
+        """Write buffered order events, logging rather than raising on failure."""
+        try:
+            self.db.flush_events()
+        except Exception as e:
+            logger.error("Error flushing order events", exc_info=True, extra={"error": str(e)})
     
     def shutdown(self) -> None:
         """Graceful shutdown."""
@@ -269,6 +362,11 @@ class CopyTradingSystem:
             logger.info("Disconnecting WebSocket...")
             self.ws_manager.disconnect()
         
+        # Finish orders already handed to the replication workers
+        if self._replication_workers:
+            logger.info("Stopping replication workers...")
+            self._stop_replication_workers()
+        
         # Close database
         if self.db:
             logger.info("Closing database...")
@@ -23,6 +23,24 @@ def temp_db():
     os.unlink(path)
 
 
+@pytest.fixture
+def db_with_leader_order(temp_db):
+    """Initialized database holding leader order '12345' for FK-bound rows."""
+    from core.database import DatabaseManager
+    
+    db = DatabaseManager(temp_db)
+    db.connect()
+    db.initialize_schema()
+    db.conn.execute("""
+        INSERT INTO orders (id, account_type, status, side, product, order_type, validity,
+                            security_id, exchange_segment, quantity, created_at, updated_at)
+        VALUES ('12345', 'leader', 'OPEN', 'BUY', 'CNC', 'LIMIT', 'DAY', '1333', 'NSE_EQ', 10, 1, 1)
+    """)
+    db.conn.commit()
+    yield db
+    db.close()
+
+
 @pytest.fixture
 def mock_env(monkeypatch):
     """Mock environment variables for testing."""
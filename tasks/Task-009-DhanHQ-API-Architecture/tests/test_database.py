@@ -2,10 +2,13 @@
 Unit tests for database module.
 """
 
+import json
 import pytest
 import sqlite3
+import threading
+import time
 from core.database import DatabaseManager, init_database
-from core.models import Order, CopyMapping, BracketOrderLeg
+from core.models import Order, OrderEvent, CopyMapping, BracketOrderLeg, Funds, Position
 
 
 @pytest.mark.unit
@@ -128,6 +131,46 @@ class TestDatabaseManager:
         value = db.get_config_value('non_existent', default='default_val')
         assert value == 'default_val'
     
+    def test_config_values_are_cached(self, temp_db):
+        """Test config reads are served from the cache and kept current by writes."""
+        db = DatabaseManager(temp_db)
+        db.connect()
+        db.initialize_schema()
+        
+        db.set_config_value('cache_key', 'a')
+        db.conn.execute("UPDATE config SET value = 'b' WHERE key = 'cache_key'")
+        db.conn.commit()
+        assert db.get_config_value('cache_key') == 'a'
+        
+        db.set_config_value('cache_key', 'c')
+        assert db.get_config_value('cache_key') == 'c'
+        db.close()
+    
+    def test_set_config_value_keeps_description(self, temp_db):
+        """Test setting a value without a description keeps the stored one."""
+        db = DatabaseManager(temp_db)
+        db.connect()
+        db.initialize_schema()
+        
+        db.set_config_value('desc_key', 'a', description='Test key')
+        db.set_config_value('desc_key', 'b')
+        
+        row = db.conn.execute("SELECT value, description FROM config WHERE key = 'desc_key'").fetchone()
+        assert row == ('b', 'Test key')
+        db.close()
+    
+    def test_set_config_value_returning(self, temp_db):
+        """Test the upsert hands back the stored value."""
+        db = DatabaseManager(temp_db)
+        db.connect()
+        db.initialize_schema()
+        
+        assert db.set_config_value_returning('ret_key', 'a') == 'a'
+        assert db.set_config_value_returning('ret_key', 'b', description='Test key') == 'b'
+        assert not db.conn.in_transaction
+        assert db.get_config_value('ret_key') == 'b'
+        db.close()
+    
     def test_database_wal_mode(self, temp_db, reset_singletons):
         """Test database WAL mode is enabled."""
         db = DatabaseManager(temp_db)
@@ -150,6 +193,288 @@ class TestDatabaseManager:
             assert result[0] == 1
 
 
+@pytest.mark.unit
+class TestFundsSnapshots:
+    """Test funds and positions snapshot persistence."""
+    
+    def test_save_funds_batch(self, temp_db):
+        """Test saving leader and follower funds in one batch."""
+        db = DatabaseManager(temp_db)
+        db.connect()
+        db.initialize_schema()
+        
+        db.save_funds_batch([
+            Funds(snapshot_ts=1696348800, account_type='leader', available_balance=200000.0),
+            Funds(snapshot_ts=1696348800, account_type='follower', available_balance=100000.0)
+        ])
+        
+        assert db.get_latest_funds('leader').available_balance == 200000.0
+        assert db.get_latest_funds('follower').available_balance == 100000.0
+        db.close()
+    
+    def test_save_positions_snapshot(self, temp_db):
+        """Test saving a positions snapshot in one batch."""
+        db = DatabaseManager(temp_db)
+        db.connect()
+        db.initialize_schema()
+        
+        db.save_positions_snapshot([
+            Position(snapshot_ts=1696348800, account_type='follower', security_id='1333',
+                     exchange_segment='NSE_EQ', quantity=10, avg_price=1500.0),
+            Position(snapshot_ts=1696348800, account_type='follower', security_id='11536',
+                     exchange_segment='NSE_EQ', quantity=5, avg_price=3500.0)
+        ])
+        
+        positions = db.get_latest_positions('follower')
+        assert sorted(p.security_id for p in positions) == ['11536', '1333']
+        db.close()
+
+
+@pytest.mark.unit
+class TestBatchWrites:
+    """Test batched transactions."""
+    
+    def test_batch_commits_once(self, temp_db):
+        """Test writes inside batch() are committed together."""
+        db = DatabaseManager(temp_db)
+        db.connect()
+        db.initialize_schema()
+        
+        with db.batch():
+            db.set_config_value('batch_key_1', 'a')
+            db.set_config_value('batch_key_2', 'b')
+            assert db.conn.in_transaction
+        
+        assert not db.conn.in_transaction
+        assert db.get_config_value('batch_key_2') == 'b'
+        db.close()
+    
+    def test_batch_rolls_back_on_error(self, temp_db):
+        """Test a failing batch discards its writes."""
+        db = DatabaseManager(temp_db)
+        db.connect()
+        db.initialize_schema()
+        
+        with pytest.raises(RuntimeError):
+            with db.batch():
+                db.set_config_value('batch_key', 'a')
+                raise RuntimeError("boom")
+        
+        assert db.get_config_value('batch_key') is None
+        db.close()
+    
+    def test_other_thread_write_waits_for_batch(self, temp_db):
+        """Test another thread's write is not absorbed into an open batch that rolls back."""
+        db = DatabaseManager(temp_db)
+        db.connect()
+        db.initialize_schema()
+        
+        writer = threading.Thread(target=db.set_config_value, args=('other_key', 'b'))
+        with pytest.raises(RuntimeError):
+            with db.batch():
+                db.set_config_value('batch_key', 'a')
+                writer.start()
+                writer.join(timeout=0.2)
+                assert writer.is_alive()  # Blocked until the batch ends
+                raise RuntimeError("boom")
+        writer.join()
+        
+        assert db.get_config_value('batch_key') is None
+        assert db.get_config_value('other_key') == 'b'
+        db.close()
+    
+    def test_buffered_order_events_are_flushed(self, db_with_leader_order):
+        """Test buffered order events are written before they are read."""
+        db = db_with_leader_order
+        
+        for sequence in range(3):
+            db.save_order_event(OrderEvent(
+                order_id='12345', event_type='MODIFIED', event_data=None,
+                event_ts=1696348800 + sequence, sequence=sequence
+            ))
+        
+        events = db.get_order_events('12345')
+        assert [e.sequence for e in events] == [0, 1, 2]
+        assert db.flush_events() == 0
+    
+    def test_failed_event_flush_keeps_events(self, db_with_leader_order):
+        """Test buffered events survive a flush whose transaction rolls back."""
+        db = db_with_leader_order
+        
+        db._last_event_flush = time.monotonic()  # Keep the event buffered
+        db.save_order_event(OrderEvent(
+            order_id='12345', event_type='MODIFIED', event_data=None,
+            event_ts=1696348800, sequence=0
+        ))
+        
+        with pytest.raises(RuntimeError):
+            with db.batch():
+                db.flush_events()
+                raise RuntimeError("boom")
+        
+        assert db.flush_events() == 1
+        assert [e.sequence for e in db.get_order_events('12345')] == [0]
+    
+    def test_event_for_unknown_order_is_dropped(self, db_with_leader_order):
+        """Test an event the schema rejects is dropped and does not block later writes."""
+        db = db_with_leader_order
+        
+        db._last_event_flush = time.monotonic()  # Keep the events buffered
+        for order_id in ('missing', '12345'):
+            db.save_order_event(OrderEvent(
+                order_id=order_id, event_type='MODIFIED', event_data=None,
+                event_ts=1696348800, sequence=0
+            ))
+        
+        assert db.flush_events() == 1
+        assert len(db._event_buf) == 0
+        assert db.claim_copy_mapping('12345', 10) is True
+        assert [e.order_id for e in db.get_order_events('12345')] == ['12345']
+    
+    def test_update_order_status_with_event(self, db_with_leader_order):
+        """Test status update and its event commit together."""
+        db = db_with_leader_order
+        
+        db.save_order_event(OrderEvent(
+            order_id='12345', event_type='PLACED', event_data=None, event_ts=1696348800, sequence=0
+        ))
+        db.update_order_status_with_event('12345', 'EXECUTED', OrderEvent(
+            order_id='12345', event_type='EXECUTED', event_data=None, event_ts=1696348801, sequence=1
+        ))
+        
+        assert not db.conn.in_transaction
+        assert len(db._event_buf) == 0
+        status = db.conn.execute("SELECT status FROM orders WHERE id = '12345'").fetchone()[0]
+        assert status == 'EXECUTED'
+        assert [e.event_type for e in db.get_order_events('12345')] == ['PLACED', 'EXECUTED']
+    
+    def test_log_audit_many(self, temp_db):
+        """Test queued audit entries are written by the background writer."""
+        db = DatabaseManager(temp_db)
+        db.connect()
+        db.initialize_schema()
+        
+        db.log_audit_many([
+            {'action': 'place_order', 'account_type': 'leader', 'request_data': {'qty': 10}, 'status_code': 200},
+            {'action': 'place_order', 'account_type': 'follower', 'error_message': 'Insufficient margin'}
+        ])
+        db.flush_audit()
+        
+        rows = db.conn.execute("SELECT account_type, request_data, error_message FROM audit_log ORDER BY id").fetchall()
+        assert [row[0] for row in rows] == ['leader', 'follower']
+        assert json.loads(rows[0][1]) == {'qty': 10}
+        assert rows[1][2] == 'Insufficient margin'
+        db.close()
+    
+    def test_purge_audit_log(self, temp_db):
+        """Test audit entries older than the cutoff are deleted."""
+        db = DatabaseManager(temp_db)
+        db.connect()
+        db.initialize_schema()
+        
+        db.log_audit('place_order', 'leader')
+        db.flush_audit()
+        cutoff = time.time_ns()
+        db.log_audit('cancel_order', 'leader')
+        
+        assert db.purge_audit_log(cutoff) == 1
+        actions = [row[0] for row in db.conn.execute("SELECT action FROM audit_log")]
+        assert actions == ['cancel_order']
+        db.close()
+
+
+@pytest.mark.unit
+class TestCopyMappingClaims:
+    """Test idempotent claiming of leader orders."""
+    
+    def test_claim_copy_mapping_once(self, db_with_leader_order):
+        """Test a leader order is claimed once and reclaimable only after failure."""
+        db = db_with_leader_order
+        
+        assert db.claim_copy_mapping('12345', 10) is True
+        assert db.claim_copy_mapping('12345', 10) is False
+        
+        db.update_copy_mapping_status('12345', 'failed', error_message='Insufficient margin')
+        assert db.claim_copy_mapping('12345', 10) is True
+    
+    def test_repeat_claim_skips_database(self, db_with_leader_order):
+        """Test a claimed leader order is refused from memory on repeat updates."""
+        db = db_with_leader_order
+        
+        assert db.claim_copy_mapping('12345', 10) is True
+        
+        db.conn.execute("DELETE FROM copy_mappings")
+        assert db.claim_copy_mapping('12345', 10) is False
+        
+        db.save_copy_mapping_row(('12345', None, 10, 5, 'capital_proportional', 0.5, 'failed', 'Rejected'))
+        assert db.claim_copy_mapping('12345', 10) is True
+    
+    def test_save_copy_mapping_row(self, db_with_leader_order):
+        """Test saving a copy mapping from raw column values."""
+        db = db_with_leader_order
+        
+        db.save_copy_mapping_row(('12345', None, 10, 5, 'capital_proportional', 0.5, 'failed', 'Insufficient margin'))
+        
+        retrieved = db.get_copy_mapping_by_leader('12345')
+        assert retrieved.follower_quantity == 5
+        assert retrieved.error_message == 'Insufficient margin'
+        assert retrieved.created_at == retrieved.updated_at
+    
+    def test_queue_copy_mapping_row(self, db_with_leader_order):
+        """Test queued copy mappings are visible once flushed."""
+        db = db_with_leader_order
+        
+        db.queue_copy_mapping_row(('12345', None, 10, 5, 'capital_proportional', 0.5, 'failed', 'Rejected'))
+        db.flush_copy_mappings()
+        
+        assert db.get_copy_mapping_by_leader('12345').status == 'failed'
+    
+    def test_failed_mapping_is_reclaimable_at_once(self, db_with_leader_order):
+        """Test a queued failed mapping can be reclaimed without waiting for the writer."""
+        db = db_with_leader_order
+        
+        assert db.claim_copy_mapping('12345', 10) is True
+        db.queue_copy_mapping_row(('12345', None, 10, 5, 'capital_proportional', 0.5, 'failed', 'Rejected'))
+        
+        assert db.claim_copy_mapping('12345', 10) is True
+    
+    def test_flush_survives_dead_writer(self, db_with_leader_order, monkeypatch):
+        """Test a flush writes queued mappings itself when the background writer dies."""
+        db = db_with_leader_order
+        
+        def refuse(*args, **kwargs):
+            raise sqlite3.OperationalError("unable to open database file")
+        
+        with monkeypatch.context() as patch:
+            patch.setattr(sqlite3, 'connect', refuse)
+            db.queue_copy_mapping_row(('12345', None, 10, 5, 'capital_proportional', 0.5, 'placed', None))
+            db.flush_copy_mappings()
+        
+        assert db._audit_thread is None
+        assert db.get_copy_mapping_by_leader('12345').status == 'placed'
+
+
+@pytest.mark.unit
+class TestReadPool:
+    """Test read-only connection pool."""
+    
+    def test_reads_use_read_only_connection(self, temp_db):
+        """Test get_* queries run on a pooled read-only connection."""
+        db = DatabaseManager(temp_db)
+        db.connect()
+        db.initialize_schema()
+        
+        db.set_config_value('pool_key', 'a')
+        assert db.get_config_value('pool_key') == 'a'
+        
+        with db._reader() as conn:
+            assert conn is not db.conn
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM config")
+        
+        db.close()
+
+
 @pytest.mark.unit
 class TestInitDatabase:
     """Test init_database function."""
@@ -0,0 +1,76 @@
+"""
+Unit tests for funds API module.
+"""
+
+import pytest
+from unittest.mock import Mock
+from dhan_api import funds
+from dhan_api.funds import FundsAPI
+
+
+@pytest.mark.unit
+class TestFundsAPI:
+    """Test FundsAPI caching and batch margin requests against a mocked client."""
+    
+    @pytest.fixture
+    def funds_api(self, sample_funds_data):
+        """Create a FundsAPI whose client returns sample_funds_data."""
+        client = Mock()
+        client.get_fund_limits.return_value = sample_funds_data
+        return FundsAPI(client, 'follower')
+    
+    def test_fund_limits_are_cached(self, funds_api):
+        """Test back-to-back balance and margin reads cost one request."""
+        assert funds_api.get_available_balance() == 100000.0
+        assert funds_api.get_margin_used() == 50000.0
+        
+        assert funds_api.client.get_fund_limits.call_count == 1
+    
+    def test_invalidate_funds_forces_refresh(self, funds_api):
+        """Test invalidate_funds() makes the next read hit the API."""
+        funds_api.get_fund_limits()
+        funds_api.invalidate_funds()
+        funds_api.get_fund_limits()
+        
+        assert funds_api.client.get_fund_limits.call_count == 2
+    
+    def test_cached_fund_limits_expire(self, funds_api, monkeypatch):
+        """Test fund limits are fetched again once the TTL has passed."""
+        monkeypatch.setattr(funds, '_FUNDS_TTL', 0.0)
+        
+        funds_api.get_fund_limits()
+        funds_api.get_fund_limits()
+        
+        assert funds_api.client.get_fund_limits.call_count == 2
+    
+    def test_failed_fetch_is_not_cached(self, funds_api, sample_funds_data):
+        """Test an empty response is retried on the next read."""
+        funds_api.client.get_fund_limits.side_effect = [None, sample_funds_data]
+        
+        assert funds_api.get_fund_limits() is None
+        assert funds_api.get_fund_limits() == sample_funds_data
+    
+    def test_calculate_margin_batch(self, funds_api, monkeypatch):
+        """Test batch margins come back in input order, grouped with a gap between groups."""
+        sleeps = []
+        monkeypatch.setattr(funds, '_MARGIN_BATCH_SIZE', 2)
+        monkeypatch.setattr(funds.time, 'sleep', sleeps.append)
+        
+        def calculate_margin(**request):
+            if request['quantity'] == 3:
+                raise ConnectionError("timeout")
+            return {'requiredMargin': request['quantity'] * 100.0}
+        
+        funds_api.client.calculate_margin.side_effect = calculate_margin
+        orders = [
+            {
+                'security_id': '11536', 'exchange_segment': 'NSE_EQ', 'transaction_type': 'BUY',
+                'quantity': quantity, 'product_type': 'INTRADAY', 'order_type': 'MARKET', 'price': 0.0
+            }
+            for quantity in range(1, 6)
+        ]
+        
+        results = funds_api.calculate_margin_batch(orders)
+        
+        assert [r['requiredMargin'] if r else None for r in results] == [100.0, 200.0, None, 400.0, 500.0]
+        assert sleeps == [funds._MARGIN_BATCH_GAP] * 2
@@ -0,0 +1,172 @@
+"""
+Unit tests for live order update module.
+"""
+
+import pytest
+import asyncio
+import json
+import threading
+from unittest.mock import Mock
+import websockets
+from dhan_api import live_order_update
+from dhan_api.live_order_update import LiveOrderUpdateManager
+
+
+def _frame(order_id, status):
+    """Encode an order update the way the feed sends it."""
+    return json.dumps({'orderId': order_id, 'orderStatus': status})
+
+
+class _OrderFeed:
+    """
+    Local order update feed on its own thread.
+    
+    The Nth connection receives the frames in scripts[N] and is then closed by
+    the server, except the last one, which stays open until the client leaves.
+    """
+    
+    def __init__(self, scripts):
+        self.scripts = scripts
+        self.logins = []
+        self.url = None
+        self._ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._stop = None
+        self._thread = threading.Thread(target=self._loop.run_until_complete, args=(self._serve(),), daemon=True)
+    
+    async def _handler(self, ws, *args):
+        self.logins.append(json.loads(await ws.recv()))
+        index = len(self.logins) - 1
+        for frame in self.scripts[index]:
+            await ws.send(frame)
+        if index < len(self.scripts) - 1:
+            await ws.close()
+        else:
+            await ws.wait_closed()
+    
+    async def _serve(self):
+        self._stop = asyncio.get_running_loop().create_future()
+        async with websockets.serve(self._handler, '127.0.0.1', 0) as server:
+            self.url = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+            self._ready.set()
+            await self._stop
+    
+    def start(self):
+        self._thread.start()
+        self._ready.wait(5)
+    
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._stop.set_result, None)
+        self._thread.join(5)
+        self._loop.close()
+
+
+@pytest.fixture
+def order_feed(monkeypatch):
+    """Start a local feed for the given scripts and point the manager at it."""
+    feeds = []
+    
+    def start(*scripts):
+        feed = _OrderFeed(list(scripts))
+        feed.start()
+        feeds.append(feed)
+        monkeypatch.setattr(live_order_update, '_ORDER_FEED_URL', feed.url)
+        return feed
+    
+    yield start
+    for feed in feeds:
+        feed.stop()
+
+
+class _Recorder:
+    """on_order_update callback that records updates and the thread they ran on."""
+    
+    def __init__(self, until_order_id):
+        self.updates = []
+        self.threads = set()
+        self.done = threading.Event()
+        self._until = until_order_id
+    
+    def __call__(self, message):
+        self.updates.append((message['orderId'], message['orderStatus']))
+        self.threads.add(threading.current_thread().name)
+        if message['orderId'] == self._until:
+            self.done.set()
+
+
+@pytest.mark.unit
+class TestLiveOrderUpdateManager:
+    """Test LiveOrderUpdateManager against a local WebSocket feed."""
+    
+    def test_updates_dispatched_in_order(self, order_feed):
+        """Test relevant updates reach the callback once, in order, off the socket thread."""
+        feed = order_feed([
+            _frame('A', 'PENDING'),
+            'not json',
+            _frame('A', 'TRADED'),
+            _frame('A', 'PENDING'),
+            _frame('A', 'UNKNOWN'),
+            _frame('END', 'OPEN'),
+        ])
+        recorder = _Recorder(until_order_id='END')
+        manager = LiveOrderUpdateManager('1000000001', 'token', recorder)
+        
+        manager.start()
+        assert manager.is_connected
+        assert recorder.done.wait(5)
+        manager.disconnect()
+        
+        assert recorder.updates == [('A', 'PENDING'), ('A', 'TRADED'), ('END', 'OPEN')]
+        assert all(name.startswith('order-update_') for name in recorder.threads)
+        # The malformed frame did not cost the connection
+        assert len(feed.logins) == 1
+        assert feed.logins[0]['LoginReq'] == {'MsgCode': 42, 'ClientId': '1000000001', 'Token': 'token'}
+        assert not manager.is_connected
+    
+    def test_reconnect_replays_missed_orders_once(self, order_feed):
+        """Test a dropped connection reconnects, replays missed orders and skips repeats."""
+        feed = order_feed(
+            [_frame('A', 'PENDING')],
+            [_frame('B', 'OPEN'), _frame('END', 'OPEN')],
+        )
+        dhan_client = Mock()
+        dhan_client.get_order_list.return_value = [
+            {'orderId': 'A', 'orderStatus': 'PENDING'},
+            {'orderId': 'B', 'status': 'OPEN'},
+        ]
+        recorder = _Recorder(until_order_id='END')
+        manager = LiveOrderUpdateManager('1000000001', 'token', recorder, dhan_client=dhan_client)
+        manager._reconnect_delay = 0.01
+        
+        manager.start()
+        assert recorder.done.wait(5)
+        manager.disconnect()
+        
+        assert len(feed.logins) == 2
+        assert recorder.updates == [('A', 'PENDING'), ('B', 'OPEN'), ('END', 'OPEN')]
+        assert manager._reconnect_attempts == 0
+    
+    def test_reconnect_attempts_exhausted(self, monkeypatch):
+        """Test backoff grows with jitter and stops the manager once attempts run out."""
+        monkeypatch.setattr(live_order_update.random, 'uniform', lambda low, high: high)
+        manager = LiveOrderUpdateManager('1000000001', 'token', Mock())
+        manager.is_running = True
+        manager._max_reconnect_attempts = 3
+        
+        delays = [manager._next_reconnect_delay() for _ in range(3)]
+        
+        assert delays == [1.5, 3.0, 6.0]
+        assert manager._next_reconnect_delay() is None
+        assert manager.is_running is False
+    
+    def test_seen_updates_are_bounded(self, monkeypatch):
+        """Test the repeat filter forgets the oldest update once it is full."""
+        monkeypatch.setattr(live_order_update, '_SEEN_CACHE_SIZE', 2)
+        on_order_update = Mock()
+        manager = LiveOrderUpdateManager('1000000001', 'token', on_order_update)
+        
+        for order_id in ('A', 'B', 'C', 'A', 'C'):
+            manager._handle_order_update({'orderId': order_id, 'orderStatus': 'OPEN'})
+        
+        delivered = [c.args[0]['orderId'] for c in on_order_update.call_args_list]
+        assert delivered == ['A', 'B', 'C', 'A']
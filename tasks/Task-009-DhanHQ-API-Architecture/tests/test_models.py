@@ -2,6 +2,7 @@
 Unit tests for data models.
 """
 
+import json
 import pytest
 from dataclasses import asdict
 from core.models import (
@@ -12,7 +13,8 @@ from core.models import (
     Funds,
     Instrument,
     CopyMapping,
-    BracketOrderLeg
+    BracketOrderLeg,
+    LeaderOrder
 )
 
 
@@ -242,3 +244,51 @@ class TestInstrument:
         assert instrument.option_type == "CE"
         assert instrument.expiry_date == "2023-10-26"
 
+
+
+@pytest.mark.unit
+class TestTradeArrays:
+    """Test struct-of-arrays conversion for trades."""
+    
+    def test_trade_numpy_round_trip(self):
+        """Test to_numpy/from_numpy preserve trade values."""
+        np = pytest.importorskip("numpy")
+        trades = [
+            Trade(id="T1", order_id="O1", account_type="leader", quantity=50, price=101.5, trade_ts=1),
+            Trade(id="T2", order_id="O2", account_type="follower", quantity=25, price=99.0, trade_ts=2)
+        ]
+        
+        arrays = Trade.to_numpy(trades)
+        
+        assert arrays['quantity'].dtype == np.int64
+        assert float((arrays['quantity'] * arrays['price']).sum()) == 50 * 101.5 + 25 * 99.0
+        assert Trade.from_numpy(**arrays) == trades
+
+
+@pytest.mark.unit
+class TestTradeJson:
+    """Test direct JSON serialization."""
+    
+    def test_trade_to_json_matches_to_dict(self):
+        """Test to_json encodes the same values as to_dict."""
+        trade = Trade(id="T1", order_id="O1", account_type="leader", quantity=50, price=101.5, trade_ts=1)
+        
+        assert json.loads(trade.to_json()) == trade.to_dict()
+
+
+@pytest.mark.unit
+class TestLeaderOrder:
+    """Test LeaderOrder parsing."""
+    
+    def test_from_dict(self, sample_co_order_data):
+        """Test camelCase payload fields map to attributes with defaults."""
+        order = LeaderOrder.from_dict(sample_co_order_data)
+        
+        assert order.order_id == sample_co_order_data['orderId']
+        assert order.security_id == sample_co_order_data['securityId']
+        assert order.quantity == sample_co_order_data['quantity']
+        assert order.validity == sample_co_order_data.get('validity', 'DAY')
+        assert order.co_stop_loss_value == sample_co_order_data['stopLossValue']
+        
+        with pytest.raises(AttributeError):
+            order.quantity = 1
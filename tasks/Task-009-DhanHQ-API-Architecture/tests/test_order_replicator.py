@@ -0,0 +1,93 @@
+"""
+Unit tests for order replicator module.
+"""
+
+import pytest
+import threading
+from unittest.mock import MagicMock, Mock
+from core.database import DatabaseManager
+from core.order_replicator import OrderReplicator
+
+
+@pytest.mark.unit
+class TestOrderReplicator:
+    """Test OrderReplicator against a real database and mocked APIs."""
+    
+    @pytest.fixture
+    def replicator(self, temp_db, mock_env, reset_singletons):
+        """Create a replicator whose sizer approves every order at 50 units."""
+        db = DatabaseManager(temp_db)
+        db.connect()
+        db.initialize_schema()
+        
+        position_sizer = MagicMock()
+        position_sizer.calculate_quantity.return_value = 50
+        position_sizer.validate_sufficient_margin.return_value = (True, "")
+        position_sizer.get_capital_ratio.return_value = 0.5
+        position_sizer.estimate_margin.return_value = 2500.0
+        
+        orders_api = Mock()
+        orders_api.place_order.return_value = {'orderId': 'F1'}
+        
+        replicator = OrderReplicator(orders_api, Mock(), position_sizer, db)
+        yield replicator
+        db.close()
+    
+    def test_replicate_order_without_stored_leader_order(self, replicator, sample_order_data):
+        """Test the claim stores the leader order itself and the mapping is saved."""
+        assert replicator.replicate_order(sample_order_data) == 'F1'
+        
+        replicator.db.flush_copy_mappings()
+        mapping = replicator.db.get_copy_mapping_by_leader('12345678')
+        assert mapping.status == 'placed'
+        assert mapping.follower_order_id == 'F1'
+        stored = replicator.db.conn.execute(
+            "SELECT id, account_type FROM orders ORDER BY account_type"
+        ).fetchall()
+        assert [tuple(row) for row in stored] == [('F1', 'follower'), ('12345678', 'leader')]
+    
+    def test_repeat_status_updates_replicate_once(self, replicator, sample_order_data):
+        """Test TRANSIT, PENDING and OPEN updates for one order place it once."""
+        for status in ('TRANSIT', 'PENDING', 'OPEN'):
+            replicator.replicate_order(dict(sample_order_data, orderStatus=status))
+        
+        assert replicator.orders_api.place_order.call_count == 1
+    
+    def test_replicate_orders_places_lanes_concurrently(self, replicator, sample_order_data):
+        """Test a burst is placed one lane per security, concurrently and in leader order."""
+        # Both lane heads must be inside place_order at once, or the barrier times out
+        lane_heads = threading.Barrier(2, timeout=5)
+        placed = []
+        
+        def place_order(**kwargs):
+            correlation_id = kwargs['correlation_id']
+            if correlation_id in ('LR-L1', 'LR-L2'):
+                lane_heads.wait()
+            placed.append((kwargs['security_id'], correlation_id))
+            return {'orderId': f"F-{correlation_id[3:]}"}
+        
+        replicator.orders_api.place_order.side_effect = place_order
+        burst = [
+            dict(sample_order_data, orderId='L1', securityId='11536'),
+            dict(sample_order_data, orderId='L2', securityId='1333'),
+            dict(sample_order_data, orderId='L3', securityId='11536'),
+        ]
+        
+        assert replicator.replicate_orders(burst) == ['F-L1', 'F-L2', 'F-L3']
+        same_security = [cid for security_id, cid in placed if security_id == '11536']
+        assert same_security == ['LR-L1', 'LR-L3']
+        replicator.position_sizer.confirm_margin.assert_called_with(2500.0)
+        assert replicator.position_sizer.confirm_margin.call_count == 3
+    
+    def test_failed_placement_releases_margin(self, replicator, sample_order_data):
+        """Test a rejected placement frees its reservation and records a failed mapping."""
+        replicator.orders_api.place_order.return_value = None
+        
+        assert replicator.replicate_orders([sample_order_data]) == [None]
+        
+        replicator.position_sizer.release_margin.assert_called_once_with(2500.0)
+        replicator.position_sizer.confirm_margin.assert_not_called()
+        replicator.db.flush_copy_mappings()
+        mapping = replicator.db.get_copy_mapping_by_leader('12345678')
+        assert mapping.status == 'failed'
+        assert mapping.error_message == 'Failed to place follower order'
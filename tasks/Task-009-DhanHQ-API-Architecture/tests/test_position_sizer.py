@@ -135,6 +135,61 @@ class TestPositionSizer:
         assert "Insufficient margin" in error_msg
 
 
+@pytest.mark.unit
+class TestMarginLedger:
+    """Test local margin reservations between funds refreshes."""
+    
+    def test_reservations_reduce_available_margin(self):
+        """Test a reservation is counted against later checks until released."""
+        leader_api, follower_api, db = Mock(), Mock(), Mock()
+        leader_api.get_fund_limits.return_value = {'availableBalance': 200000.0}
+        follower_api.get_fund_limits.return_value = {'availableBalance': 100000.0}
+        sizer = PositionSizer(leader_api, follower_api, db, SizingStrategy.CAPITAL_PROPORTIONAL)
+        
+        assert sizer.validate_sufficient_margin(600, "11536", 100.0, reserve=True)[0]
+        assert not sizer.validate_sufficient_margin(600, "11536", 100.0, reserve=True)[0]
+        
+        sizer.release_margin(sizer.estimate_margin(600, 100.0))
+        assert sizer.validate_sufficient_margin(600, "11536", 100.0)[0]
+        assert follower_api.get_fund_limits.call_count == 1
+    
+    def test_refresh_keeps_unplaced_reservations(self):
+        """Test a refresh settles placed orders only, and only those placed before it."""
+        leader_api, follower_api, db = Mock(), Mock(), Mock()
+        leader_api.get_fund_limits.return_value = {'availableBalance': 200000.0}
+        follower_api.get_fund_limits.return_value = {'availableBalance': 100000.0}
+        sizer = PositionSizer(leader_api, follower_api, db, SizingStrategy.CAPITAL_PROPORTIONAL)
+        margin = sizer.estimate_margin(400, 100.0)
+        
+        assert sizer.validate_sufficient_margin(400, "11536", 100.0, reserve=True)[0]
+        assert sizer.validate_sufficient_margin(400, "11536", 100.0, reserve=True)[0]
+        sizer.confirm_margin(margin)
+        
+        # The broker balance now reflects the placed order; the other is still unplaced
+        follower_api.get_fund_limits.return_value = {'availableBalance': 100000.0 - margin}
+        sizer._refresh_funds(force=True)
+        assert sizer._reserved_margin == margin
+        assert sizer._placed_margin == 0.0
+        assert not sizer.validate_sufficient_margin(400, "11536", 100.0)[0]
+        
+        sizer.release_margin(margin)
+        assert sizer._reserved_margin == 0.0
+    
+    def test_use_snapshot_pins_funds(self):
+        """Test calls inside use_snapshot() reuse the snapshot even once it is stale."""
+        leader_api, follower_api, db = Mock(), Mock(), Mock()
+        leader_api.get_fund_limits.return_value = {'availableBalance': 200000.0}
+        follower_api.get_fund_limits.return_value = {'availableBalance': 100000.0}
+        sizer = PositionSizer(leader_api, follower_api, db, SizingStrategy.CAPITAL_PROPORTIONAL)
+        
+        with sizer.use_snapshot():
+            sizer._funds_last_updated = 0
+            assert sizer.get_capital_ratio() == 0.5
+            assert sizer._refresh_thread is None
+        
+        assert follower_api.get_fund_limits.call_count == 1
+
+
 @pytest.mark.unit
 class TestInitializePositionSizer:
     """Test initialize_position_sizer function."""